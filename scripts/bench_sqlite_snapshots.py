@@ -0,0 +1,73 @@
+"""Benchmark SQLiteAdapter snapshot modes: whole-file copy vs page snapshots.
+
+Each step mimics one exploration step: roll back to a checkpoint, change a
+few rows, take a new checkpoint. Reports the mean per-step cost and the
+memory held by page snapshots.
+
+Usage:
+    python scripts/bench_sqlite_snapshots.py [size_mb ...] [--steps N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from venomqa.v1.adapters.sqlite import SQLiteAdapter
+
+ROW_BYTES = 1000
+
+
+def _build_database(path: str, size_mb: int) -> None:
+    adapter = SQLiteAdapter(path)
+    conn = adapter.connection
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, payload BLOB)")
+    rows = size_mb * 1024 * 1024 // ROW_BYTES
+    payload = os.urandom(ROW_BYTES)
+    conn.executemany(
+        "INSERT INTO items (payload) VALUES (?)", ((payload,) for _ in range(rows))
+    )
+    conn.commit()
+    adapter.close()
+    adapter.cleanup()
+
+
+def _run(path: str, mode: str, steps: int) -> tuple[float, int]:
+    adapter = SQLiteAdapter(path, snapshot_mode=mode)
+    conn = adapter.connection
+    root = adapter.checkpoint("root")
+    started = time.perf_counter()
+    for step in range(steps):
+        adapter.rollback(root)
+        conn = adapter.connection
+        conn.execute("UPDATE items SET payload = zeroblob(?) WHERE id = ?", (ROW_BYTES, step + 1))
+        conn.execute("INSERT INTO items (payload) VALUES (zeroblob(?))", (ROW_BYTES,))
+        conn.commit()
+        adapter.checkpoint(f"step{step}")
+    per_step_ms = (time.perf_counter() - started) / steps * 1000
+    held = adapter.snapshot_bytes
+    adapter.close()
+    adapter.cleanup()
+    return per_step_ms, held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[1, 50, 500])
+    parser.add_argument("--steps", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>7} {'file ms/step':>13} {'pages ms/step':>14} {'page bytes held':>16}")
+    for size_mb in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.db")
+            _build_database(path, size_mb)
+            file_ms, _ = _run(path, "file", args.steps)
+            pages_ms, held = _run(path, "pages", args.steps)
+        print(f"{size_mb:>5}MB {file_ms:>13.1f} {pages_ms:>14.1f} {held:>16,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark memory retained per recorded transition.
+
+Builds transitions the way an HTTP run does: results come from HttpClient
+(through an in-process httpx transport), are wrapped in a Transition and
+kept, as the exploration graph keeps them. Reports retained bytes per
+transition for the default and lean modes.
+
+Usage:
+    python scripts/bench_transition_memory.py [--transitions N] [--body-items N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+import httpx
+
+from venomqa.v1.adapters.http import HttpClient
+from venomqa.v1.core.transition import Transition
+
+
+def _client(body_items: int) -> HttpClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {"items": [{"id": i, "name": f"item-{i}"} for i in range(body_items)]}
+        return httpx.Response(
+            201,
+            json=body,
+            headers={"x-request-id": "fixed", "cache-control": "no-store", "server": "bench"},
+        )
+
+    client = HttpClient(
+        "http://bench.local",
+        headers={"authorization": "Bearer token", "accept": "application/json"},
+    )
+    client._client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler),
+        headers=client.default_headers,
+    )
+    return client
+
+
+def _measure(count: int, body_items: int, lean: bool) -> float:
+    client = _client(body_items)
+    payload = {"name": "widget", "tags": ["a", "b", "c"], "price": 9.99}
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    for i in range(count):
+        result = client.post(f"/items/{i % 50}", json=dict(payload))
+        if lean:
+            result = result.lean()
+        kept.append(Transition.create(f"s_{i % 500:016x}", "create_item", "s_0", result))
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    client.close()
+    return retained / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transitions", type=int, default=5000)
+    parser.add_argument("--body-items", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'bytes/transition':>17}")
+    for lean in (False, True):
+        per = _measure(args.transitions, args.body_items, lean)
+        print(f"{'lean' if lean else 'default':>8} {per:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
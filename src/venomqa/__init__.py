@@ -127,7 +127,9 @@ from venomqa.runtime import HealthStatus, Orchestrator, Service, ServiceType
 # World (sandbox with checkpoint/rollback) - canonical location is venomqa.sandbox
 from venomqa.sandbox import (
     Checkpoint,
+    CheckpointManager,
     Context,
+    Normalizer,
     Observation,
     Rollbackable,
     State,
@@ -143,7 +145,7 @@ from venomqa.v1.adapters.resource_graph import (
 from venomqa.v1.adapters.sqlite import SQLiteAdapter
 
 # Agent (exploration engine)
-from venomqa.v1.agent import Agent, Scheduler
+from venomqa.v1.agent import Agent, ParallelAgent, Scheduler, ShardedAgent
 from venomqa.v1.agent.dimension_strategy import DimensionNoveltyStrategy
 
 # Auth helpers
@@ -402,9 +404,13 @@ __all__ = [
     "World",
     "Rollbackable",
     "Checkpoint",
+    "CheckpointManager",
     "SystemCheckpoint",
+    "Normalizer",
     # Agent
     "Agent",
+    "ParallelAgent",
+    "ShardedAgent",
     "ExplorationStrategy",
     "Strategy",
     "BFS",
@@ -5,6 +5,7 @@ This module provides adapters for external systems.
 Main adapters (recommended):
     - HttpClient: HTTP client for API testing
     - PostgresAdapter: PostgreSQL with savepoint/rollback
+    - PostgresSnapshotAdapter: PostgreSQL with arbitrary rollback (BFS-safe)
     - SQLiteAdapter: SQLite with checkpoint/rollback
     - MySQLAdapter: MySQL adapter
     - RedisAdapter: Redis cache adapter
@@ -49,6 +50,7 @@ from venomqa.v1.adapters.mock_storage import MockStorage, StoredFile
 from venomqa.v1.adapters.mock_time import MockTime
 from venomqa.v1.adapters.mysql import MySQLAdapter
 from venomqa.v1.adapters.postgres import PostgresAdapter
+from venomqa.v1.adapters.postgres_snapshot import PostgresSnapshotAdapter
 from venomqa.v1.adapters.redis import RedisAdapter
 from venomqa.v1.adapters.sqlite import SQLiteAdapter
 from venomqa.v1.adapters.wiremock import WireMockAdapter as V1WireMockAdapter
@@ -173,6 +175,7 @@ __all__ = [
     # Main adapters (recommended)
     "HttpClient",
     "PostgresAdapter",
+    "PostgresSnapshotAdapter",
     "MySQLAdapter",
     "SQLiteAdapter",
     "RedisAdapter",
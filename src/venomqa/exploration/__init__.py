@@ -11,14 +11,24 @@ Core abstractions:
 - Agent: Orchestrates the exploration loop
 - ExplorationStrategy: Protocol for search algorithms
 - Frontier: Manages unexplored (state, action) pairs
+- RollbackScheduler: Reorders picks to avoid rollbacks
 - Graph: Records visited states and transitions
 - Transition: A single state change
 - ExplorationResult: Output of an exploration run
+- ExplorationJournal: On-disk record of a run, for resuming it
+- EventLog: Streaming compressed JSONL log of states, transitions and violations
+- SleepSets, Footprint: Partial-order reduction over declared action footprints
+- PreconditionIndex: Incremental valid-action lookup from precondition markers
 """
 
+from venomqa.exploration.events import EventLog
 from venomqa.exploration.frontier import Frontier, QueueFrontier, StackFrontier
 from venomqa.exploration.graph import Graph
+from venomqa.exploration.journal import ExplorationJournal
+from venomqa.exploration.preconditions import PreconditionIndex
+from venomqa.exploration.reduction import Footprint, SleepSets
 from venomqa.exploration.result import ExplorationResult
+from venomqa.exploration.scheduler import RollbackScheduler
 from venomqa.exploration.strategies import (
     BFS,
     DFS,
@@ -37,6 +47,8 @@ __all__ = [
     "Graph",
     "Transition",
     "ExplorationResult",
+    "ExplorationJournal",
+    "EventLog",
     # Strategy protocol and implementations
     "ExplorationStrategy",
     "Strategy",  # Backward compat alias
@@ -47,6 +59,13 @@ __all__ = [
     "Random",
     "CoverageGuided",
     "Weighted",
+    # Rollback-aware pick scheduling
+    "RollbackScheduler",
+    # Partial-order reduction
+    "Footprint",
+    "SleepSets",
+    # Precondition markers
+    "PreconditionIndex",
     # Frontier abstraction
     "Frontier",
     "QueueFrontier",
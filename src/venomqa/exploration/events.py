@@ -0,0 +1,222 @@
+"""Event log - Streams exploration events to a compressed JSONL file.
+
+Each line is one JSON event: ``{"type": "state" | "transition" |
+"violation", ...}``. Lines are written in blocks, and each block is a
+separate gzip member. The file is therefore an ordinary ``.jsonl.gz`` that
+``gzip`` / ``zcat`` read from start to end. It can also be read at random
+access: one block is decompressed to reload a single transition.
+
+With an event log, the Agent keeps only compact transitions in memory: the
+method and URL of the request, the status code, success, error and
+duration. Request and response headers and bodies live only in the log, and
+``EventLog.load_result()`` reloads them.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from venomqa.exploration.transition import Transition
+    from venomqa.sandbox import State
+    from venomqa.v1.core.action import ActionResult
+    from venomqa.v1.core.invariant import Violation
+
+
+def _encode(event: dict[str, Any]) -> bytes:
+    return json.dumps(event, default=str, separators=(",", ":")).encode() + b"\n"
+
+
+def result_to_dict(result: ActionResult) -> dict[str, Any]:
+    """JSON-ready form of an ActionResult, including headers and bodies."""
+    response = result.response
+    return {
+        "success": result.success,
+        "error": result.error,
+        "duration_ms": result.duration_ms,
+        "timestamp": result.timestamp.isoformat(),
+        "request": {
+            "method": result.request.method,
+            "url": result.request.url,
+            "headers": result.request.headers,
+            "body": result.request.body,
+        },
+        "response": None if response is None else {
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "body": response.body,
+        },
+    }
+
+
+def result_from_dict(data: dict[str, Any]) -> ActionResult:
+    """Rebuild an ActionResult written by result_to_dict()."""
+    from venomqa.v1.core.action import ActionResult, HTTPRequest, HTTPResponse
+
+    response = data["response"]
+    return ActionResult(
+        success=data["success"],
+        request=HTTPRequest(**data["request"]),
+        response=HTTPResponse(**response) if response is not None else None,
+        error=data["error"],
+        duration_ms=data["duration_ms"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+def compact_result(result: ActionResult) -> ActionResult:
+    """Copy of an ActionResult without headers and bodies."""
+    from venomqa.v1.core.action import HTTPRequest, HTTPResponse
+
+    response = result.response
+    return dataclasses.replace(
+        result,
+        request=HTTPRequest(method=result.request.method, url=result.request.url),
+        response=HTTPResponse(status_code=response.status_code) if response is not None else None,
+    )
+
+
+class EventLog:
+    """Block-compressed JSONL sink for states, transitions and violations.
+
+    Example::
+
+        agent = Agent(world, actions, event_log="run.jsonl.gz")
+        result = agent.explore()
+        full = result.event_log.load_result(result.graph.transitions[0].id)
+
+        for event in EventLog.read("run.jsonl.gz"):
+            ...
+
+    Args:
+        path: File to write (truncated if it exists).
+        block_events: Events per gzip member. Larger blocks compress
+            better; smaller blocks make load_result() cheaper.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], block_events: int = 256) -> None:
+        if block_events < 1:
+            raise ValueError(f"block_events must be >= 1, got {block_events}")
+        self.path = os.fspath(path)
+        self.block_events = block_events
+        self._file: Any = open(self.path, "wb")  # noqa: SIM115 - closed in close()
+        self._pending: list[bytes] = []
+        self._blocks: list[tuple[int, int]] = []  # (file offset, compressed length)
+        self._offset = 0
+        # transition_id -> block number (len(_blocks) means still pending)
+        self._transition_blocks: dict[str, int] = {}
+        self._cached_block: tuple[int, dict[str, dict[str, Any]]] | None = None
+        self.events_written = 0
+        self.bytes_written = 0
+
+    # -- Writing --
+
+    def write_state(self, state: State) -> None:
+        """Record a newly discovered state with its observations."""
+        self._append({
+            "type": "state",
+            "id": state.id,
+            "created_at": state.created_at.isoformat(),
+            "observations": {
+                name: {"data": obs.data, "metadata": obs.metadata}
+                for name, obs in state.observations.items()
+            },
+        })
+
+    def write_transition(self, transition: Transition) -> Transition:
+        """Record a transition in full and return its compact in-memory form."""
+        self._transition_blocks[transition.id] = len(self._blocks)
+        self._append({
+            "type": "transition",
+            "id": transition.id,
+            "from": transition.from_state_id,
+            "to": transition.to_state_id,
+            "action": transition.action_name,
+            "timestamp": transition.timestamp.isoformat(),
+            "duration_ms": transition.duration_ms,
+            "result": result_to_dict(transition.result),
+        })
+        return dataclasses.replace(transition, result=compact_result(transition.result))
+
+    def write_violation(self, violation: Violation) -> None:
+        """Record a violation; the fields match JSONReporter's violation entries."""
+        self._append({
+            "type": "violation",
+            "id": violation.id,
+            "invariant": violation.invariant_name,
+            "message": violation.message,
+            "severity": violation.severity.value,
+            "state_id": violation.state.id,
+            "action": violation.action.name if violation.action else None,
+            "reproduction_path": [t.action_name for t in violation.reproduction_path],
+            "transition_ids": [t.id for t in violation.reproduction_path],
+            "timestamp": violation.timestamp.isoformat(),
+        })
+
+    def _append(self, event: dict[str, Any]) -> None:
+        if self._file is None:
+            raise ValueError(f"Event log {self.path} is closed")
+        self._pending.append(_encode(event))
+        self.events_written += 1
+        if len(self._pending) >= self.block_events:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending events as one gzip member."""
+        if not self._pending or self._file is None:
+            return
+        raw = b"".join(self._pending)
+        block = gzip.compress(raw, compresslevel=6)
+        self._file.write(block)
+        self._file.flush()
+        self._blocks.append((self._offset, len(block)))
+        self._offset += len(block)
+        self.bytes_written += len(block)
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush and close the file. load_result() keeps working afterwards."""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    # -- Reading --
+
+    def load_result(self, transition_id: str) -> ActionResult | None:
+        """Full ActionResult of a transition written to this log, or None."""
+        block = self._transition_blocks.get(transition_id)
+        if block is None:
+            return None
+        if block == len(self._blocks):
+            self.flush()
+        if self._cached_block is None or self._cached_block[0] != block:
+            offset, length = self._blocks[block]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                lines = gzip.decompress(f.read(length)).splitlines()
+            events = (json.loads(line) for line in lines)
+            self._cached_block = (
+                block,
+                {e["id"]: e["result"] for e in events if e["type"] == "transition"},
+            )
+        return result_from_dict(self._cached_block[1][transition_id])
+
+    @staticmethod
+    def read(path: str | os.PathLike[str], types: set[str] | None = None) -> Iterator[dict[str, Any]]:
+        """Iterate over the events in a log file, optionally only some types."""
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                event = json.loads(line)
+                if types is None or event["type"] in types:
+                    yield event
+
+
+__all__ = ["EventLog", "compact_result", "result_from_dict", "result_to_dict"]
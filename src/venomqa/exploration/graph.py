@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import random
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from venomqa.exploration.preconditions import PreconditionIndex
 from venomqa.exploration.transition import Transition
 from venomqa.sandbox import Context, State
 
@@ -13,6 +16,63 @@ if TYPE_CHECKING:
     from venomqa.v1.core.action import Action
 
 
+_default_rng = random.Random()
+
+
+class _PairIndex:
+    """Insertion-ordered set of (state_id, action_name) pairs.
+
+    Supports O(1) add, discard, membership, uniform random choice and
+    amortized O(1) access to the oldest pair. Random choice uses a dense
+    list with swap-remove; ordering uses a deque whose stale (already
+    removed) entries are dropped lazily from the front.
+    """
+
+    __slots__ = ("_items", "_pos", "_order")
+
+    def __init__(self) -> None:
+        self._items: list[tuple[str, str]] = []
+        self._pos: dict[tuple[str, str], int] = {}
+        self._order: deque[tuple[str, str]] = deque()
+
+    def add(self, pair: tuple[str, str]) -> None:
+        if pair in self._pos:
+            return
+        self._pos[pair] = len(self._items)
+        self._items.append(pair)
+        self._order.append(pair)
+
+    def discard(self, pair: tuple[str, str]) -> None:
+        idx = self._pos.pop(pair, None)
+        if idx is None:
+            return
+        last = self._items.pop()
+        if idx < len(self._items):
+            self._items[idx] = last
+            self._pos[last] = idx
+
+    def first(self) -> tuple[str, str] | None:
+        order = self._order
+        while order and order[0] not in self._pos:
+            order.popleft()
+        return order[0] if order else None
+
+    def choice(self, rng: random.Random) -> tuple[str, str] | None:
+        if not self._items:
+            return None
+        return self._items[rng.randrange(len(self._items))]
+
+    def __contains__(self, pair: object) -> bool:
+        return pair in self._pos
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        pos = self._pos
+        return (pair for pair in list(self._order) if pair in pos)
+
+
 class Graph:
     """Holds all states and transitions during exploration.
 
@@ -26,6 +86,12 @@ class Graph:
     identical observations have the same ID and are stored once.
     This prevents exponential state explosion.
 
+    Unexplored (state, action) pairs are kept in a live index that is
+    updated as states, transitions and explored marks are recorded, so
+    strategies can sample or take the oldest pair without rescanning
+    every state x action combination. New states are expanded into the
+    index lazily, on the first query after they were added.
+
     Example::
 
         graph = Graph(actions=[login, create_order, cancel_order])
@@ -50,12 +116,31 @@ class Graph:
             actions: List of available actions for this exploration.
         """
         self._states: dict[str, State] = {}
+        self._state_log: list[str] = []  # state IDs in insertion order
         self._transitions: list[Transition] = []
         self._actions: dict[str, Action] = {a.name: a for a in (actions or [])}
+        self._preconditions = PreconditionIndex(self._actions.values())
         self._explored: set[tuple[str, str]] = set()  # (state_id, action_name)
+        self._explored_log: list[tuple[str, str]] = []  # _explored in marking order
+        # Unexplored pairs pruned by partial-order reduction (see sleep())
+        self._sleeping: set[tuple[str, str]] = set()
         self._transition_keys: set[tuple[str, str, str]] = set()  # (from_id, action, to_id)
         self._initial_state_id: str | None = None
         self._action_call_counts: dict[str, int] = {}  # action_name -> call count
+        self._used_actions: set[str] = set()  # actions with at least one transition
+
+        # Live index of unexplored pairs (see _sync_unexplored)
+        self._unexplored = _PairIndex()
+        self._unexplored_by_action: dict[str, _PairIndex] = {}
+        self._pending_states: list[str] = []  # added but not yet expanded into the index
+        self._pair_seq: dict[tuple[str, str], int] = {}  # pair -> discovery position
+        self._next_seq = 0
+
+        # Outgoing adjacency and BFS shortest-path tree rooted at the initial
+        # state, both maintained incrementally by add_transition.
+        self._outgoing: dict[str, list[Transition]] = {}
+        self._parent: dict[str, Transition] = {}  # state_id -> tree edge into it
+        self._depth: dict[str, int] = {}  # state_id -> hops from initial state
 
     @property
     def states(self) -> dict[str, State]:
@@ -91,6 +176,8 @@ class Graph:
         """
         if self._initial_state_id is None:
             self._initial_state_id = state.id
+            self._depth[state.id] = 0
+            self._relax_from(state.id)
 
         if state.id in self._states:
             existing = self._states[state.id]
@@ -103,6 +190,8 @@ class Graph:
             return existing
 
         self._states[state.id] = state
+        self._state_log.append(state.id)
+        self._pending_states.append(state.id)
         return state
 
     def add_transition(self, transition: Transition) -> bool:
@@ -120,17 +209,48 @@ class Graph:
 
         self._transition_keys.add(key)
         self._transitions.append(transition)
-        self._explored.add((transition.from_state_id, transition.action_name))
+        self._outgoing.setdefault(transition.from_state_id, []).append(transition)
+        self._mark_explored_pair(transition.from_state_id, transition.action_name)
+
+        # Extend the shortest-path tree if this edge shortens a path
+        from_depth = self._depth.get(transition.from_state_id)
+        if from_depth is not None:
+            to_depth = self._depth.get(transition.to_state_id)
+            if to_depth is None or to_depth > from_depth + 1:
+                self._parent[transition.to_state_id] = transition
+                self._depth[transition.to_state_id] = from_depth + 1
+                self._relax_from(transition.to_state_id)
 
         # Track action call count (for max_calls limiting)
         action_name = transition.action_name
-        self._action_call_counts[action_name] = self._action_call_counts.get(action_name, 0) + 1
+        count = self._action_call_counts.get(action_name, 0) + 1
+        self._action_call_counts[action_name] = count
+        self._used_actions.add(action_name)
+
+        action = self._actions.get(action_name)
+        if action is not None and action.max_calls is not None and count >= action.max_calls:
+            self._drop_action_from_index(action_name)
 
         return True
 
     def add_action(self, action: Action) -> None:
         """Register an action."""
         self._actions[action.name] = action
+        self._preconditions.add(action)
+        # Existing states must be re-expanded for the new action.
+        self._sync_unexplored()
+        for state in self._states.values():
+            self._index_pair(state, action)
+
+    def set_checkpoint(self, state_id: str, checkpoint_id: str) -> State:
+        """Point a known state at a new checkpoint (e.g. after its old one was evicted).
+
+        Returns:
+            The updated state.
+        """
+        from dataclasses import replace
+        updated = self._states[state_id] = replace(self._states[state_id], checkpoint_id=checkpoint_id)
+        return updated
 
     def get_state(self, state_id: str) -> State | None:
         """Get a state by ID."""
@@ -141,8 +261,50 @@ class Graph:
         return self._actions.get(action_name)
 
     def is_explored(self, state_id: str, action_name: str) -> bool:
-        """Check if a (state, action) pair has been explored."""
-        return (state_id, action_name) in self._explored
+        """Check if a (state, action) pair has been explored (or is asleep)."""
+        pair = (state_id, action_name)
+        return pair in self._explored or pair in self._sleeping
+
+    def sleep(self, state_id: str, action_name: str) -> bool:
+        """Prune an unexplored pair as redundant (partial-order reduction).
+
+        A sleeping pair counts as explored for strategies and leaves the
+        unexplored index, but not the explored set, so it is not counted
+        as coverage. wake() puts it back.
+
+        Returns:
+            True if the pair was put to sleep, False if it was already
+            explored or asleep.
+        """
+        pair = (state_id, action_name)
+        if pair in self._explored or pair in self._sleeping:
+            return False
+        self._sleeping.add(pair)
+        if pair in self._unexplored:
+            self._unexplored.discard(pair)
+            self._unexplored_by_action[action_name].discard(pair)
+            self._pair_seq.pop(pair, None)
+        return True
+
+    def wake(self, state_id: str, action_name: str) -> bool:
+        """Return a sleeping pair to the unexplored index.
+
+        Returns:
+            True if the pair was asleep.
+        """
+        pair = (state_id, action_name)
+        if pair not in self._sleeping:
+            return False
+        self._sleeping.discard(pair)
+        state, action = self._states.get(state_id), self._actions.get(action_name)
+        if state is not None and action is not None and state_id not in self._pending_states:
+            self._index_pair(state, action)
+        return True
+
+    @property
+    def sleeping_count(self) -> int:
+        """Number of unexplored pairs currently pruned by partial-order reduction."""
+        return len(self._sleeping)
 
     def mark_explored(self, state_id: str, action_name: str) -> None:
         """Mark a (state, action) pair as explored without adding a transition.
@@ -150,7 +312,7 @@ class Graph:
         Used by the parallel exploration engine to reserve a pair before
         submitting it to a worker thread, preventing duplicate work.
         """
-        self._explored.add((state_id, action_name))
+        self._mark_explored_pair(state_id, action_name)
 
     def mark_noop(self, state_id: str, action_name: str) -> None:
         """Mark a (state, action) pair as a no-op loop.
@@ -159,7 +321,7 @@ class Graph:
         times without changing the state. Future strategy picks will skip this
         pair since it's already marked as explored.
         """
-        self._explored.add((state_id, action_name))
+        self._mark_explored_pair(state_id, action_name)
 
     def get_valid_actions(
         self,
@@ -174,6 +336,9 @@ class Graph:
         are evaluated against the set of already-fired action names.
 
         Actions with max_calls set are excluded once they've reached their limit.
+        Context and prior-action markers are answered from a PreconditionIndex
+        updated from what changed since the last call; only unmarked
+        preconditions are called.
 
         Args:
             state: The current state.
@@ -183,40 +348,184 @@ class Graph:
         Returns:
             List of actions that can be executed from this state.
         """
-        result = []
-        for a in self._actions.values():
-            # Check max_calls limit
-            if a.max_calls is not None:
-                call_count = self._action_call_counts.get(a.name, 0)
-                if call_count >= a.max_calls:
-                    continue
-
-            # Check preconditions
-            if context is not None:
-                if a.can_execute_with_context(state, context, executed_actions):
-                    result.append(a)
-            elif a.can_execute(state):
-                result.append(a)
-
-        return result
+        if context is not None:
+            self._preconditions.sync(context, executed_actions)
+        counts = self._action_call_counts
+        # Skip actions that reached their max_calls limit
+        candidates = [
+            a for a in self._actions.values()
+            if a.max_calls is None or counts.get(a.name, 0) < a.max_calls
+        ]
+        return self._preconditions.filter(candidates, state, context)
+
+    def can_execute(self, state: State, action: Action) -> bool:
+        """Action.can_execute(state), calling only the preconditions that are not markers."""
+        return self._preconditions.allows(action, state)
 
     def get_action_call_count(self, action_name: str) -> int:
         """Get how many times an action has been called."""
         return self._action_call_counts.get(action_name, 0)
 
+    @property
+    def action_call_counts(self) -> Mapping[str, int]:
+        """Read-only live view of per-action call counts (one per unique transition)."""
+        return MappingProxyType(self._action_call_counts)
+
     def get_unexplored(self) -> list[tuple[State, Action]]:
-        """Get all unexplored (state, action) pairs."""
-        result = []
-        for state in self._states.values():
-            for action in self.get_valid_actions(state):
-                if not self.is_explored(state.id, action.name):
-                    result.append((state, action))
-        return result
+        """Get all unexplored (state, action) pairs.
+
+        Pairs are returned in discovery order. Prefer first_unexplored(),
+        sample_unexplored() or unexplored_count() in hot paths; this method
+        materializes the whole list.
+        """
+        return list(self.iter_unexplored())
+
+    def iter_unexplored(self) -> Iterator[tuple[State, Action]]:
+        """Iterate over unexplored (state, action) pairs in discovery order."""
+        self._sync_unexplored()
+        for state_id, action_name in self._unexplored:
+            yield (self._states[state_id], self._actions[action_name])
+
+    def has_unexplored(self) -> bool:
+        """Check whether any unexplored (state, action) pair remains."""
+        self._sync_unexplored()
+        return len(self._unexplored) > 0
+
+    def unexplored_count(self, action_name: str | None = None) -> int:
+        """Number of unexplored pairs, optionally restricted to one action."""
+        self._sync_unexplored()
+        if action_name is None:
+            return len(self._unexplored)
+        bucket = self._unexplored_by_action.get(action_name)
+        return len(bucket) if bucket is not None else 0
+
+    def unexplored_action_names(self) -> list[str]:
+        """Names of actions that still have at least one unexplored pair."""
+        self._sync_unexplored()
+        return [name for name, bucket in self._unexplored_by_action.items() if bucket]
+
+    def has_unexplored_from(self, state_id: str) -> bool:
+        """Check whether any action is still unexplored from a given state."""
+        self._sync_unexplored()
+        return any((state_id, name) in self._unexplored for name in self._actions)
+
+    def is_unexplored(self, state_id: str, action_name: str) -> bool:
+        """Check if a (state, action) pair is currently in the unexplored index."""
+        self._sync_unexplored()
+        return (state_id, action_name) in self._unexplored
+
+    def first_unexplored(
+        self, action_name: str | None = None
+    ) -> tuple[State, Action] | None:
+        """Get the oldest unexplored pair in O(1) (amortized).
+
+        Args:
+            action_name: If given, only consider pairs for this action.
+
+        Returns:
+            The (state, action) pair discovered first, or None if none remain.
+        """
+        self._sync_unexplored()
+        index = self._index_for(action_name)
+        pair = index.first() if index is not None else None
+        return self._resolve_pair(pair)
+
+    def sample_unexplored(
+        self,
+        rng: random.Random | None = None,
+        action_name: str | None = None,
+    ) -> tuple[State, Action] | None:
+        """Pick a uniformly random unexplored pair in O(1).
+
+        Args:
+            rng: Random source (defaults to a shared module-level generator).
+            action_name: If given, only consider pairs for this action.
+
+        Returns:
+            A random (state, action) pair, or None if none remain.
+        """
+        self._sync_unexplored()
+        index = self._index_for(action_name)
+        pair = index.choice(rng or _default_rng) if index is not None else None
+        return self._resolve_pair(pair)
+
+    def unexplored_order(self, action_name: str | None = None) -> int | None:
+        """Discovery position of the oldest unexplored pair (lower = older).
+
+        Lets strategies break ties between per-action buckets the same way
+        get_unexplored() ordering would, without materializing the list.
+        """
+        self._sync_unexplored()
+        index = self._index_for(action_name)
+        pair = index.first() if index is not None else None
+        if pair is None:
+            return None
+        return self._pair_seq[pair]
+
+    # -- Unexplored index maintenance --
+
+    def _index_for(self, action_name: str | None) -> _PairIndex | None:
+        if action_name is None:
+            return self._unexplored
+        return self._unexplored_by_action.get(action_name)
+
+    def _resolve_pair(self, pair: tuple[str, str] | None) -> tuple[State, Action] | None:
+        if pair is None:
+            return None
+        return (self._states[pair[0]], self._actions[pair[1]])
+
+    def _sync_unexplored(self) -> None:
+        """Expand newly added states into the unexplored index."""
+        if not self._pending_states:
+            return
+        pending, self._pending_states = self._pending_states, []
+        for state_id in pending:
+            state = self._states[state_id]
+            for action in self._actions.values():
+                self._index_pair(state, action)
+
+    def _index_pair(self, state: State, action: Action) -> None:
+        pair = (state.id, action.name)
+        if pair in self._explored or pair in self._unexplored or pair in self._sleeping:
+            return
+        if action.max_calls is not None:
+            if self._action_call_counts.get(action.name, 0) >= action.max_calls:
+                return
+        if not self._preconditions.allows(action, state):
+            return
+        self._pair_seq[pair] = self._next_seq
+        self._next_seq += 1
+        self._unexplored.add(pair)
+        bucket = self._unexplored_by_action.get(action.name)
+        if bucket is None:
+            bucket = self._unexplored_by_action[action.name] = _PairIndex()
+        bucket.add(pair)
+
+    def _mark_explored_pair(self, state_id: str, action_name: str) -> None:
+        pair = (state_id, action_name)
+        if pair not in self._explored:
+            self._explored.add(pair)
+            self._explored_log.append(pair)
+            self._sleeping.discard(pair)
+        if pair in self._unexplored:
+            self._unexplored.discard(pair)
+            self._unexplored_by_action[action_name].discard(pair)
+            self._pair_seq.pop(pair, None)
+
+    def _drop_action_from_index(self, action_name: str) -> None:
+        """Remove every pending pair of an action that hit its max_calls limit."""
+        bucket = self._unexplored_by_action.pop(action_name, None)
+        if bucket is None:
+            return
+        for pair in list(bucket):
+            self._unexplored.discard(pair)
+            self._pair_seq.pop(pair, None)
 
     def get_path_to(self, state_id: str) -> list[Transition]:
         """Get the path from initial state to the given state.
 
-        Uses BFS to find the shortest path.
+        Walks the incrementally maintained BFS parent tree, so the result is
+        a shortest path and costs O(path length).
 
         Args:
             state_id: Target state ID.
@@ -230,26 +539,42 @@ class Graph:
         if state_id == self._initial_state_id:
             return []
 
-        # BFS to find shortest path
-        visited = {self._initial_state_id}
-        queue: deque[tuple[str, list[Transition]]] = deque([(self._initial_state_id, [])])
-
-        # Build adjacency from transitions
-        outgoing: dict[str, list[Transition]] = {}
-        for t in self._transitions:
-            outgoing.setdefault(t.from_state_id, []).append(t)
-
+        path: list[Transition] = []
+        current = state_id
+        parent = self._parent.get(current)
+        if parent is None:
+            return []
+        while parent is not None:
+            path.append(parent)
+            current = parent.from_state_id
+            parent = self._parent.get(current)
+        path.reverse()
+        return path
+
+    def get_depth(self, state_id: str) -> int | None:
+        """Shortest distance (in transitions) from the initial state, or None if unreachable."""
+        return self._depth.get(state_id)
+
+    def get_outgoing(self, state_id: str) -> list[Transition]:
+        """Transitions leaving a state, in the order they were recorded."""
+        return self._outgoing.get(state_id, [])
+
+    def _relax_from(self, state_id: str) -> None:
+        """Propagate a shortened distance through the tree (incremental BFS).
+
+        Edges are only ever added, so distances only decrease; each state is
+        re-queued only when its depth actually improves.
+        """
+        queue: deque[str] = deque([state_id])
         while queue:
-            current_id, path = queue.popleft()
-            if current_id == state_id:
-                return path
-
-            for t in outgoing.get(current_id, []):
-                if t.to_state_id not in visited:
-                    visited.add(t.to_state_id)
-                    queue.append((t.to_state_id, path + [t]))
-
-        return []
+            current = queue.popleft()
+            next_depth = self._depth[current] + 1
+            for t in self._outgoing.get(current, ()):
+                depth = self._depth.get(t.to_state_id)
+                if depth is None or depth > next_depth:
+                    self._depth[t.to_state_id] = next_depth
+                    self._parent[t.to_state_id] = t
+                    queue.append(t.to_state_id)
 
     def iter_states(self) -> Iterator[State]:
         """Iterate over all states."""
@@ -276,26 +601,44 @@ class Graph:
 
     @property
     def used_action_names(self) -> set[str]:
-        """Set of action names that have been executed at least once."""
-        return {t.action_name for t in self._transitions}
+        """Set of action names that have been executed at least once.
+
+        This is the graph's live set, updated by add_transition; treat it as
+        read-only and copy it if you need a snapshot.
+        """
+        return self._used_actions
 
     @property
     def used_action_count(self) -> int:
         """Number of unique actions that have been executed."""
-        return len(self.used_action_names)
+        return len(self._used_actions)
 
     @property
     def unused_action_names(self) -> list[str]:
         """List of action names that have never been executed."""
-        all_names = set(self._actions.keys())
-        used = self.used_action_names
-        return sorted(all_names - used)
+        return sorted(name for name in self._actions if name not in self._used_actions)
 
     @property
     def explored_count(self) -> int:
         """Number of explored (state, action) pairs."""
         return len(self._explored)
 
+    @property
+    def state_ids(self) -> list[str]:
+        """State IDs in the order they were added.
+
+        The graph's live list; treat it as read-only.
+        """
+        return self._state_log
+
+    @property
+    def explored_pairs(self) -> list[tuple[str, str]]:
+        """Explored (state_id, action_name) pairs in the order they were marked.
+
+        The graph's live list; treat it as read-only.
+        """
+        return self._explored_log
+
     @property
     def unique_transition_count(self) -> int:
         """Number of unique transitions (deduplicated)."""
@@ -0,0 +1,298 @@
+"""Journal - Append-only on-disk record of an exploration, for resuming it.
+
+The journal is a SQLite file. Every flush appends the states, transitions,
+explored (state, action) pairs and violations recorded since the previous
+flush, in one transaction, so a run killed mid-way loses at most the steps
+since its last flush. The strategy frontier is small and order-sensitive;
+it is rewritten as a whole on each flush.
+
+Action call counts are not stored separately: the graph derives them from
+the transitions as they are re-added.
+
+State bodies (observations) and action results are pickled. Checkpoints are
+not persisted; a resumed run checkpoints the initial state again and
+replays to every other state the first time it needs it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import pickle
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from venomqa.exploration.transition import Transition
+from venomqa.sandbox.state import STATE_ID_VERSION, State
+
+if TYPE_CHECKING:
+    from venomqa.exploration.graph import Graph
+    from venomqa.v1.core.action import ActionResult
+    from venomqa.v1.core.invariant import Violation
+
+JOURNAL_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS states (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    observations BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transitions (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    from_state_id TEXT NOT NULL,
+    action_name TEXT NOT NULL,
+    to_state_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    duration_ms REAL,
+    result BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS explored (
+    seq INTEGER PRIMARY KEY,
+    state_id TEXT NOT NULL,
+    action_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS violations (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    invariant_name TEXT NOT NULL,
+    state_id TEXT NOT NULL,
+    message TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    action_name TEXT,
+    path TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    details BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    seq INTEGER PRIMARY KEY,
+    state_id TEXT NOT NULL,
+    action_name TEXT NOT NULL
+);
+"""
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _dump_result(result: ActionResult) -> bytes:
+    """Pickle an ActionResult, replacing bodies that cannot be pickled by their repr."""
+    try:
+        return _dumps(result)
+    except Exception:
+        request = dataclasses.replace(result.request, body=repr(result.request.body))
+        response = result.response
+        if response is not None:
+            response = dataclasses.replace(response, body=repr(response.body))
+        return _dumps(dataclasses.replace(result, request=request, response=response))
+
+
+class ExplorationJournal:
+    """Append-only SQLite journal of a Graph, its strategy frontier and violations.
+
+    Example::
+
+        journal = ExplorationJournal("run.venomqa")
+        journal.record(agent.graph, agent.strategy, agent.violations)
+        ...
+        journal = ExplorationJournal("run.venomqa")
+        violations = journal.restore(graph, strategy)
+
+    Agent drives this through ``Agent(journal=path)`` and ``Agent.resume(path)``.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        # ParallelAgent flushes from whichever worker thread holds its lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._check_version()
+        # Rows already in the file; record() appends everything past these
+        self._written = {
+            table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("states", "transitions", "explored", "violations")
+        }
+
+    def _check_version(self) -> None:
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        expected = {"journal_version": str(JOURNAL_VERSION), "state_id_version": str(STATE_ID_VERSION)}
+        if not meta:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)", expected.items()
+                )
+            return
+        for key, value in expected.items():
+            if meta.get(key) != value:
+                raise ValueError(
+                    f"Journal {self.path} has {key}={meta.get(key)}, expected {value}; "
+                    "it was written by an incompatible VenomQA version."
+                )
+
+    @property
+    def is_empty(self) -> bool:
+        """True if no state has been recorded yet."""
+        return self._written["states"] == 0
+
+    # -- Writing --
+
+    def record(
+        self,
+        graph: Graph,
+        strategy: Any = None,
+        violations: list[Violation] | None = None,
+    ) -> None:
+        """Append everything recorded since the last flush, in one transaction."""
+        written = self._written
+        states = [graph.states[state_id] for state_id in graph.state_ids[written["states"]:]]
+        transitions = graph.transitions[written["transitions"]:]
+        explored = graph.explored_pairs[written["explored"]:]
+        new_violations = (violations or [])[written["violations"]:]
+        frontier_pairs = getattr(strategy, "frontier_pairs", None)
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO states (id, created_at, observations) VALUES (?, ?, ?)",
+                [(s.id, s.created_at.isoformat(), _dumps(s.observations)) for s in states],
+            )
+            self._conn.executemany(
+                "INSERT INTO transitions (id, from_state_id, action_name, to_state_id,"
+                " timestamp, duration_ms, result) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        t.id, t.from_state_id, t.action_name, t.to_state_id,
+                        t.timestamp.isoformat(), t.duration_ms, _dump_result(t.result),
+                    )
+                    for t in transitions
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO explored (state_id, action_name) VALUES (?, ?)", explored
+            )
+            self._conn.executemany(
+                "INSERT INTO violations (id, invariant_name, state_id, message, severity,"
+                " action_name, path, timestamp, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._violation_row(v) for v in new_violations],
+            )
+            if frontier_pairs is not None:
+                self._conn.execute("DELETE FROM frontier")
+                self._conn.executemany(
+                    "INSERT INTO frontier (state_id, action_name) VALUES (?, ?)",
+                    frontier_pairs(),
+                )
+
+        written["states"] += len(states)
+        written["transitions"] += len(transitions)
+        written["explored"] += len(explored)
+        written["violations"] += len(new_violations)
+
+    @staticmethod
+    def _violation_row(v: Violation) -> tuple[Any, ...]:
+        try:
+            details = _dumps((v.action_result, v.bug))
+        except Exception:
+            details = _dumps((None, v.bug))
+        return (
+            v.id,
+            v.invariant_name,
+            v.state.id,
+            v.message,
+            v.severity.value,
+            v.action.name if v.action is not None else None,
+            "\n".join(t.id for t in v.reproduction_path),
+            v.timestamp.isoformat(),
+            details,
+        )
+
+    # -- Reading --
+
+    def restore(self, graph: Graph, strategy: Any = None) -> list[Violation]:
+        """Rebuild a graph (and the strategy's frontier) from the journal.
+
+        The graph must be empty and hold the same actions as the recorded
+        run. Restored states carry no checkpoint.
+
+        Returns:
+            The recorded violations, in the order they were found.
+        """
+        from venomqa.v1.core.invariant import Severity, Violation
+
+        if graph.state_count:
+            raise ValueError("Can only restore a journal into an empty Graph")
+
+        # Explored marks first, so the graph's explored order matches the
+        # journal and re-added transitions do not log them again.
+        for state_id, action_name in self._conn.execute(
+            "SELECT state_id, action_name FROM explored ORDER BY seq"
+        ):
+            graph.mark_explored(state_id, action_name)
+
+        for state_id, created_at, observations in self._conn.execute(
+            "SELECT id, created_at, observations FROM states ORDER BY seq"
+        ):
+            graph.add_state(State(
+                id=state_id,
+                observations=pickle.loads(observations),
+                created_at=datetime.fromisoformat(created_at),
+            ))
+
+        by_id: dict[str, Transition] = {}
+        for row in self._conn.execute(
+            "SELECT id, from_state_id, action_name, to_state_id, timestamp, duration_ms,"
+            " result FROM transitions ORDER BY seq"
+        ):
+            transition = Transition(
+                id=row[0],
+                from_state_id=row[1],
+                action_name=row[2],
+                to_state_id=row[3],
+                timestamp=datetime.fromisoformat(row[4]),
+                duration_ms=row[5],
+                result=pickle.loads(row[6]),
+            )
+            graph.add_transition(transition)
+            by_id[transition.id] = transition
+
+        restore_frontier = getattr(strategy, "restore_frontier", None)
+        if restore_frontier is not None:
+            restore_frontier(
+                self._conn.execute("SELECT state_id, action_name FROM frontier ORDER BY seq")
+            )
+
+        violations: list[Violation] = []
+        for row in self._conn.execute(
+            "SELECT id, invariant_name, state_id, message, severity, action_name, path,"
+            " timestamp, details FROM violations ORDER BY seq"
+        ):
+            state = graph.get_state(row[2])
+            if state is None:
+                continue
+            action_result, bug = pickle.loads(row[8])
+            violations.append(Violation(
+                id=row[0],
+                invariant_name=row[1],
+                state=state,
+                message=row[3],
+                severity=Severity(row[4]),
+                action=graph.get_action(row[5]) if row[5] else None,
+                action_result=action_result,
+                reproduction_path=[by_id[t] for t in row[6].split("\n") if t in by_id],
+                timestamp=datetime.fromisoformat(row[7]),
+                bug=bug,
+            ))
+        return violations
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+__all__ = ["ExplorationJournal"]
@@ -0,0 +1,218 @@
+"""Precondition index - Valid actions without calling every precondition.
+
+Most preconditions are markers: ``precondition_has_context("user_id")``
+attaches ``_required_context_keys`` and ``precondition_action_ran("login")``
+attaches ``_required_actions``. Their callables always return True, and the
+real check is a set lookup. PreconditionIndex inverts them:
+
+- context key -> actions that require it
+- prior action -> actions gated on it
+
+It also counts each action's unmet requirements. A call to sync() diffs the
+indexed context keys and the executed action names against the previous
+call, and only updates the counts of the actions behind a changed key. An
+action is then valid when its count is zero and its remaining, unmarked
+preconditions (state callables, ``lambda ctx: ...``) pass. Only those
+unmarked preconditions are ever called.
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from venomqa.sandbox import Context, State
+    from venomqa.v1.core.action import Action
+
+
+class _Cursor:
+    """Requirements met for one Context, as of its last sync()."""
+
+    __slots__ = ("owner", "present", "ran", "missing")
+
+    def __init__(self, owner: weakref.ref[Context], missing: dict[str, int]) -> None:
+        self.owner = owner  # the Context this cursor tracks
+        self.present: set[str] = set()  # indexed keys with a non-None value
+        self.ran: set[str] = set()  # indexed prior actions that have run
+        self.missing = missing  # action -> unmet requirements (> 0 only)
+
+
+class PreconditionIndex:
+    """Inverted index from precondition markers to the actions they gate.
+
+    Example::
+
+        index = PreconditionIndex(actions)
+        index.sync(context, executed_actions)
+        valid = index.filter(actions, state, context)
+
+    Each Context gets its own cursor, so ParallelAgent workers can share one
+    index as long as every worker syncs its own context. A cursor is dropped
+    when its Context is garbage collected.
+    """
+
+    def __init__(self, actions: Iterable[Action] = ()) -> None:
+        self._actions: dict[str, Action] = {}
+        self._by_context_key: dict[str, set[str]] = {}
+        self._by_prior_action: dict[str, set[str]] = {}
+        self._requirements: dict[str, int] = {}  # action -> marker requirements
+        self._checks: dict[str, tuple[Callable[..., Any], ...]] = {}  # unmarked preconditions
+        self._cursors: dict[int, _Cursor] = {}  # id(context) -> cursor
+        for action in actions:
+            self.add(action)
+
+    def add(self, action: Action) -> None:
+        """Index an action's preconditions, replacing any action of the same name."""
+        self.discard(action.name)
+        name = action.name
+        keys: set[str] = set()
+        prior: set[str] = set()
+        checks = []
+        for p in action.preconditions:
+            required_keys = getattr(p, "_required_context_keys", None)
+            required_actions = getattr(p, "_required_actions", None)
+            if required_keys is not None:
+                keys.update(required_keys)
+            elif required_actions is not None:
+                prior.update(required_actions)
+            else:
+                checks.append(p)
+        for key in keys:
+            self._by_context_key.setdefault(key, set()).add(name)
+        for prior_name in prior:
+            self._by_prior_action.setdefault(prior_name, set()).add(name)
+        self._actions[name] = action
+        if keys or prior:
+            self._requirements[name] = len(keys) + len(prior)
+        if checks:
+            self._checks[name] = tuple(checks)
+        # Keys new to the index count as absent until the next sync()
+        for cursor in self._cursors.values():
+            unmet = len(keys - cursor.present) + len(prior - cursor.ran)
+            if unmet:
+                cursor.missing[name] = unmet
+
+    def discard(self, name: str) -> None:
+        """Drop an action from the index."""
+        if self._actions.pop(name, None) is None:
+            return
+        for index in (self._by_context_key, self._by_prior_action):
+            for key in [k for k, names in index.items() if name in names]:
+                index[key].discard(name)
+                if not index[key]:
+                    del index[key]
+        self._requirements.pop(name, None)
+        self._checks.pop(name, None)
+        for cursor in self._cursors.values():
+            cursor.missing.pop(name, None)
+
+    def sync(self, context: Context, executed_actions: Iterable[str] | None = None) -> None:
+        """Bring the unmet-requirement counts for this context up to date.
+
+        Costs one lookup per indexed context key and prior action, plus one
+        count update per action gated on something that changed.
+        """
+        cursor = self._cursor(context)
+        if cursor is None:
+            cursor = self._track(context)
+        missing = cursor.missing
+
+        values = context.view()
+        for key, names in self._by_context_key.items():
+            now = values.get(key) is not None
+            if now != (key in cursor.present):
+                if now:
+                    cursor.present.add(key)
+                else:
+                    cursor.present.discard(key)
+                _shift(missing, names, -1 if now else 1)
+
+        ran = executed_actions if isinstance(executed_actions, (set, frozenset)) else set(executed_actions or ())
+        for prior_name, names in self._by_prior_action.items():
+            now = prior_name in ran
+            if now != (prior_name in cursor.ran):
+                if now:
+                    cursor.ran.add(prior_name)
+                else:
+                    cursor.ran.discard(prior_name)
+                _shift(missing, names, -1 if now else 1)
+
+    def allows(self, action: Action, state: State, context: Context | None = None) -> bool:
+        """Whether an action's preconditions hold.
+
+        With a context, marker requirements are read from the counts of the
+        last sync() for that context. Without one, markers pass (as in
+        Action.can_execute) and only unmarked preconditions are called.
+        """
+        return bool(self.filter([action], state, context))
+
+    def filter(
+        self, actions: Iterable[Action], state: State, context: Context | None = None
+    ) -> list[Action]:
+        """The actions whose preconditions hold, in order (see allows())."""
+        missing: dict[str, int] = {}
+        if context is not None:
+            cursor = self._cursor(context)
+            if cursor is None:
+                cursor = self._track(context)
+                self.sync(context)
+            missing = cursor.missing
+        indexed = self._actions
+        checks = self._checks
+        result = []
+        for action in actions:
+            name = action.name
+            if indexed.get(name) is not action:
+                self.add(action)
+            if name in missing:
+                continue
+            if name not in checks or self._passes(checks[name], state, context):
+                result.append(action)
+        return result
+
+    def _cursor(self, context: Context) -> _Cursor | None:
+        cursor = self._cursors.get(id(context))
+        # An id is only reused once its Context is gone; check it is still ours
+        if cursor is None or cursor.owner() is not context:
+            return None
+        return cursor
+
+    def _track(self, context: Context) -> _Cursor:
+        """Start a cursor for a context, forgotten when the context is collected."""
+        key = id(context)
+        cursors = self._cursors
+
+        def forget(ref: weakref.ref[Context]) -> None:
+            cursor = cursors.get(key)
+            if cursor is not None and cursor.owner is ref:
+                del cursors[key]
+
+        cursor = cursors[key] = _Cursor(weakref.ref(context, forget), dict(self._requirements))
+        return cursor
+
+    @staticmethod
+    def _passes(
+        checks: tuple[Callable[..., Any], ...], state: State, context: Context | None
+    ) -> bool:
+        for p in checks:
+            context_fn = getattr(p, "_context_precondition", None)
+            if context_fn is not None:
+                if context is not None and not context_fn(context):
+                    return False
+            elif not p(state):
+                return False
+        return True
+
+
+def _shift(missing: dict[str, int], names: Iterable[str], delta: int) -> None:
+    for name in names:
+        count = missing.get(name, 0) + delta
+        if count:
+            missing[name] = count
+        else:
+            missing.pop(name, None)
+
+
+__all__ = ["PreconditionIndex"]
@@ -0,0 +1,158 @@
+"""Partial-order reduction - Skips interleavings of independent actions.
+
+Two actions are independent when neither writes a resource the other reads
+or writes, as declared by their footprints (``Action(reads=..., writes=...)``).
+From any state, running independent actions in either order reaches the
+same state, so exploring both orders is redundant work.
+
+SleepSets implements Godefroid's sleep-set method with state caching. Every
+state carries a sleep set of actions that need not be explored from it:
+
+- after taking ``a`` from ``s`` to ``s'``, an action ``b`` goes to sleep in
+  ``s'`` if ``b`` is independent of ``a`` and either ``b`` was already taken
+  from ``s`` (``s·b·a`` covers ``s·a·b``) or ``b`` was asleep in ``s``
+- a state reached again keeps only the actions asleep on every arrival; the
+  actions that lost their justification wake up and are explored
+
+This prunes redundant (state, action) pairs and still reaches every state.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from venomqa.exploration.graph import Graph
+    from venomqa.v1.core.action import Action
+
+
+@dataclass(frozen=True, slots=True)
+class Footprint:
+    """Resources an action may read and write. None means "any resource"."""
+
+    reads: frozenset[str] | None
+    writes: frozenset[str] | None
+
+    @classmethod
+    def of(cls, action: Action) -> Footprint:
+        """Footprint of an action, derived from what it declares.
+
+        - ``writes``: as declared; empty for a read_only action; otherwise unknown.
+        - ``reads``: as declared, plus ``requires``. An action that declares
+          nothing to read but whose writes are known reads its writes and
+          ``requires``. Otherwise it may read anything.
+        """
+        requires = frozenset(getattr(action, "requires", None) or ())
+        if action.writes is not None:
+            writes: frozenset[str] | None = frozenset(action.writes)
+        elif action.read_only:
+            writes = frozenset()
+        else:
+            writes = None
+
+        if action.reads is not None:
+            reads: frozenset[str] | None = frozenset(action.reads) | requires
+        elif writes is not None and (writes or requires):
+            reads = writes | requires
+        else:
+            reads = None
+        return cls(reads=reads, writes=writes)
+
+    def conflicts_with(self, other: Footprint) -> bool:
+        """True if either footprint writes something the other touches."""
+        return (
+            _overlap(self.writes, other.writes)
+            or _overlap(self.writes, other.reads)
+            or _overlap(other.writes, self.reads)
+        )
+
+
+def _overlap(a: frozenset[str] | None, b: frozenset[str] | None) -> bool:
+    if a is None:
+        return b is None or bool(b)
+    if b is None:
+        return bool(a)
+    return not a.isdisjoint(b)
+
+
+class SleepSets:
+    """Sleep sets per state, for the Agent's partial-order reduction mode.
+
+    Example::
+
+        sleep_sets = SleepSets(graph.actions.values())
+        sleep_sets.start(initial.id)
+        ...
+        graph.add_transition(transition)
+        woken = sleep_sets.after(graph, from_state.id, action.name, to_state.id, valid_names)
+
+    after() puts the pruned pairs to sleep in the graph (strategies then
+    skip them) and returns the action names that woke up in ``to_state``.
+    """
+
+    def __init__(self, actions: list[Action] | None = None) -> None:
+        self._footprints: dict[str, Footprint] = {
+            a.name: Footprint.of(a) for a in (actions or [])
+        }
+        self._sleep: dict[str, frozenset[str]] = {}
+        self._independent: dict[tuple[str, str], bool] = {}
+        self.wakeups = 0
+
+    def independent(self, a: str, b: str) -> bool:
+        """Whether two actions (by name) commute according to their footprints."""
+        if a == b:
+            return False
+        key = (a, b) if a < b else (b, a)
+        cached = self._independent.get(key)
+        if cached is None:
+            fa, fb = self._footprints.get(a), self._footprints.get(b)
+            cached = fa is not None and fb is not None and not fa.conflicts_with(fb)
+            self._independent[key] = cached
+        return cached
+
+    def add_action(self, action: Action) -> None:
+        self._footprints[action.name] = Footprint.of(action)
+        self._independent.clear()
+
+    def start(self, state_id: str) -> None:
+        """Register the initial state, which sleeps on nothing."""
+        self._sleep.setdefault(state_id, frozenset())
+
+    def asleep(self, state_id: str) -> frozenset[str]:
+        return self._sleep.get(state_id, frozenset())
+
+    def after(
+        self,
+        graph: Graph,
+        from_state_id: str,
+        action_name: str,
+        to_state_id: str,
+        valid: Collection[str] | None = None,
+    ) -> list[str]:
+        """Update ``to_state``'s sleep set after taking an action; return woken actions.
+
+        ``valid`` names the actions valid in ``to_state``. Only those go to
+        sleep: a pair that would never be explored is not pruned.
+        """
+        if from_state_id == to_state_id:
+            return []
+        done = {t.action_name for t in graph.get_outgoing(from_state_id)}
+        inherited = frozenset(
+            b for b in done | self.asleep(from_state_id)
+            if self.independent(b, action_name) and (valid is None or b in valid)
+        )
+        previous = self._sleep.get(to_state_id)
+        current = inherited if previous is None else previous & inherited
+        self._sleep[to_state_id] = current
+
+        for name in current:
+            graph.sleep(to_state_id, name)
+        woken = sorted(previous - current) if previous is not None else []
+        woken = [name for name in woken if graph.wake(to_state_id, name)]
+        self.wakeups += len(woken)
+        return woken
+
+
+__all__ = ["Footprint", "SleepSets"]
@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING
 from venomqa.exploration.graph import Graph
 
 if TYPE_CHECKING:
+    from venomqa.exploration.events import EventLog
+    from venomqa.exploration.transition import Transition
+    from venomqa.v1.core.action import ActionResult
     from venomqa.v1.core.coverage import DimensionCoverage
     from venomqa.v1.core.invariant import Severity, Violation
 
@@ -41,6 +44,25 @@ class ExplorationResult:
         duration_ms: Total exploration time in milliseconds.
         truncated_by_max_steps: True if exploration stopped due to step limit.
         dimension_coverage: Optional hypergraph coverage data.
+        rollback_stats: RollbackScheduler counters (rollbacks, rollbacks_avoided, ...).
+        invariant_stats: Invariant evaluation counters (checks, cache_hits,
+            cache_misses); cache counters cover pure invariants only.
+        invariant_latency: Per-invariant check latency (calls, mean_ms,
+            max_ms, total_ms), slowest mean first.
+        event_log: The EventLog the run streamed to, if any. Transitions in
+            the graph then hold compact results; see action_result().
+        shrink_stats: Cost of each violation shrink (Agent(shrink=True)), by
+            violation ID: candidates tested, actions replayed and
+            actions_saved compared to replaying every candidate from the
+            initial state.
+        fan_out_stats: Read-only fan-out counters (fan_outs, actions,
+            rollbacks_avoided); see Action(read_only=True).
+        por_stats: Partial-order reduction counters (pairs_pruned: unexplored
+            pairs skipped as redundant interleavings; wakeups), when run
+            with Agent(por=True).
+        canonical_collapse: Number of raw states merged into each canonical
+            state ID, for states that absorbed more than one; see
+            World(normalizers=..., canonicalize=True).
     """
 
     graph: Graph
@@ -50,6 +72,14 @@ class ExplorationResult:
     duration_ms: float = 0.0
     truncated_by_max_steps: bool = False
     dimension_coverage: DimensionCoverage | None = None
+    rollback_stats: dict[str, int] = field(default_factory=dict)
+    invariant_stats: dict[str, int] = field(default_factory=dict)
+    invariant_latency: dict[str, dict[str, float]] = field(default_factory=dict)
+    event_log: EventLog | None = None
+    shrink_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+    fan_out_stats: dict[str, int] = field(default_factory=dict)
+    por_stats: dict[str, int] = field(default_factory=dict)
+    canonical_collapse: dict[str, int] = field(default_factory=dict)
 
     @property
     def states_visited(self) -> int:
@@ -108,6 +138,13 @@ class ExplorationResult:
             return 1.0
         return self.states_visited / self.transitions_taken
 
+    @property
+    def invariant_cache_hit_rate(self) -> float:
+        """Share of pure invariant evaluations answered from the per-state cache."""
+        hits = self.invariant_stats.get("cache_hits", 0)
+        lookups = hits + self.invariant_stats.get("cache_misses", 0)
+        return hits / lookups if lookups else 0.0
+
     @property
     def unique_violations(self) -> list[Violation]:
         """Deduplicated violations - one per (invariant_name, action) pair.
@@ -159,6 +196,14 @@ class ExplorationResult:
         from venomqa.v1.core.invariant import Severity
         return [v for v in self.violations if v.severity == Severity.HIGH]
 
+    def action_result(self, transition: Transition) -> ActionResult:
+        """Full ActionResult of a transition, reloaded from the event log if there is one."""
+        if self.event_log is not None:
+            full = self.event_log.load_result(transition.id)
+            if full is not None:
+                return full
+        return transition.result
+
     def finish(self) -> None:
         """Mark exploration as finished and compute duration."""
         self.finished_at = datetime.now()
@@ -184,6 +229,18 @@ class ExplorationResult:
             "critical": len(self.critical_violations),
             "success": self.success,
             "duration_ms": round(self.duration_ms, 2),
+            "rollbacks_avoided": self.rollback_stats.get("rollbacks_avoided", 0),
+            "invariant_checks": self.invariant_stats.get("checks", 0),
+            "invariant_cache_hits": self.invariant_stats.get("cache_hits", 0),
+            "invariant_cache_hit_rate": round(self.invariant_cache_hit_rate, 4),
+            "read_only_fanned_out": self.fan_out_stats.get("actions", 0),
+            "pairs_pruned": self.por_stats.get("pairs_pruned", 0),
+            "raw_states_collapsed": sum(
+                count - 1 for count in self.canonical_collapse.values()
+            ),
+            "shrink_actions_saved": sum(
+                stats["actions_saved"] for stats in self.shrink_stats.values()
+            ),
         }
 
 
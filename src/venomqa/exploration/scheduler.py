@@ -0,0 +1,155 @@
+"""RollbackScheduler - Reorders strategy picks to avoid rollbacks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from venomqa.exploration.graph import Graph
+    from venomqa.exploration.strategies import ExplorationStrategy
+    from venomqa.sandbox import State
+    from venomqa.v1.core.action import Action
+
+
+class RollbackScheduler:
+    """Sits between ``Strategy.pick`` and the agent's rollback.
+
+    With real databases a rollback (plus the re-checkpoint after acting) is
+    the dominant per-step cost, yet strategies pick without knowing where
+    the world currently is. The scheduler keeps a small window of the
+    strategy's upcoming picks and, among them, runs the one that is
+    cheapest to reach from the current position:
+
+    0. the current state itself — no rollback at all;
+    1. a state on the current branch (every step since the last rollback
+       moved forward from it) — a LIFO rollback, which is cheap for
+       savepoint-based adapters;
+    2. anything else, in strategy order.
+
+    ``slack`` bounds how far the strategy's order may be bent: the window
+    holds at most ``slack + 1`` picks, so a pick is never delayed by more
+    than ``slack`` positions. ``slack=0`` keeps strategy order exactly and
+    only skips the rollback when the pick is the current state.
+
+    Lookahead needs strategies whose ``pick`` consumes a frontier (BFS, DFS,
+    Random). Strategies that re-propose the same pair until it is explored
+    (CoverageGuided, Weighted) are detected and simply run in order;
+    strategies with side effects in ``pick`` (MCTS) should use ``slack=0``.
+
+    The current position only counts when the world is *exactly* at the
+    state's checkpoint: after a rollback to it, or when an action just
+    discovered it. Landing on an already-known state may carry different
+    unobserved context, so the next step from it still rolls back.
+
+    Attributes:
+        rollbacks: Rollbacks performed.
+        rollbacks_avoided: Steps run from the current state without rollback.
+        branch_rollbacks: Rollbacks to a state on the current branch.
+        reordered: Picks run ahead of an earlier strategy pick.
+    """
+
+    def __init__(self, slack: int = 0) -> None:
+        if slack < 0:
+            raise ValueError(f"slack must be >= 0, got {slack}")
+        self.slack = slack
+        self._window: list[tuple[State, Action]] = []
+        self._branch: list[str] = []  # oldest first; current state last
+        self._on_branch: set[str] = set()
+        self._exact = False
+        self.rollbacks = 0
+        self.rollbacks_avoided = 0
+        self.branch_rollbacks = 0
+        self.reordered = 0
+
+    @property
+    def current_state_id(self) -> str | None:
+        """State the world is exactly at, if known."""
+        if self._exact and self._branch:
+            return self._branch[-1]
+        return None
+
+    def pick(
+        self, strategy: ExplorationStrategy, graph: Graph
+    ) -> tuple[State, Action] | None:
+        """Next pair to execute: the cheapest-to-reach pick in the window."""
+        self._fill(strategy, graph)
+        if not self._window:
+            return None
+        best = min(
+            range(len(self._window)),
+            key=lambda i: (self._distance(self._window[i][0].id), i),
+        )
+        if best > 0:
+            self.reordered += 1
+        return self._window.pop(best)
+
+    def needs_rollback(self, state_id: str) -> bool:
+        """Whether executing from ``state_id`` requires a rollback."""
+        if self.current_state_id == state_id:
+            self.rollbacks_avoided += 1
+            return False
+        return True
+
+    def rolled_back(self, state_id: str) -> None:
+        """Record a rollback to ``state_id``."""
+        self.rollbacks += 1
+        if state_id in self._on_branch:
+            self.branch_rollbacks += 1
+            while self._branch[-1] != state_id:
+                self._on_branch.discard(self._branch.pop())
+        else:
+            self._branch = [state_id]
+            self._on_branch = {state_id}
+        self._exact = True
+
+    def advanced(self, state_id: str, exact: bool) -> None:
+        """Record that an action moved the world to ``state_id``."""
+        if state_id not in self._on_branch:
+            self._branch.append(state_id)
+            self._on_branch.add(state_id)
+        else:
+            # Cycle back onto the branch: the savepoints after it are moot.
+            while self._branch[-1] != state_id:
+                self._on_branch.discard(self._branch.pop())
+        self._exact = exact
+
+    def invalidate(self) -> None:
+        """Forget the current position (the world was moved externally)."""
+        self._branch = []
+        self._on_branch = set()
+        self._exact = False
+
+    def stats(self) -> dict[str, int]:
+        """Counters for reporting."""
+        return {
+            "rollbacks": self.rollbacks,
+            "rollbacks_avoided": self.rollbacks_avoided,
+            "branch_rollbacks": self.branch_rollbacks,
+            "reordered": self.reordered,
+        }
+
+    def _distance(self, state_id: str) -> int:
+        if state_id == self.current_state_id:
+            return 0
+        if state_id in self._on_branch:
+            return 1
+        return 2
+
+    def _fill(self, strategy: ExplorationStrategy, graph: Graph) -> None:
+        self._window = [
+            (state, action) for state, action in self._window
+            if not graph.is_explored(state.id, action.name)
+        ]
+        while len(self._window) <= self.slack:
+            pick = strategy.pick(graph)
+            if pick is None:
+                return
+            if any(
+                pick[0].id == state.id and pick[1].name == action.name
+                for state, action in self._window
+            ):
+                return  # the strategy re-proposes pending pairs: no lookahead
+            self._window.append(pick)
+
+
+__all__ = ["RollbackScheduler"]
@@ -5,7 +5,8 @@ from __future__ import annotations
 import math
 import random
 from abc import ABC, abstractmethod
-from collections import Counter, deque
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -35,8 +36,7 @@ class ExplorationStrategy(Protocol):
         class MyStrategy:
             def pick(self, graph: Graph) -> tuple[State, Action] | None:
                 # Return the next pair to explore, or None if done
-                unexplored = graph.get_unexplored()
-                return unexplored[0] if unexplored else None
+                return graph.first_unexplored()
 
             def notify(self, state: State, actions: list[Action]) -> None:
                 # Called when a new state is discovered
@@ -130,15 +130,11 @@ class BFS(BaseStrategy):
 
             state = graph.get_state(state_id)
             action = graph.get_action(action_name)
-            if state and action and action.can_execute(state):
+            if state and action and graph.can_execute(state, action):
                 return (state, action)
 
-        # Frontier empty, look for any unexplored pairs
-        unexplored = graph.get_unexplored()
-        if unexplored:
-            return unexplored[0]
-
-        return None
+        # Frontier empty, fall back to the oldest unexplored pair
+        return graph.first_unexplored()
 
     def notify(self, state: State, actions: list[Action]) -> None:
         """Add new state's actions to the frontier."""
@@ -149,6 +145,17 @@ class BFS(BaseStrategy):
         """Backward compatibility alias for notify."""
         self.notify(state, actions)
 
+    def frontier_pairs(self) -> list[tuple[str, str]]:
+        """Pending (state_id, action_name) pairs, oldest first."""
+        return list(self._frontier._queue)
+
+    def restore_frontier(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Replace the frontier with pairs saved by frontier_pairs()."""
+        self._frontier = QueueFrontier()
+        for state_id, action_name in pairs:
+            self._frontier.add(state_id, action_name)
+        self._initialized = True
+
 
 class DFS(BaseStrategy):
     """Depth-first search strategy.
@@ -190,15 +197,11 @@ class DFS(BaseStrategy):
 
             state = graph.get_state(state_id)
             action = graph.get_action(action_name)
-            if state and action and action.can_execute(state):
+            if state and action and graph.can_execute(state, action):
                 return (state, action)
 
-        # Frontier empty, look for any unexplored pairs
-        unexplored = graph.get_unexplored()
-        if unexplored:
-            return unexplored[0]
-
-        return None
+        # Frontier empty, fall back to the oldest unexplored pair
+        return graph.first_unexplored()
 
     def notify(self, state: State, actions: list[Action]) -> None:
         """Add new state's actions to the frontier."""
@@ -210,6 +213,17 @@ class DFS(BaseStrategy):
         """Backward compatibility alias for notify."""
         self.notify(state, actions)
 
+    def frontier_pairs(self) -> list[tuple[str, str]]:
+        """Pending (state_id, action_name) pairs, bottom of the stack first."""
+        return list(self._frontier._stack)
+
+    def restore_frontier(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Replace the frontier with pairs saved by frontier_pairs()."""
+        self._frontier = StackFrontier()
+        for state_id, action_name in pairs:
+            self._frontier.add(state_id, action_name)
+        self._initialized = True
+
 
 class Random(BaseStrategy):
     """Random exploration strategy.
@@ -222,10 +236,7 @@ class Random(BaseStrategy):
         self._rng = random.Random(seed)
 
     def pick(self, graph: Graph) -> tuple[State, Action] | None:
-        unexplored = graph.get_unexplored()
-        if not unexplored:
-            return None
-        return self._rng.choice(unexplored)
+        return graph.sample_unexplored(self._rng)
 
 
 class CoverageGuided(BaseStrategy):
@@ -239,25 +250,20 @@ class CoverageGuided(BaseStrategy):
     differently depending on the state it's executed from.
     """
 
-    def __init__(self) -> None:
-        self._action_counts: Counter[str] = Counter()
-
     def pick(self, graph: Graph) -> tuple[State, Action] | None:
-        unexplored = graph.get_unexplored()
-        if not unexplored:
+        candidates = graph.unexplored_action_names()
+        if not candidates:
             return None
 
-        # Count how many times each action has been explored
-        self._action_counts.clear()
-        for transition in graph.iter_transitions():
-            self._action_counts[transition.action_name] += 1
-
-        # Sort unexplored pairs by action exploration count (ascending)
-        def score(pair: tuple[State, Action]) -> int:
-            return self._action_counts[pair[1].name]
-
-        unexplored.sort(key=score)
-        return unexplored[0]
+        # Least-explored action wins (counts are kept live by the graph);
+        # ties go to the action whose pending pair was discovered first
+        # (same order as get_unexplored()).
+        counts = graph.action_call_counts
+        best = min(
+            candidates,
+            key=lambda name: (counts.get(name, 0), graph.unexplored_order(name)),
+        )
+        return graph.first_unexplored(best)
 
 
 class Weighted(BaseStrategy):
@@ -286,29 +292,33 @@ class Weighted(BaseStrategy):
         self._weights[action_name] = weight
 
     def pick(self, graph: Graph) -> tuple[State, Action] | None:
-        unexplored = graph.get_unexplored()
-        if not unexplored:
+        candidates = graph.unexplored_action_names()
+        if not candidates:
             return None
 
-        # Calculate weights
+        # Every pending pair of an action carries that action's weight, so
+        # pick the action proportionally to weight * pending pairs, then a
+        # uniform pair within it. Costs O(actions) instead of O(pairs).
         weights = [
-            self._weights.get(pair[1].name, self._default_weight)
-            for pair in unexplored
+            self._weights.get(name, self._default_weight) * graph.unexplored_count(name)
+            for name in candidates
         ]
 
         # Weighted random selection
         total = sum(weights)
         if total == 0:
-            return self._rng.choice(unexplored)
+            return graph.sample_unexplored(self._rng)
 
         r = self._rng.random() * total
         cumulative = 0.0
-        for pair, weight in zip(unexplored, weights, strict=False):
+        chosen = candidates[-1]  # Fallback
+        for name, weight in zip(candidates, weights, strict=False):
             cumulative += weight
             if r <= cumulative:
-                return pair
+                chosen = name
+                break
 
-        return unexplored[-1]  # Fallback
+        return graph.sample_unexplored(self._rng, action_name=chosen)
 
 
 @dataclass
@@ -386,6 +396,7 @@ class MCTS(BaseStrategy):
         self._all_nodes: dict[tuple[str, str], _MCTSNode] = {}
         self._last_picked: _MCTSNode | None = None
         self._known_states: set[str] = set()
+        self._total_visits = 0  # Sum of visits over all nodes (UCB1 denominator)
         self._initialized = False
 
     def pick(self, graph: Graph) -> tuple[State, Action] | None:
@@ -406,20 +417,17 @@ class MCTS(BaseStrategy):
                     self._known_states.add(initial.id)
                     self._expand_node(graph, initial.id)
 
-        # Get all unexplored pairs first
-        unexplored = graph.get_unexplored()
-        if not unexplored:
+        if not graph.has_unexplored():
             return None
 
-        # Build a set for fast lookup
-        unexplored_set = {(s.id, a.name) for s, a in unexplored}
-
         # Selection: find best node via UCB1
-        best_node = self._select(graph, unexplored_set)
+        best_node = self._select(graph)
 
         if best_node is None:
             # Fallback to random unexplored
-            choice = self._rng.choice(unexplored)
+            choice = graph.sample_unexplored(self._rng)
+            if choice is None:
+                return None
             state, action = choice
             # Create node if needed
             key = (state.id, action.name)
@@ -439,9 +447,7 @@ class MCTS(BaseStrategy):
             return (state, action)
 
         # Shouldn't happen, but fall back
-        if unexplored:
-            return self._rng.choice(unexplored)
-        return None
+        return graph.sample_unexplored(self._rng)
 
     def notify(self, state: State, actions: list[Action]) -> None:
         """Notify MCTS of a new state, triggering backpropagation and expansion.
@@ -494,16 +500,11 @@ class MCTS(BaseStrategy):
                 self._all_nodes[key] = node
                 self._nodes.setdefault(state_id, []).append(node)
 
-    def _select(
-        self,
-        graph: Graph,
-        unexplored_set: set[tuple[str, str]],
-    ) -> _MCTSNode | None:
+    def _select(self, graph: Graph) -> _MCTSNode | None:
         """Select the best unexplored node using UCB1.
 
         Args:
             graph: The exploration graph.
-            unexplored_set: Set of (state_id, action_name) pairs not yet explored.
 
         Returns:
             The best node to explore, or None if no valid node found.
@@ -512,12 +513,10 @@ class MCTS(BaseStrategy):
         best_ucb: float = -float("inf")
 
         # Total visits across all nodes for UCB1 denominator
-        total_visits = sum(n.visits for n in self._all_nodes.values())
-        if total_visits == 0:
-            total_visits = 1
+        total_visits = self._total_visits or 1
 
         for key, node in self._all_nodes.items():
-            if key not in unexplored_set:
+            if not graph.is_unexplored(*key):
                 continue
 
             ucb = self._ucb1(node, total_visits)
@@ -561,6 +560,7 @@ class MCTS(BaseStrategy):
         while current is not None:
             current.visits += 1
             current.reward += reward
+            self._total_visits += 1
             current = current.parent
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
     from venomqa.v1.core.action import Action, ActionResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transition:
     """Records a state change: from_state -> action -> to_state.
 
@@ -65,7 +66,7 @@ class Transition:
         return cls(
             id=f"t_{uuid.uuid4().hex[:12]}",
             from_state_id=from_state_id,
-            action_name=action_name,
+            action_name=sys.intern(action_name),
             to_state_id=to_state_id,
             result=result,
             duration_ms=duration_ms,
@@ -12,10 +12,16 @@ Core abstractions:
 - Observation: Data observed from a single system
 - Rollbackable: Protocol for systems that support checkpoint/rollback
 - Checkpoint: A saved state that can be rolled back to
+- CheckpointManager: Checkpoint budget and eviction policy
+- PMap / PVector: Persistent containers for O(1) checkpoints of in-memory state
+- Normalizer / Canonicalizer: Symmetry reduction of observations before hashing
 """
 
+from venomqa.sandbox.canonical import Canonicalizer, Normalizer
 from venomqa.sandbox.checkpoint import Checkpoint
+from venomqa.sandbox.checkpoint_manager import CheckpointManager
 from venomqa.sandbox.context import Context, ScopedContext
+from venomqa.sandbox.persistent import PMap, PVector
 from venomqa.sandbox.rollbackable import Rollbackable, SystemCheckpoint
 from venomqa.sandbox.state import Observation, State
 from venomqa.sandbox.world import World
@@ -30,5 +36,11 @@ __all__ = [
     # Rollback support
     "Rollbackable",
     "Checkpoint",
+    "CheckpointManager",
     "SystemCheckpoint",
+    "PMap",
+    "PVector",
+    # Symmetry reduction
+    "Normalizer",
+    "Canonicalizer",
 ]
@@ -0,0 +1,202 @@
+"""Canonicalization - Symmetry reduction for observations.
+
+States that differ only in generated identifiers, timestamps or the order
+of rows hash to different IDs, so the graph cannot deduplicate them. A
+Normalizer rewrites one system's observation data into a canonical form
+before it is hashed:
+
+- ``ignore_keys``: drop these keys at any depth (timestamps, etags, ...)
+- ``sort_lists``: sort the lists under these keys (row order)
+- ``ordinal_ids``: rename the values under these keys to ordinal positions
+  (``"#0"``, ``"#1"``, ...) in order of first appearance, after sorting. The
+  renaming is shared across the observation, so references keep pointing at
+  the same entity (``parent_id`` names the same ordinal as the parent's ``id``).
+  This is a cheap approximation of isomorphism: rows that are identical
+  except for the rows referencing them may still get different ordinals.
+
+Only the state ID changes: observations keep their raw data, so reports and
+invariants still see real values.
+
+Systems can offer a built-in normalizer through an optional ``normalizer()``
+method; ResourceGraph and MockStorage do. ``World(canonicalize=True)`` uses
+them for every system without an explicit one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from venomqa.sandbox.state import Observation, State, _canonical_bytes
+
+_ID_PLACEHOLDER = "\0id"
+
+
+class Normalizer:
+    """Declarative canonicalization of one system's observation data.
+
+    Example::
+
+        World(
+            api=api,
+            systems={"db": db},
+            normalizers={
+                "db": Normalizer(
+                    ignore_keys=["created_at", "updated_at"],
+                    sort_lists=["orders"],
+                    ordinal_ids=["id", "order_id"],
+                ),
+            },
+        )
+
+    Args:
+        ignore_keys: Keys removed wherever they occur.
+        sort_lists: Keys whose list values are sorted. Identifier values are
+            left out of the sort key, so rows that differ only in their IDs
+            sort the same way however the IDs were generated.
+        ordinal_ids: Keys whose values (or list elements) are identifiers,
+            renamed to ordinals in order of first appearance.
+        custom: Optional final transformation of the normalized data.
+    """
+
+    def __init__(
+        self,
+        ignore_keys: Iterable[str] = (),
+        sort_lists: Iterable[str] = (),
+        ordinal_ids: Iterable[str] = (),
+        custom: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> None:
+        self.ignore_keys = frozenset(ignore_keys)
+        self.sort_lists = frozenset(sort_lists)
+        self.ordinal_ids = frozenset(ordinal_ids)
+        self.custom = custom
+
+    def __repr__(self) -> str:
+        return (
+            f"Normalizer(ignore_keys={sorted(self.ignore_keys)}, "
+            f"sort_lists={sorted(self.sort_lists)}, ordinal_ids={sorted(self.ordinal_ids)})"
+        )
+
+    def apply(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the canonical form of an observation's data."""
+        normalized = self._strip_and_sort(data)
+        if self.ordinal_ids:
+            normalized = self._rename(normalized, {})
+        if self.custom is not None:
+            normalized = self.custom(normalized)
+        return normalized
+
+    def _strip_and_sort(self, value: Any, key: str | None = None) -> Any:
+        if isinstance(value, Mapping):
+            return {
+                k: self._strip_and_sort(v, k)
+                for k, v in value.items()
+                if k not in self.ignore_keys
+            }
+        if isinstance(value, (list, tuple)):
+            items = [self._strip_and_sort(v) for v in value]
+            if key in self.sort_lists:
+                items.sort(key=self._sort_key)
+            return items
+        return value
+
+    def _sort_key(self, item: Any) -> tuple[bytes, bytes]:
+        # Primary key ignores identifiers; the raw encoding breaks ties
+        return _canonical_bytes(self._mask_ids(item)), _canonical_bytes(item)
+
+    def _mask_ids(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return {
+                k: _ID_PLACEHOLDER if k in self.ordinal_ids else self._mask_ids(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [self._mask_ids(v) for v in value]
+        return value
+
+    def _rename(self, value: Any, ordinals: dict[str, str], key: str | None = None) -> Any:
+        if isinstance(value, Mapping):
+            return {k: self._rename(v, ordinals, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._rename(v, ordinals, key) for v in value]
+        if key in self.ordinal_ids and value is not None:
+            token = json.dumps(value, default=str)
+            ordinal = ordinals.get(token)
+            if ordinal is None:
+                ordinal = ordinals[token] = f"#{len(ordinals)}"
+            return ordinal
+        return value
+
+
+class Canonicalizer:
+    """Applies per-system Normalizers to observations and tracks collapses.
+
+    Used by World; ``collapsed`` counts, for each canonical state ID, the
+    distinct raw state IDs (as they would be without normalization) observed
+    for it. Canonical hashes are cached per raw observation hash, so an
+    observation seen before (such as an unchanged ResourceGraph's) is not
+    normalized again.
+    """
+
+    def __init__(self, normalizers: Mapping[str, Normalizer]) -> None:
+        self.normalizers = dict(normalizers)
+        self.collapsed: dict[str, int] = {}
+        self._raw_states: dict[str, str] = {}  # raw state ID -> canonical state ID
+        self._canonical_hashes: dict[str, str] = {}  # raw observation hash -> canonical
+
+    def canonicalize(self, observations: dict[str, Observation]) -> State:
+        """Build a State whose ID is computed from canonical observation data."""
+        canonical = dict(observations)
+        for name, normalizer in self.normalizers.items():
+            obs = observations.get(name)
+            if obs is None:
+                continue
+            raw_hash = obs.content_hash()
+            canonical_hash = self._canonical_hashes.get(raw_hash)
+            if canonical_hash is None:
+                content = {"system": obs.system, "data": normalizer.apply(obs.data)}
+                canonical_hash = hashlib.sha256(_canonical_bytes(content)).hexdigest()
+                self._canonical_hashes[raw_hash] = canonical_hash
+            canonical[name] = _with_canonical_hash(obs, canonical_hash)
+        state = State.create(observations=canonical)
+        raw_id = State._compute_content_id(observations)
+        if raw_id not in self._raw_states:
+            self._raw_states[raw_id] = state.id
+            self.collapsed[state.id] = self.collapsed.get(state.id, 0) + 1
+        return state
+
+    def stats(self) -> dict[str, int]:
+        """Raw state count per canonical state, for states that absorbed more than one."""
+        return merge_collapse_stats([self])
+
+
+def _with_canonical_hash(obs: Observation, canonical_hash: str) -> Observation:
+    """Copy of an observation that keeps its raw data but hashes as canonical_hash."""
+    copy = Observation(
+        system=obs.system,
+        data=obs.data,
+        metadata=obs.metadata,
+        observed_at=obs.observed_at,
+    )
+    object.__setattr__(copy, "_content_hash", canonical_hash)
+    return copy
+
+
+def merge_collapse_stats(canonicalizers: Iterable[Canonicalizer | None]) -> dict[str, int]:
+    """Combine the collapse counts of several worlds (e.g. ParallelAgent replicas)."""
+    present = [c for c in canonicalizers if c is not None]
+    if len(present) == 1:
+        counts = present[0].collapsed
+    else:
+        # Replicas may have seen the same raw state; count it once
+        raw_states: dict[str, str] = {}
+        for canonicalizer in present:
+            raw_states.update(canonicalizer._raw_states)
+        counts = Counter(raw_states.values())
+    return {state_id: count for state_id, count in counts.items() if count > 1}
+
+
+__all__ = ["Canonicalizer", "Normalizer", "merge_collapse_stats"]
@@ -0,0 +1,158 @@
+"""CheckpointManager - Bookkeeping and eviction policy for World checkpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+
+
+class CheckpointManager:
+    """Tracks a World's live checkpoints and picks which ones to evict.
+
+    Every ``World.checkpoint()`` call stores one snapshot per system (a file
+    copy for SQLiteAdapter, a deepcopy for MockHTTPServer, ...). Without a
+    budget they are kept for the whole run. With ``max_checkpoints`` and/or
+    ``max_bytes`` set, the World evicts checkpoints as soon as a new one
+    pushes it over budget:
+
+    1. Checkpoints marked *exhausted* first (their state has no unexplored
+       actions left, so they are unlikely to be rolled back to again),
+       least recently used first.
+    2. Then any other checkpoint, least recently used first.
+
+    Pinned checkpoints (the initial state, and the checkpoints a shrink
+    replays from while it runs) are never evicted. When an agent
+    needs an evicted checkpoint, it replays the path to the state from the
+    nearest surviving checkpoint instead.
+
+    Sizes come from the optional ``checkpoint_size(checkpoint)`` method of
+    each system and are only measured when ``max_bytes`` is set.
+
+    Example::
+
+        world = World(
+            api=api,
+            systems={"db": SQLiteAdapter("app.db")},
+            checkpoint_manager=CheckpointManager(max_checkpoints=500),
+        )
+
+    Args:
+        max_checkpoints: Maximum number of live checkpoints (None = unlimited).
+        max_bytes: Maximum total size of live checkpoints (None = unlimited).
+    """
+
+    def __init__(
+        self,
+        max_checkpoints: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_checkpoints is not None and max_checkpoints < 1:
+            raise ValueError(f"max_checkpoints must be >= 1, got {max_checkpoints}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_checkpoints = max_checkpoints
+        self.max_bytes = max_bytes
+        # checkpoint_id -> size, in least-recently-used order
+        self._lru: OrderedDict[str, int] = OrderedDict()
+        self._exhausted: OrderedDict[str, None] = OrderedDict()
+        self._pinned: set[str] = set()
+        self.total_bytes = 0
+        self.evicted_count = 0
+        self.released_count = 0
+
+    @property
+    def measures_size(self) -> bool:
+        """Whether checkpoint sizes need to be reported to add()."""
+        return self.max_bytes is not None
+
+    def add(self, checkpoint_id: str, size: int = 0) -> None:
+        """Register a newly created checkpoint as most recently used."""
+        self._lru[checkpoint_id] = size
+        self.total_bytes += size
+
+    def touch(self, checkpoint_id: str) -> None:
+        """Mark a checkpoint as just used (rolled back to)."""
+        if checkpoint_id in self._lru:
+            self._lru.move_to_end(checkpoint_id)
+            if checkpoint_id in self._exhausted:
+                self._exhausted.move_to_end(checkpoint_id)
+
+    def discard(self, checkpoint_id: str) -> None:
+        """Forget a checkpoint (released or evicted)."""
+        size = self._lru.pop(checkpoint_id, None)
+        if size is not None:
+            self.total_bytes -= size
+        self._exhausted.pop(checkpoint_id, None)
+        self._pinned.discard(checkpoint_id)
+
+    def pin(self, checkpoint_id: str) -> None:
+        """Never evict this checkpoint."""
+        self._pinned.add(checkpoint_id)
+
+    def unpin(self, checkpoint_id: str) -> None:
+        """Make a pinned checkpoint evictable again."""
+        self._pinned.discard(checkpoint_id)
+
+    def is_pinned(self, checkpoint_id: str) -> bool:
+        """Whether this checkpoint is protected from eviction."""
+        return checkpoint_id in self._pinned
+
+    def mark_exhausted(self, checkpoint_id: str) -> None:
+        """Prefer this checkpoint for eviction: its state is fully explored."""
+        if checkpoint_id in self._lru:
+            self._exhausted[checkpoint_id] = None
+
+    def over_budget(self) -> bool:
+        """Whether live checkpoints exceed the configured budget."""
+        return self._exceeds(len(self._lru), self.total_bytes)
+
+    def victims(self, protect: str | None = None) -> list[str]:
+        """Checkpoints to evict to get back under budget, in eviction order.
+
+        Args:
+            protect: A checkpoint that must survive (usually the newest).
+        """
+        count = len(self._lru)
+        total = self.total_bytes
+        chosen: list[str] = []
+        for checkpoint_id in self._candidates(protect):
+            if not self._exceeds(count, total):
+                break
+            chosen.append(checkpoint_id)
+            count -= 1
+            total -= self._lru[checkpoint_id]
+        return chosen
+
+    def _candidates(self, protect: str | None) -> Iterator[str]:
+        seen: set[str] = set()
+        for pool in (self._exhausted, self._lru):
+            for checkpoint_id in pool:
+                if checkpoint_id in self._pinned or checkpoint_id == protect:
+                    continue
+                if checkpoint_id in seen:
+                    continue
+                seen.add(checkpoint_id)
+                yield checkpoint_id
+
+    def _exceeds(self, count: int, total: int) -> bool:
+        if self.max_checkpoints is not None and count > self.max_checkpoints:
+            return True
+        return self.max_bytes is not None and total > self.max_bytes
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def __contains__(self, checkpoint_id: object) -> bool:
+        return checkpoint_id in self._lru
+
+    def stats(self) -> dict[str, int]:
+        """Counters for reporting."""
+        return {
+            "live": len(self._lru),
+            "bytes": self.total_bytes,
+            "evicted": self.evicted_count,
+            "released": self.released_count,
+        }
+
+
+__all__ = ["CheckpointManager"]
@@ -7,16 +7,30 @@ Key features:
 - Checkpoint/rollback support (context is restored with state)
 - Type-safe getters with defaults
 - Scoped namespaces for organization
+- Copy-on-write checkpoints (values are shared until action code can mutate them)
 """
 
 from __future__ import annotations
 
 import copy
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, TypeVar, overload
 
 T = TypeVar("T")
 
+_SCALAR_TYPES = (str, bytes, int, float, complex, bool, type(None), range)
+
+
+def _is_immutable(value: Any) -> bool:
+    """True if value can be shared between checkpoints without copying."""
+    if isinstance(value, _SCALAR_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return False
+
 
 @dataclass
 class Context:
@@ -42,14 +56,39 @@ class Context:
     Named clients (registered via World(clients={...})) are stored separately
     in _clients and are NOT checkpointed - they survive rollbacks intact.
     Access them with context.get_client("viewer").
+
+    Checkpoints share values with the live context instead of deep-copying
+    everything. A mutable value is copied only when action code can reach it
+    (set, or read back through get), so checkpoint/restore cost scales with
+    the keys an action touched rather than with the size of the context.
     """
 
     _data: dict[str, Any] = field(default_factory=dict)
     _clients: dict[str, Any] = field(default_factory=dict)
+    # Keys whose mutable value is private to the live context (not shared
+    # with any checkpoint); they are deep-copied at the next checkpoint
+    _owned: set[str] = field(default_factory=set, repr=False, compare=False)
+    # Last checkpoint; returned as-is while nothing has changed since
+    _snapshot: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+
+    def _own(self, key: str) -> Any:
+        """Return the live value for key, copying it first if a checkpoint shares it."""
+        value = self._data[key]
+        if key not in self._owned and not _is_immutable(value):
+            value = copy.deepcopy(value)
+            self._data[key] = value
+            self._owned.add(key)
+            self._snapshot = None
+        return value
 
     def set(self, key: str, value: Any) -> None:
         """Set a value in the context."""
         self._data[key] = value
+        if _is_immutable(value):
+            self._owned.discard(key)
+        else:
+            self._owned.add(key)
+        self._snapshot = None
 
     @overload
     def get(self, key: str) -> Any | None: ...
@@ -59,11 +98,13 @@ class Context:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the context."""
-        return self._data.get(key, default)
+        if key not in self._data:
+            return default
+        return self._own(key)
 
     def get_typed(self, key: str, type_: type[T], default: T | None = None) -> T | None:
         """Get a value with type hint (for IDE support)."""
-        value = self._data.get(key, default)
+        value = self.get(key, default)
         return value if isinstance(value, type_) else default
 
     def get_required(self, key: str) -> Any:
@@ -82,7 +123,7 @@ class Context:
                 f"Required context key '{key}' is missing. "
                 f"Available: {list(self._data.keys())}"
             )
-        return self._data[key]
+        return self._own(key)
 
     def get_client(self, name: str) -> Any:
         """Get a named HTTP client registered via World(clients={...}).
@@ -120,10 +161,14 @@ class Context:
     def delete(self, key: str) -> None:
         """Delete a key from the context."""
         self._data.pop(key, None)
+        self._owned.discard(key)
+        self._snapshot = None
 
     def clear(self) -> None:
         """Clear all context data."""
         self._data.clear()
+        self._owned.clear()
+        self._snapshot = None
 
     def keys(self) -> list[str]:
         """Get all keys in the context."""
@@ -131,11 +176,20 @@ class Context:
 
     def to_dict(self) -> dict[str, Any]:
         """Get a copy of all context data."""
-        return dict(self._data)
+        return {key: self._own(key) for key in list(self._data)}
+
+    def view(self) -> Mapping[str, Any]:
+        """Read-only view of the context data, without copying.
+
+        Values may be shared with checkpoints and must not be mutated; use
+        get() when the value is going to be modified.
+        """
+        return MappingProxyType(self._data)
 
     def update(self, data: dict[str, Any]) -> None:
         """Update context with multiple values."""
-        self._data.update(data)
+        for key, value in data.items():
+            self.set(key, value)
 
     # Scoped access
     def scope(self, namespace: str) -> ScopedContext:
@@ -155,16 +209,28 @@ class Context:
         Only _data is checkpointed. Named clients (_clients) are excluded -
         they are test infrastructure, not application state, and should not
         be rolled back.
+
+        Values untouched since the previous checkpoint are shared rather than
+        copied, and an unchanged context returns the previous checkpoint
+        itself. The returned dict must be treated as read-only.
         """
-        return copy.deepcopy(self._data)
+        if self._snapshot is None or self._owned:
+            snapshot = dict(self._data)
+            for key in self._owned:
+                snapshot[key] = copy.deepcopy(self._data[key])
+            self._snapshot = snapshot
+        return self._snapshot
 
     def restore(self, checkpoint: dict[str, Any]) -> None:
         """Restore context from a checkpoint.
 
         Restores _data only. Named clients registered via _register_client
-        are preserved across rollbacks.
+        are preserved across rollbacks. Values stay shared with the
+        checkpoint until get() or set() hands them to action code.
         """
-        self._data = copy.deepcopy(checkpoint)
+        self._data = dict(checkpoint)
+        self._owned = set()
+        self._snapshot = checkpoint
         # _clients is intentionally left untouched
 
     def __contains__(self, key: str) -> bool:
@@ -0,0 +1,471 @@
+"""Persistent (immutable, structurally shared) containers for rollbackable state.
+
+A checkpoint of a plain dict or list has to copy it, so its cost grows with
+the total amount of state. ``PMap`` and ``PVector`` never change in place:
+``set()``, ``append()`` and friends return a new version that shares every
+untouched node with the old one (path copying). Keeping a reference to the
+current version *is* a checkpoint, and rolling back is rebinding that
+reference, so both are O(1); an update costs O(log32 n).
+
+Values stored in these containers are shared between versions and must be
+treated as immutable: replace an entry instead of mutating it.
+
+Example::
+
+    users = PMap()
+    v1 = users.set("u1", {"name": "Alice"})
+    v2 = v1.set("u2", {"name": "Bob"})
+    assert "u2" not in v1 and len(v2) == 2
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Generic, TypeVar, overload
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+# Python hashes are at most 64 bits; deeper than this every bit is used up
+_MAX_SHIFT = 64
+_HASH_MASK = (1 << _MAX_SHIFT) - 1
+
+_MISSING: Any = object()
+
+
+# ── PMap: hash array mapped trie ───────────────────────────────────────────
+#
+# A node is a _Node (bitmap + packed children) or a _Collision (keys whose
+# 64-bit hashes are identical). A child slot holds either a sub-node or a
+# leaf tuple (hash, key, value).
+
+
+class _Node:
+    __slots__ = ("bitmap", "slots")
+
+    def __init__(self, bitmap: int, slots: tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.slots = slots
+
+
+class _Collision:
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, hash_: int, leaves: tuple[tuple[int, Any, Any], ...]) -> None:
+        self.hash = hash_
+        self.leaves = leaves
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _same_key(a: Any, b: Any) -> bool:
+    return a is b or a == b
+
+
+def _merge(leaf1: tuple[int, Any, Any], leaf2: tuple[int, Any, Any], shift: int) -> Any:
+    """Smallest subtree holding two leaves with different keys."""
+    if shift >= _MAX_SHIFT or leaf1[0] == leaf2[0]:
+        return _Collision(leaf1[0], (leaf1, leaf2))
+    bit1 = 1 << ((leaf1[0] >> shift) & _MASK)
+    bit2 = 1 << ((leaf2[0] >> shift) & _MASK)
+    if bit1 == bit2:
+        return _Node(bit1, (_merge(leaf1, leaf2, shift + _BITS),))
+    if bit1 < bit2:
+        return _Node(bit1 | bit2, (leaf1, leaf2))
+    return _Node(bit1 | bit2, (leaf2, leaf1))
+
+
+def _lookup(node: Any, shift: int, h: int, key: Any, default: Any) -> Any:
+    while True:
+        if isinstance(node, _Collision):
+            for leaf in node.leaves:
+                if _same_key(leaf[1], key):
+                    return leaf[2]
+            return default
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return default
+        child = node.slots[(node.bitmap & (bit - 1)).bit_count()]
+        if isinstance(child, tuple):
+            return child[2] if child[0] == h and _same_key(child[1], key) else default
+        node = child
+        shift += _BITS
+
+
+def _assoc(node: Any, shift: int, leaf: tuple[int, Any, Any]) -> tuple[Any, bool]:
+    """Return (new node, whether a key was added); the node itself if unchanged."""
+    h, key, value = leaf
+    if isinstance(node, _Collision):
+        if h != node.hash:
+            # Only reachable when hashes differ above the used bits, which
+            # cannot happen once every bit is consumed; kept for safety.
+            return _merge_collision(node, leaf, shift), True
+        for i, old in enumerate(node.leaves):
+            if _same_key(old[1], key):
+                if old[2] is value:
+                    return node, False
+                return _Collision(h, node.leaves[:i] + (leaf,) + node.leaves[i + 1:]), False
+        return _Collision(h, node.leaves + (leaf,)), True
+
+    bit = 1 << ((h >> shift) & _MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    slots = node.slots
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, slots[:index] + (leaf,) + slots[index:]), True
+    child = slots[index]
+    if isinstance(child, tuple):
+        if child[0] == h and _same_key(child[1], key):
+            if child[2] is value:
+                return node, False
+            new_child, added = leaf, False
+        else:
+            new_child, added = _merge(child, leaf, shift + _BITS), True
+    else:
+        new_child, added = _assoc(child, shift + _BITS, leaf)
+        if new_child is child:
+            return node, False
+    return _Node(node.bitmap, slots[:index] + (new_child,) + slots[index + 1:]), added
+
+
+def _merge_collision(node: _Collision, leaf: tuple[int, Any, Any], shift: int) -> Any:
+    result: Any = _EMPTY_NODE
+    for old in node.leaves + (leaf,):
+        result, _ = _assoc(result, shift, old)
+    return result
+
+
+def _without(node: Any, shift: int, h: int, key: Any) -> Any:
+    """Return the node without key: itself if absent, None if it became empty."""
+    if isinstance(node, _Collision):
+        for i, old in enumerate(node.leaves):
+            if _same_key(old[1], key):
+                leaves = node.leaves[:i] + node.leaves[i + 1:]
+                return leaves[0] if len(leaves) == 1 else _Collision(h, leaves)
+        return node
+
+    bit = 1 << ((h >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    index = (node.bitmap & (bit - 1)).bit_count()
+    child = node.slots[index]
+    if isinstance(child, tuple):
+        if not (child[0] == h and _same_key(child[1], key)):
+            return node
+        new_child = None
+    else:
+        new_child = _without(child, shift + _BITS, h, key)
+        if new_child is child:
+            return node
+
+    if new_child is None:
+        bitmap = node.bitmap & ~bit
+        if not bitmap:
+            return None
+        slots = node.slots[:index] + node.slots[index + 1:]
+        if len(slots) == 1 and isinstance(slots[0], tuple) and shift:
+            # Pull a lone leaf up so lookups stay shallow
+            return slots[0]
+        return _Node(bitmap, slots)
+    if (
+        isinstance(new_child, _Node)
+        and len(new_child.slots) == 1
+        and isinstance(new_child.slots[0], tuple)
+    ):
+        new_child = new_child.slots[0]
+    return _Node(node.bitmap, node.slots[:index] + (new_child,) + node.slots[index + 1:])
+
+
+def _leaves(node: Any) -> Iterator[tuple[int, Any, Any]]:
+    if isinstance(node, _Collision):
+        yield from node.leaves
+        return
+    for child in node.slots:
+        if isinstance(child, tuple):
+            yield child
+        else:
+            yield from _leaves(child)
+
+
+class PMap(Mapping[K, V], Generic[K, V]):
+    """Immutable mapping with structural sharing.
+
+    Reads work like a dict. Updates return a new PMap and leave this one
+    untouched; unchanged updates return ``self``. Iteration order follows
+    key hashes, not insertion order.
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, items: Mapping[K, V] | Iterable[tuple[K, V]] | None = None) -> None:
+        self._root: Any = _EMPTY_NODE
+        self._len = 0
+        if items:
+            pairs = items.items() if isinstance(items, Mapping) else items
+            root, size = _EMPTY_NODE, 0
+            for key, value in pairs:
+                root, added = _assoc(root, 0, (_hash(key), key, value))
+                size += added
+            self._root, self._len = root, size
+
+    @classmethod
+    def _make(cls, root: Any, size: int) -> PMap[K, V]:
+        new = cls.__new__(cls)
+        new._root = root
+        new._len = size
+        return new
+
+    def __getitem__(self, key: K) -> V:
+        value = _lookup(self._root, 0, _hash(key), key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Any = None) -> Any:
+        return _lookup(self._root, 0, _hash(key), key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return _lookup(self._root, 0, _hash(key), key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[K]:
+        for leaf in _leaves(self._root):
+            yield leaf[1]
+
+    def items(self) -> Iterator[tuple[K, V]]:  # type: ignore[override]
+        for _, key, value in _leaves(self._root):
+            yield key, value
+
+    def values(self) -> Iterator[V]:  # type: ignore[override]
+        for leaf in _leaves(self._root):
+            yield leaf[2]
+
+    def set(self, key: K, value: V) -> PMap[K, V]:
+        """Return a map with key bound to value."""
+        root, added = _assoc(self._root, 0, (_hash(key), key, value))
+        if root is self._root:
+            return self
+        return self._make(root, self._len + added)
+
+    def delete(self, key: K) -> PMap[K, V]:
+        """Return a map without key; raises KeyError if it is absent."""
+        new = self.discard(key)
+        if new is self:
+            raise KeyError(key)
+        return new
+
+    def discard(self, key: K) -> PMap[K, V]:
+        """Return a map without key (``self`` if it is absent)."""
+        root = _without(self._root, 0, _hash(key), key)
+        if root is self._root:
+            return self
+        if root is None:
+            root = _EMPTY_NODE
+        elif isinstance(root, tuple):
+            root = _Node(1 << (root[0] & _MASK), (root,))
+        return self._make(root, self._len - 1)
+
+    def update(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> PMap[K, V]:
+        """Return a map with all of items bound."""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        root, size = self._root, self._len
+        for key, value in pairs:
+            root, added = _assoc(root, 0, (_hash(key), key, value))
+            size += added
+        return self if root is self._root else self._make(root, size)
+
+    def set_in(self, path: Sequence[Any], value: Any) -> PMap[K, V]:
+        """Return a copy with a value set in nested PMaps, copying only the path.
+
+        Missing intermediate maps are created: ``m.set_in(("users", uid), u)``.
+        """
+        if not path:
+            raise ValueError("set_in() needs a non-empty path")
+        head = path[0]
+        if len(path) == 1:
+            return self.set(head, value)
+        child = self.get(head)
+        if child is None:
+            child = PMap()
+        return self.set(head, child.set_in(path[1:], value))
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PMap) and self._root is other._root:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self.items()),))
+
+    def __repr__(self) -> str:
+        return f"PMap({dict(self.items())!r})"
+
+
+# ── PVector: 32-way trie with a tail ───────────────────────────────────────
+#
+# Elements live in a trie of 32-wide tuples; the last (up to 32) elements
+# are kept in a separate tail so appends usually copy only the tail.
+
+
+class PVector(Sequence[V], Generic[V]):
+    """Immutable sequence with structural sharing.
+
+    ``append()``, ``extend()`` and ``set()`` return a new PVector; reads and
+    updates by index are O(log32 n), appends amortised O(1).
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self, items: Iterable[V] | None = None) -> None:
+        self._count = 0
+        self._shift = _BITS
+        self._root: tuple[Any, ...] = ()
+        self._tail: tuple[Any, ...] = ()
+        if items is not None:
+            built = self.extend(items)
+            self._count, self._shift = built._count, built._shift
+            self._root, self._tail = built._root, built._tail
+
+    @classmethod
+    def _make(
+        cls, count: int, shift: int, root: tuple[Any, ...], tail: tuple[Any, ...]
+    ) -> PVector[V]:
+        new = cls.__new__(cls)
+        new._count = count
+        new._shift = shift
+        new._root = root
+        new._tail = tail
+        return new
+
+    def _tail_offset(self) -> int:
+        return 0 if self._count < _WIDTH else ((self._count - 1) >> _BITS) << _BITS
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PVector index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PVector[V]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return PVector(self[i] for i in range(*index.indices(self._count)))
+        index = self._index(index)
+        if index >= self._tail_offset():
+            return self._tail[index & _MASK]
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+        return node[index & _MASK]
+
+    def __iter__(self) -> Iterator[V]:
+        for chunk in _chunks(self._root, self._shift):
+            yield from chunk
+        yield from self._tail
+
+    def append(self, value: V) -> PVector[V]:
+        """Return a vector with value added at the end."""
+        count, shift, root = self._count, self._shift, self._root
+        if count - self._tail_offset() < _WIDTH:
+            return self._make(count + 1, shift, root, self._tail + (value,))
+        # Tail is full: push it into the trie
+        if (count >> _BITS) > (1 << shift):
+            root = (root, _new_path(shift, self._tail))
+            shift += _BITS
+        else:
+            root = _push_tail(count, shift, root, self._tail)
+        return self._make(count + 1, shift, root, (value,))
+
+    def extend(self, values: Iterable[V]) -> PVector[V]:
+        """Return a vector with values added at the end."""
+        result = self
+        for value in values:
+            result = result.append(value)
+        return result
+
+    def set(self, index: int, value: V) -> PVector[V]:
+        """Return a vector with the element at index replaced."""
+        index = self._index(index)
+        if index >= self._tail_offset():
+            pos = index & _MASK
+            if self._tail[pos] is value:
+                return self
+            tail = self._tail[:pos] + (value,) + self._tail[pos + 1:]
+            return self._make(self._count, self._shift, self._root, tail)
+        root = _assoc_index(self._shift, self._root, index, value)
+        return self._make(self._count, self._shift, root, self._tail)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PVector):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f"PVector({list(self)!r})"
+
+
+def _chunks(node: tuple[Any, ...], level: int) -> Iterator[tuple[Any, ...]]:
+    if level == 0:
+        yield node
+        return
+    for child in node:
+        yield from _chunks(child, level - _BITS)
+
+
+def _new_path(level: int, node: tuple[Any, ...]) -> tuple[Any, ...]:
+    while level:
+        node = (node,)
+        level -= _BITS
+    return node
+
+
+def _push_tail(
+    count: int, level: int, parent: tuple[Any, ...], tail: tuple[Any, ...]
+) -> tuple[Any, ...]:
+    index = ((count - 1) >> level) & _MASK
+    if level == _BITS:
+        insert = tail
+    elif index < len(parent):
+        insert = _push_tail(count, level - _BITS, parent[index], tail)
+    else:
+        insert = _new_path(level - _BITS, tail)
+    return parent[:index] + (insert,) + parent[index + 1:]
+
+
+def _assoc_index(level: int, node: tuple[Any, ...], index: int, value: Any) -> tuple[Any, ...]:
+    pos = (index >> level) & _MASK
+    if level == 0:
+        return node[:pos] + (value,) + node[pos + 1:]
+    child = _assoc_index(level - _BITS, node[pos], index, value)
+    return node[:pos] + (child,) + node[pos + 1:]
@@ -34,6 +34,18 @@ class Rollbackable(Protocol):
         - MockTime: saves current frozen time
         - ResourceGraph: copies resource instances dict
 
+    Optional methods, looked up with getattr() by World:
+
+        - ``release(checkpoint)``: free the resources behind a checkpoint
+          that will never be rolled back to (temp files, snapshots). Called
+          by ``World.release()`` and when CheckpointManager evicts.
+        - ``checkpoint_size(checkpoint) -> int``: approximate size in bytes,
+          used when a CheckpointManager has a ``max_bytes`` budget.
+        - ``has_checkpoint(checkpoint) -> bool``: False once the system has
+          dropped the checkpoint on its own (e.g. an adapter-level memory
+          budget). ``World.has_checkpoint()`` then reports it as gone, so
+          agents replay instead of rolling back to it.
+
     Example implementation::
 
         class MySystemAdapter:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -13,8 +14,18 @@ if TYPE_CHECKING:
     # Import only for type checking to avoid circular deps
     from venomqa.v1.core.hyperedge import Hyperedge
 
+# Version of the fingerprint encoding. It is mixed into every state ID, so
+# IDs produced by different encodings never collide; bump it on any change
+# to _canonical_bytes() or the combining scheme in State._compute_content_id.
+STATE_ID_VERSION = 2
 
-@dataclass(frozen=True)
+
+def _canonical_bytes(value: Any) -> bytes:
+    """Deterministic, compact JSON encoding used for fingerprinting."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+@dataclass(frozen=True, slots=True)
 class Observation:
     """Data observed from one system at a point in time.
 
@@ -30,12 +41,16 @@ class Observation:
         data: State data used for identity computation
         metadata: Additional metadata not used for identity
         observed_at: When this observation was taken
+
+    The content hash is computed on first use and cached, so data must not
+    be mutated after the observation is created.
     """
 
     system: str
     data: dict[str, Any]
     metadata: dict[str, Any] = field(default_factory=dict)
     observed_at: datetime = field(default_factory=datetime.now)
+    _content_hash: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the state data."""
@@ -50,10 +65,13 @@ class Observation:
 
     def content_hash(self) -> str:
         """Generate deterministic hash of state data (excluding metadata/timestamp)."""
-        content = {"system": self.system, "data": self.data}
-        return hashlib.sha256(
-            json.dumps(content, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        cached = self._content_hash
+        if cached is None:
+            content = {"system": self.system, "data": self.data}
+            cached = hashlib.sha256(_canonical_bytes(content)).hexdigest()
+            # Frozen dataclass: bypass __setattr__ to memoize
+            object.__setattr__(self, "_content_hash", cached)
+        return cached
 
     @classmethod
     def create(
@@ -69,8 +87,27 @@ class Observation:
             metadata=metadata or {},
         )
 
+    @classmethod
+    def with_digest(
+        cls,
+        system: str,
+        data: dict[str, Any],
+        digest: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> Observation:
+        """Create an observation whose content hash is derived from digest.
+
+        For systems that maintain a digest of their data incrementally, so
+        large data is not re-encoded for every fingerprint. The digest must
+        change whenever data does.
+        """
+        obs = cls(system=system, data=data, metadata=metadata or {})
+        content_hash = hashlib.sha256(f"{system}\0{digest}".encode()).hexdigest()
+        object.__setattr__(obs, "_content_hash", content_hash)
+        return obs
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """Snapshot of the world at a moment in time.
 
@@ -106,7 +143,7 @@ class State:
         The ID is derived from the hash of observation content.
         Same observations = same state ID = deduplication.
         """
-        state_id = cls._compute_content_id(observations)
+        state_id = sys.intern(cls._compute_content_id(observations))
         return cls(
             id=state_id,
             observations=observations,
@@ -121,20 +158,16 @@ class State:
         This is the key to state deduplication:
         - Same observations -> same hash -> same state ID
         - Different observations -> different hash -> different state ID
+
+        The ID combines the cached per-observation hashes, so an Observation
+        reused across states is only serialized once.
         """
-        # Build sorted content dict (excludes timestamps for determinism)
-        content = {}
+        # 16 hex chars = 64 bits, birthday collision at ~4B states
+        digest = hashlib.sha256(f"v{STATE_ID_VERSION}".encode())
         for system_name in sorted(observations.keys()):
-            obs = observations[system_name]
-            content[system_name] = {
-                "system": obs.system,
-                "data": obs.data,
-            }
-
-        # Hash the content (16 hex chars = 64 bits, birthday collision at ~4B states)
-        json_str = json.dumps(content, sort_keys=True, default=str)
-        content_hash = hashlib.sha256(json_str.encode()).hexdigest()[:16]
-        return f"s_{content_hash}"
+            digest.update(b"\0" + system_name.encode() + b"\0")
+            digest.update(observations[system_name].content_hash().encode())
+        return f"s_{digest.hexdigest()[:16]}"
 
     def content_hash(self) -> str:
         """Get the content hash portion of the state ID."""
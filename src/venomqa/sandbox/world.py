@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 # Local sandbox imports
+from venomqa.sandbox.canonical import Canonicalizer, Normalizer
 from venomqa.sandbox.checkpoint import Checkpoint
+from venomqa.sandbox.checkpoint_manager import CheckpointManager
 from venomqa.sandbox.context import Context
 from venomqa.sandbox.rollbackable import Rollbackable, SystemCheckpoint
 from venomqa.sandbox.state import Observation, State
@@ -67,6 +70,9 @@ class World:
         teardown: Callable[..., None] | None = None,
         state_from_context: list[str] | None = None,
         auth: Any | None = None,
+        checkpoint_manager: CheckpointManager | None = None,
+        normalizers: dict[str, Normalizer] | None = None,
+        canonicalize: bool = False,
     ) -> None:
         """Initialize the World sandbox.
 
@@ -79,6 +85,12 @@ class World:
             teardown: Function called after exploration ends.
             state_from_context: Context keys to include in state identity.
             auth: Auth configuration for automatic token injection.
+            checkpoint_manager: Checkpoint budget and eviction policy
+                (default: keep every checkpoint).
+            normalizers: Normalizer per system name (``"_ctx"`` for
+                state_from_context keys), applied before state IDs are computed.
+            canonicalize: Also use the built-in normalizer of every system
+                that has one (ResourceGraph, MockStorage).
         """
         self.api = api
         self.systems: dict[str, Rollbackable] = systems or {}
@@ -86,6 +98,9 @@ class World:
         self._setup_fn = setup
         self._checkpoints: dict[str, Checkpoint] = {}
         self._context_checkpoints: dict[str, dict[str, Any]] = {}
+        self.checkpoint_manager = (
+            checkpoint_manager if checkpoint_manager is not None else CheckpointManager()
+        )
         self._current_state_id: str | None = None
 
         # Named clients for RBAC / multi-role testing.
@@ -115,6 +130,14 @@ class World:
         # Track the last action result for invariants
         self._last_action_result: Any | None = None
 
+        # Cached World.resources lookup: (system name, graph)
+        self._resource_graph_cache: tuple[str, Any] | None = None
+
+        # Symmetry reduction: canonical observation data for state identity
+        self._normalizers = dict(normalizers or {})
+        self._canonicalize = canonicalize
+        self._canonicalizer: Canonicalizer | None = None
+
     def run_teardown(self) -> None:
         """Run the teardown function, if one was provided.
 
@@ -145,6 +168,8 @@ class World:
             system: A Rollbackable system implementation.
         """
         self.systems[name] = system
+        self._resource_graph_cache = None
+        self._canonicalizer = None
 
     def _context_observation(self) -> Observation | None:
         """Build a synthetic Observation from tracked context keys.
@@ -155,7 +180,8 @@ class World:
         """
         if not self._state_from_context:
             return None
-        data = {key: self.context.get(key) for key in self._state_from_context}
+        view = self.context.view()
+        data = {key: view.get(key) for key in self._state_from_context}
         return Observation(system="_ctx", data=data)
 
     def act(self, action: Action) -> ActionResult:
@@ -186,6 +212,11 @@ class World:
         """
         return self._last_action_result
 
+    @last_action_result.setter
+    def last_action_result(self, result: Any | None) -> None:
+        # Set by the Agent for actions it ran concurrently, before checking each result
+        self._last_action_result = result
+
     def observe(self) -> State:
         """Get current state from all systems.
 
@@ -195,13 +226,37 @@ class World:
         Returns:
             State snapshot with observations from all registered systems.
         """
+        return self._state_from(self._observe_systems())
+
+    def _observe_systems(self) -> dict[str, Observation]:
         observations: dict[str, Observation] = {}
         for name, system in self.systems.items():
             observations[name] = system.observe()
         ctx_obs = self._context_observation()
         if ctx_obs is not None:
             observations["_ctx"] = ctx_obs
-        return State.create(observations=observations)
+        return observations
+
+    def _state_from(self, observations: dict[str, Observation]) -> State:
+        """State for observations, with a canonical ID if normalizers apply."""
+        canonicalizer = self.canonicalizer
+        if canonicalizer is None:
+            return State.create(observations=observations)
+        return canonicalizer.canonicalize(observations)
+
+    @property
+    def canonicalizer(self) -> Canonicalizer | None:
+        """The Canonicalizer for this world's normalizers, or None if there are none."""
+        if self._canonicalizer is None and (self._normalizers or self._canonicalize):
+            normalizers = dict(self._normalizers)
+            if self._canonicalize:
+                for name, system in self.systems.items():
+                    builtin = getattr(system, "normalizer", None)
+                    if name not in normalizers and callable(builtin):
+                        normalizers[name] = builtin()
+            if normalizers:
+                self._canonicalizer = Canonicalizer(normalizers)
+        return self._canonicalizer
 
     def observe_and_checkpoint(self, checkpoint_name: str) -> State:
         """Atomically observe state and create a checkpoint.
@@ -223,17 +278,7 @@ class World:
         checkpoint_id = self.checkpoint(checkpoint_name)
 
         # Observe state
-        observations: dict[str, Observation] = {}
-        for name, system in self.systems.items():
-            observations[name] = system.observe()
-        ctx_obs = self._context_observation()
-        if ctx_obs is not None:
-            observations["_ctx"] = ctx_obs
-
-        state = State.create(
-            observations=observations,
-            checkpoint_id=checkpoint_id,
-        )
+        state = replace(self._state_from(self._observe_systems()), checkpoint_id=checkpoint_id)
         self._current_state_id = state.id
         return state
 
@@ -256,6 +301,13 @@ class World:
         # Also checkpoint context
         self._context_checkpoints[cp.id] = self.context.checkpoint()
 
+        manager = self.checkpoint_manager
+        manager.add(cp.id, self._checkpoint_size(cp) if manager.measures_size else 0)
+        if manager.over_budget():
+            for victim in manager.victims(protect=cp.id):
+                self._drop_checkpoint(victim)
+                manager.evicted_count += 1
+
         return cp.id
 
     def rollback(self, checkpoint_id: str) -> None:
@@ -282,13 +334,68 @@ class World:
         if context_cp is not None:
             self.context.restore(context_cp)
 
+        self.checkpoint_manager.touch(checkpoint_id)
+
+    def release(self, checkpoint_id: str) -> bool:
+        """Discard a checkpoint that will not be rolled back to again.
+
+        Systems that implement the optional ``release(checkpoint)`` method
+        free the underlying resources (files, snapshots).
+
+        Args:
+            checkpoint_id: The checkpoint to release.
+
+        Returns:
+            True if the checkpoint existed.
+        """
+        if not self._drop_checkpoint(checkpoint_id):
+            return False
+        self.checkpoint_manager.released_count += 1
+        return True
+
+    def _drop_checkpoint(self, checkpoint_id: str) -> bool:
+        cp = self._checkpoints.pop(checkpoint_id, None)
+        self._context_checkpoints.pop(checkpoint_id, None)
+        self.checkpoint_manager.discard(checkpoint_id)
+        if cp is None:
+            return False
+        for system_name, system in self.systems.items():
+            release = getattr(system, "release", None)
+            system_cp = cp.get_system_checkpoint(system_name)
+            if release is not None and system_cp is not None:
+                release(system_cp)
+        return True
+
+    def _checkpoint_size(self, cp: Checkpoint) -> int:
+        size = 0
+        for system_name, system in self.systems.items():
+            measure = getattr(system, "checkpoint_size", None)
+            system_cp = cp.get_system_checkpoint(system_name)
+            if measure is not None and system_cp is not None:
+                size += measure(system_cp)
+        return size
+
     def get_checkpoint(self, checkpoint_id: str) -> Checkpoint | None:
         """Get a checkpoint by ID."""
         return self._checkpoints.get(checkpoint_id)
 
     def has_checkpoint(self, checkpoint_id: str) -> bool:
-        """Check if a checkpoint exists."""
-        return checkpoint_id in self._checkpoints
+        """Check if a checkpoint exists.
+
+        A checkpoint that one of the systems has dropped on its own (see
+        Rollbackable.has_checkpoint) is released here and reported as gone.
+        """
+        cp = self._checkpoints.get(checkpoint_id)
+        if cp is None:
+            return False
+        for system_name, system in self.systems.items():
+            alive = getattr(system, "has_checkpoint", None)
+            system_cp = cp.get_system_checkpoint(system_name)
+            if alive is not None and system_cp is not None and not alive(system_cp):
+                self._drop_checkpoint(checkpoint_id)
+                self.checkpoint_manager.evicted_count += 1
+                return False
+        return True
 
     # -- ResourceGraph integration --
 
@@ -312,11 +419,18 @@ class World:
             if world.resources:
                 world.resources.create("workspace", ws_id)
         """
+        cache = self._resource_graph_cache
+        # Still valid unless the system was replaced or removed (systems is a plain dict)
+        if cache is not None and self.systems.get(cache[0]) is cache[1]:
+            return cache[1]
+
         from venomqa.v1.adapters.resource_graph import ResourceGraph
 
-        for system in self.systems.values():
+        for name, system in self.systems.items():
             if isinstance(system, ResourceGraph):
+                self._resource_graph_cache = (name, system)
                 return system
+        self._resource_graph_cache = None
         return None
 
     def resource_exists(self, resource_type: str, resource_id: str) -> bool:
@@ -355,8 +469,7 @@ class World:
 
         # Check resource requirements
         if graph is not None and requires:
-            bindings = self.context.to_dict()
-            if not graph.can_execute(requires, bindings):
+            if not graph.can_execute(requires, self.context.view()):
                 return False
 
         # Fast path: skip observe() if all preconditions are context-only.
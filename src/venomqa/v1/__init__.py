@@ -18,7 +18,7 @@ from venomqa.v1.adapters.resource_graph import (
     schema_from_openapi,
 )
 from venomqa.v1.adapters.sqlite import SQLiteAdapter
-from venomqa.v1.agent import Agent, Scheduler
+from venomqa.v1.agent import Agent, ParallelAgent, Scheduler, ShardedAgent
 from venomqa.v1.agent.strategies import (
     BFS,
     DFS,
@@ -245,6 +245,8 @@ __all__ = [
     "SystemCheckpoint",
     # Agent
     "Agent",
+    "ParallelAgent",
+    "ShardedAgent",
     "Strategy",
     "BFS",
     "DFS",
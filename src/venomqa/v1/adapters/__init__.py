@@ -7,6 +7,7 @@ from venomqa.v1.adapters.mock_storage import MockStorage, StoredFile
 from venomqa.v1.adapters.mock_time import MockTime
 from venomqa.v1.adapters.mysql import MySQLAdapter
 from venomqa.v1.adapters.postgres import PostgresAdapter
+from venomqa.v1.adapters.postgres_snapshot import PostgresSnapshotAdapter
 from venomqa.v1.adapters.redis import RedisAdapter
 from venomqa.v1.adapters.sqlite import SQLiteAdapter
 from venomqa.v1.adapters.wiremock import WireMockAdapter
@@ -30,6 +31,7 @@ __all__ = [
     "SharedPostgresAdapter",
     # Databases
     "PostgresAdapter",
+    "PostgresSnapshotAdapter",
     "MySQLAdapter",
     "SQLiteAdapter",
     # Cache
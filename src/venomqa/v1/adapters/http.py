@@ -8,7 +8,7 @@ from urllib.parse import urljoin
 
 import httpx
 
-from venomqa.v1.core.action import ActionResult, HTTPRequest, HTTPResponse
+from venomqa.v1.core.action import ActionResult, HTTPRequest, HTTPResponse, shared_headers
 
 
 class HttpClient:
@@ -53,7 +53,7 @@ class HttpClient:
             params: Query parameters
         """
         url = urljoin(self.base_url + "/", path.lstrip("/"))
-        merged_headers = {**self.default_headers, **(headers or {})}
+        merged_headers = shared_headers({**self.default_headers, **(headers or {})})
 
         request = HTTPRequest(
             method=method.upper(),
@@ -85,7 +85,7 @@ class HttpClient:
 
             response = HTTPResponse(
                 status_code=resp.status_code,
-                headers=dict(resp.headers),
+                headers=shared_headers(resp.headers),
                 body=body,
             )
 
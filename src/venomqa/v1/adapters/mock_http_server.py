@@ -38,14 +38,36 @@ Usage pattern:
     github_obs = GitHubObserver()
     world = World(api=github_api, systems={"github": github_obs})
     # No StripeProxy needed — state dict is picklable!
+
+Large mock state: keep it in a PMap (venomqa.sandbox.persistent) instead of
+a dict. Handlers rebind the module-level map (``_state = _state.set_in(("users",
+uid), user)``), get_state_snapshot() returns it as-is, and
+rollback_from_snapshot() rebinds it to the snapshot. checkpoint() then skips
+the deepcopy, so checkpoint and rollback cost O(1) instead of O(state), and
+counts can be read with len() on the nested maps:
+
+    _state = PMap({"users": PMap(), "repos": PMap()})
+
+    class GitHubObserver(MockHTTPServer):
+        @staticmethod
+        def get_state_snapshot() -> PMap:
+            return _state
+
+        @staticmethod
+        def rollback_from_snapshot(snap: PMap) -> None:
+            global _state
+            with _lock: _state = snap
 """
 
 from __future__ import annotations
 
 import copy
+import pickle
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
+from venomqa.sandbox.persistent import PMap
 from venomqa.v1.core.state import Observation
 
 
@@ -62,24 +84,24 @@ class MockHTTPServer(ABC):
 
     def __init__(self, name: str) -> None:
         self.name = name
-        self._saved_checkpoints: dict[str, dict[str, Any]] = {}
+        self._saved_checkpoints: dict[str, Mapping[str, Any]] = {}
 
     # ---------------------------------------------------------------- abstract
 
     @staticmethod
     @abstractmethod
-    def get_state_snapshot() -> dict[str, Any]:
+    def get_state_snapshot() -> Mapping[str, Any]:
         """Return a deep-copyable snapshot of the current module-level state.
 
         Must hold the server's threading.Lock while reading. The returned dict
         must contain only picklable values (str, int, list, dict — no threading
-        objects).
+        objects). A PMap is returned as the snapshot itself, without copying.
         """
         ...
 
     @staticmethod
     @abstractmethod
-    def rollback_from_snapshot(snapshot: dict[str, Any]) -> None:
+    def rollback_from_snapshot(snapshot: Mapping[str, Any]) -> None:
         """Restore the module-level state dict from a snapshot.
 
         Must hold the server's threading.Lock while restoring.
@@ -87,7 +109,7 @@ class MockHTTPServer(ABC):
         ...
 
     @abstractmethod
-    def observe_from_state(self, state: dict[str, Any]) -> Observation:
+    def observe_from_state(self, state: Mapping[str, Any]) -> Observation:
         """Convert a state snapshot to a VenomQA Observation.
 
         This is called with the result of get_state_snapshot(). Compute
@@ -97,22 +119,44 @@ class MockHTTPServer(ABC):
 
     # ---------------------------------------------------------------- Rollbackable protocol
 
-    def checkpoint(self, name: str) -> dict[str, Any]:
-        """Deepcopy the current server state and store it under name."""
-        snap = copy.deepcopy(self.get_state_snapshot())
+    def checkpoint(self, name: str) -> Mapping[str, Any]:
+        """Snapshot the current server state and store it under name.
+
+        Dict snapshots are deep-copied; PMap snapshots are immutable and
+        stored as they are.
+        """
+        snap = self.get_state_snapshot()
+        if not isinstance(snap, PMap):
+            snap = copy.deepcopy(snap)
         self._saved_checkpoints[name] = snap
         return snap
 
-    def rollback(self, checkpoint: dict[str, Any] | None) -> None:
+    def rollback(self, checkpoint: Mapping[str, Any] | None) -> None:
         """Restore the server state from a checkpoint dict.
 
         Unlike HTTPObserver (which makes this a no-op), MockHTTPServer performs
         a real restore — the module-level _state dict is overwritten with the
         snapshot data. This enables branching exploration.
         """
-        if checkpoint and isinstance(checkpoint, dict):
+        if checkpoint and isinstance(checkpoint, (dict, PMap)):
             self.rollback_from_snapshot(checkpoint)
 
+    def release(self, checkpoint: Mapping[str, Any] | None) -> None:
+        """Drop a saved snapshot that will not be rolled back to."""
+        # Newest first: agents mostly release the checkpoint they just took.
+        for name in reversed(self._saved_checkpoints):
+            if self._saved_checkpoints[name] is checkpoint:
+                del self._saved_checkpoints[name]
+                return
+
+    def checkpoint_size(self, checkpoint: Mapping[str, Any] | None) -> int:
+        """Approximate in-memory size of a snapshot (its pickled length).
+
+        Structure a PMap snapshot shares with other checkpoints is counted
+        in full, so for those this is an upper bound.
+        """
+        return len(pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL))
+
     def observe(self) -> Observation:
         """Read current server state and return as Observation (no HTTP calls)."""
         state = self.get_state_snapshot()
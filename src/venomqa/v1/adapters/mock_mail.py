@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from venomqa.sandbox.persistent import PMap, PVector
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -27,12 +27,15 @@ class Email:
 class MockMail:
     """In-memory mail service for testing.
 
-    Implements Rollbackable protocol for checkpoint/restore.
+    Implements Rollbackable protocol for checkpoint/restore. Sent emails live
+    in a persistent vector shared with checkpoints, and a per-recipient count
+    is kept alongside so observe() does not walk every email.
     """
 
     def __init__(self) -> None:
-        self._sent: list[Email] = []
+        self._sent: PVector[Email] = PVector()
         self._email_counter = 0
+        self._recipients: PMap[str, int] = PMap()
 
     def send(
         self,
@@ -57,7 +60,11 @@ class MockMail:
             cc=cc or [],
             bcc=bcc or [],
         )
-        self._sent.append(email)
+        self._sent = self._sent.append(email)
+        recipients = self._recipients
+        for addr in set(to):
+            recipients = recipients.set(addr, recipients.get(addr, 0) + 1)
+        self._recipients = recipients
         return email
 
     def get_sent(self, to: str | None = None) -> list[Email]:
@@ -76,19 +83,22 @@ class MockMail:
 
     def clear(self) -> None:
         """Clear all sent emails."""
-        self._sent.clear()
+        self._sent = PVector()
+        self._recipients = PMap()
 
     def checkpoint(self, name: str) -> SystemCheckpoint:
         """Save current mail state (including counter for deterministic IDs)."""
         return {
-            "sent": copy.deepcopy(self._sent),
+            "sent": self._sent,
             "counter": self._email_counter,
+            "recipients": self._recipients,
         }
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Restore mail state (including counter for deterministic IDs)."""
-        self._sent = copy.deepcopy(checkpoint["sent"])
+        self._sent = checkpoint["sent"]
         self._email_counter = checkpoint["counter"]
+        self._recipients = checkpoint["recipients"]
 
     def observe(self) -> Observation:
         """Get current mail state."""
@@ -96,7 +106,7 @@ class MockMail:
             system="mail",
             data={
                 "sent_count": self.sent_count,
-                "recipients": list({addr for e in self._sent for addr in e.to}),
+                "recipients": sorted(self._recipients),
             },
             observed_at=datetime.now(),
         )
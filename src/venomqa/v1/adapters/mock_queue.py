@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
 
+from venomqa.sandbox.persistent import PVector
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -24,13 +24,17 @@ class Message:
 class MockQueue:
     """In-memory queue for testing.
 
-    Implements Rollbackable protocol for checkpoint/restore.
+    Implements Rollbackable protocol for checkpoint/restore. Messages live in
+    a persistent vector shared with checkpoints, so they are never mutated:
+    ``pop()`` stores and returns a processed copy. Messages are processed in
+    order, so everything before ``_head`` is processed and the rest pending.
     """
 
     def __init__(self, name: str = "default") -> None:
         self.name = name
-        self._messages: list[Message] = []
+        self._messages: PVector[Message] = PVector()
         self._message_counter = 0
+        self._head = 0
 
     def push(self, payload: Any) -> Message:
         """Add a message to the queue."""
@@ -39,49 +43,52 @@ class MockQueue:
             id=f"msg_{self._message_counter}",
             payload=payload,
         )
-        self._messages.append(msg)
+        self._messages = self._messages.append(msg)
         return msg
 
     def pop(self) -> Message | None:
         """Get and remove the next unprocessed message."""
-        for msg in self._messages:
-            if not msg.processed:
-                msg.processed = True
-                return msg
-        return None
+        if self._head >= len(self._messages):
+            return None
+        msg = replace(self._messages[self._head], processed=True)
+        self._messages = self._messages.set(self._head, msg)
+        self._head += 1
+        return msg
 
     def peek(self) -> Message | None:
         """Get the next unprocessed message without removing it."""
-        for msg in self._messages:
-            if not msg.processed:
-                return msg
-        return None
+        if self._head >= len(self._messages):
+            return None
+        return self._messages[self._head]
 
     @property
     def pending_count(self) -> int:
         """Count of unprocessed messages."""
-        return sum(1 for m in self._messages if not m.processed)
+        return len(self._messages) - self._head
 
     @property
     def processed_count(self) -> int:
         """Count of processed messages."""
-        return sum(1 for m in self._messages if m.processed)
+        return self._head
 
     def clear(self) -> None:
         """Clear all messages."""
-        self._messages.clear()
+        self._messages = PVector()
+        self._head = 0
 
     def checkpoint(self, name: str) -> SystemCheckpoint:
         """Save current queue state (including counter for deterministic IDs)."""
         return {
-            "messages": copy.deepcopy(self._messages),
+            "messages": self._messages,
             "counter": self._message_counter,
+            "head": self._head,
         }
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Restore queue state (including counter for deterministic IDs)."""
-        self._messages = copy.deepcopy(checkpoint["messages"])
+        self._messages = checkpoint["messages"]
         self._message_counter = checkpoint["counter"]
+        self._head = checkpoint["head"]
 
     def observe(self) -> Observation:
         """Get current queue state."""
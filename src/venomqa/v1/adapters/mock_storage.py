@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from venomqa.sandbox.canonical import Normalizer
+from venomqa.sandbox.persistent import PMap
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -24,12 +25,18 @@ class StoredFile:
 class MockStorage:
     """In-memory file storage for testing.
 
-    Implements Rollbackable protocol for checkpoint/restore.
+    Implements Rollbackable protocol for checkpoint/restore. Files live in a
+    persistent map, so a checkpoint shares them instead of copying: stored
+    files must not be mutated in place (``put()`` a new one instead).
     """
 
     def __init__(self, bucket: str = "default") -> None:
         self.bucket = bucket
-        self._files: dict[str, StoredFile] = {}
+        self._files: PMap[str, StoredFile] = PMap()
+        self._total_size = 0
+        # Last observation, reused until storage changes so its content
+        # hash is not recomputed for unchanged steps
+        self._observation: Observation | None = None
 
     def put(
         self,
@@ -48,7 +55,12 @@ class MockStorage:
             content_type=content_type,
             metadata=metadata or {},
         )
-        self._files[path] = file
+        old = self._files.get(path)
+        if old is not None:
+            self._total_size -= len(old.content)
+        self._files = self._files.set(path, file)
+        self._total_size += len(content)
+        self._observation = None
         return file
 
     def get(self, path: str) -> StoredFile | None:
@@ -57,8 +69,11 @@ class MockStorage:
 
     def delete(self, path: str) -> bool:
         """Delete a file."""
-        if path in self._files:
-            del self._files[path]
+        old = self._files.get(path)
+        if old is not None:
+            self._files = self._files.delete(path)
+            self._total_size -= len(old.content)
+            self._observation = None
             return True
         return False
 
@@ -74,26 +89,42 @@ class MockStorage:
     def file_count(self) -> int:
         return len(self._files)
 
+    @property
+    def total_size(self) -> int:
+        """Total content size of all files, in bytes."""
+        return self._total_size
+
     def clear(self) -> None:
         """Clear all files."""
-        self._files.clear()
+        self._files = PMap()
+        self._total_size = 0
+        self._observation = None
 
     def checkpoint(self, name: str) -> SystemCheckpoint:
-        """Save current storage state."""
-        return copy.deepcopy(self._files)
+        """Save current storage state (O(1): the file map is shared)."""
+        return {"files": self._files, "total_size": self._total_size}
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Restore storage state."""
-        self._files = copy.deepcopy(checkpoint)
+        self._files = checkpoint["files"]
+        self._total_size = checkpoint["total_size"]
+        self._observation = None
+
+    def normalizer(self) -> Normalizer:
+        """Built-in normalizer for ``World(canonicalize=True)``: file names are opaque IDs."""
+        return Normalizer(ordinal_ids=["files"])
 
     def observe(self) -> Observation:
         """Get current storage state."""
-        return Observation(
+        if self._observation is not None:
+            return self._observation
+        self._observation = Observation(
             system=f"storage:{self.bucket}",
             data={
                 "file_count": self.file_count,
-                "files": list(self._files.keys()),
-                "total_size": sum(len(f.content) for f in self._files.values()),
+                "files": sorted(self._files),
+                "total_size": self._total_size,
             },
             observed_at=datetime.now(),
         )
+        return self._observation
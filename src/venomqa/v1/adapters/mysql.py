@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Any
 
+from venomqa.v1.adapters.sql_observe import ObserveStats, batched_select, scalar_subquery
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -38,6 +40,7 @@ class MySQLAdapter:
         password: str = "",
         database: str = "test",
         observe_tables: list[str] | None = None,
+        observe_queries: dict[str, str] | None = None,
     ) -> None:
         self.host = host
         self.port = port
@@ -45,8 +48,15 @@ class MySQLAdapter:
         self.password = password
         self.database = database
         self.observe_tables = observe_tables or []
+        # Extra single-value queries, keyed by observation field name
+        self.observe_queries = observe_queries or {}
         self._conn: Any = None
         self._savepoint_counter = 0
+        self._observe_sql: tuple[tuple[Any, ...], tuple[list[str], str]] | None = None
+        # observe_queries that cannot be a batch column (several columns, or
+        # failing); they run on their own, found on the first batch failure
+        self._unbatched: set[str] = set()
+        self.observe_stats = ObserveStats()
 
     def connect(self) -> None:
         """Connect to the database."""
@@ -107,24 +117,102 @@ class MySQLAdapter:
         cursor.close()
 
     def observe(self) -> Observation:
-        """Query tables and return observation."""
-        data: dict[str, Any] = {}
-        cursor = self.connection.cursor()
+        """Query tables and return observation.
 
-        for table in self.observe_tables:
-            # Use _quote_identifier to prevent SQL injection
-            safe_table = _quote_identifier(table)
-            cursor.execute(f"SELECT COUNT(*) FROM {safe_table}")
-            count = cursor.fetchone()[0]
-            data[f"{table}_count"] = count
-
-        cursor.close()
+        Table counts and observe_queries are fetched with one batched SELECT.
+        A custom query that cannot be batched runs on its own, and one that
+        fails is reported as ``"ERROR: ..."`` in its field.
+        """
+        started = time.perf_counter()
+        data: dict[str, Any] = {}
+        fields = [f"{table}_count" for table in self.observe_tables]
+        fields.extend(self.observe_queries)
+
+        if fields:
+            values = self._observe_batch()
+            for name, query in self.observe_queries.items():
+                if name not in values:
+                    values[name] = self._observe_query(query)
+            data.update((field, values[field]) for field in fields)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.observe_stats.record(elapsed_ms)
         return Observation(
             system="db",
             data=data,
+            metadata={"observe_ms": round(elapsed_ms, 3)},
             observed_at=datetime.now(),
         )
 
+    def _observe_batch(self, retry: bool = True) -> dict[str, Any]:
+        """Table counts and batchable custom queries, fetched with one SELECT."""
+        fields, statement = self._observe_statement()
+        if not fields:
+            return {}
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(statement)
+            row = cursor.fetchone()
+        except Exception:
+            # MySQL rolls back only the failed statement, so no savepoint is needed
+            if len(fields) == len(self.observe_tables):
+                raise
+            if retry:
+                self._find_unbatched()
+            else:
+                # Still failing: run every custom query on its own from now on
+                self._unbatched.update(self.observe_queries.values())
+            return self._observe_batch(retry=False)
+        finally:
+            cursor.close()
+        return dict(zip(fields, row, strict=True))
+
+    def _find_unbatched(self) -> None:
+        """Probe each batched custom query alone and set aside the ones that fail."""
+        for query in self.observe_queries.values():
+            if query in self._unbatched:
+                continue
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(batched_select([scalar_subquery(query)]))
+                cursor.fetchone()
+            except Exception:
+                self._unbatched.add(query)
+            finally:
+                cursor.close()
+
+    def _observe_query(self, query: str) -> Any:
+        """Run one custom query on its own; errors become its value."""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query)
+            result = cursor.fetchone()
+            return result[0] if result else None
+        except Exception as e:
+            return f"ERROR: {e}"
+        finally:
+            cursor.close()
+
+    def _observe_statement(self) -> tuple[list[str], str]:
+        """Compiled batch SELECT and its fields, rebuilt only when the configuration changes."""
+        key = (
+            tuple(self.observe_tables),
+            tuple(self.observe_queries.items()),
+            frozenset(self._unbatched),
+        )
+        if self._observe_sql is None or self._observe_sql[0] != key:
+            fields = [f"{table}_count" for table in self.observe_tables]
+            # Use _quote_identifier to prevent SQL injection
+            expressions = [
+                f"SELECT COUNT(*) FROM {_quote_identifier(table)}" for table in self.observe_tables
+            ]
+            for name, query in self.observe_queries.items():
+                if query not in self._unbatched:
+                    fields.append(name)
+                    expressions.append(scalar_subquery(query))
+            self._observe_sql = (key, (fields, batched_select(expressions)))
+        return self._observe_sql[1]
+
     def execute(
         self,
         query: str,
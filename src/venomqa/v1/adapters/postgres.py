@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
+from contextlib import nullcontext
 from typing import Any
 
 try:
@@ -10,6 +12,7 @@ try:
 except ImportError:
     sql = None  # type: ignore[assignment]
 
+from venomqa.v1.adapters.sql_observe import ObserveStats, scalar_subquery
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -29,8 +32,14 @@ class PostgresAdapter:
     - Basic: Table row counts (configure via observe_tables)
     - Custom: Add custom queries via add_observation_query()
     - State flags: Track boolean state like "has_users", "order_pending"
+
+    Savepoints are stack-based, so only DFS exploration is supported; see
+    PostgresSnapshotAdapter for arbitrary rollback.
     """
 
+    # ROLLBACK TO an earlier savepoint destroys all later ones.
+    supports_arbitrary_rollback = False
+
     def __init__(
         self,
         connection_string: str,
@@ -52,6 +61,11 @@ class PostgresAdapter:
         self._custom_observers: list[ObservationQuery] = []
         self._conn: Any = None
         self._savepoint_counter = 0
+        self._observe_sql: tuple[tuple[Any, ...], tuple[list[str], Any]] | None = None
+        # observe_queries that cannot be a batch column (several columns, or
+        # failing); they run on their own, found on the first batch failure
+        self._unbatched: set[str] = set()
+        self.observe_stats = ObserveStats()
 
     def connect(self) -> None:
         """Connect to the database."""
@@ -132,27 +146,20 @@ class PostgresAdapter:
         if not self._conn:
             self.connect()
 
+        started = time.perf_counter()
         data: dict[str, Any] = {}
         metadata: dict[str, Any] = {
             "savepoint_counter": self._savepoint_counter,
         }
 
-        with self._conn.cursor() as cur:
-            # Table counts (use sql.Identifier to prevent SQL injection)
-            for table in self.observe_tables:
-                query = sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table))
-                cur.execute(query)
-                count = cur.fetchone()[0]
-                data[f"{table}_count"] = count
-
-            # Custom queries
+        fields = [f"{table}_count" for table in self.observe_tables]
+        fields.extend(self._observe_queries)
+        if fields:
+            values = self._observe_batch()
             for name, query in self._observe_queries.items():
-                try:
-                    cur.execute(query)
-                    result = cur.fetchone()
-                    data[name] = result[0] if result else None
-                except Exception as e:
-                    data[name] = f"ERROR: {e}"
+                if name not in values:
+                    values[name] = self._observe_query(query)
+            data.update((field, values[field]) for field in fields)
 
         # Custom observers
         for observer in self._custom_observers:
@@ -162,12 +169,91 @@ class PostgresAdapter:
             except Exception as e:
                 data["observer_error"] = str(e)
 
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.observe_stats.record(elapsed_ms)
+        metadata["observe_ms"] = round(elapsed_ms, 3)
+
         return Observation.create(
             system="db",
             data=data,
             metadata=metadata,
         )
 
+    def _observe_batch(self, retry: bool = True) -> dict[str, Any]:
+        """Table counts and batchable custom queries, fetched with one SELECT.
+
+        Table counts alone are one round trip. A batch with custom queries
+        runs in a savepoint (two more round trips), so a failing query does
+        not leave the connection's transaction, and its checkpoints, aborted.
+        """
+        fields, statement = self._observe_statement()
+        if not fields:
+            return {}
+        custom = len(fields) > len(self.observe_tables)
+        try:
+            with self._conn.transaction() if custom else nullcontext(), self._conn.cursor() as cur:
+                cur.execute(statement)
+                row = cur.fetchone()
+        except Exception:
+            if not custom:
+                raise
+            if retry:
+                self._find_unbatched()
+            else:
+                # Still failing: run every custom query on its own from now on
+                self._unbatched.update(self._observe_queries.values())
+            return self._observe_batch(retry=False)
+        return dict(zip(fields, row, strict=True))
+
+    def _find_unbatched(self) -> None:
+        """Probe each batched custom query alone and set aside the ones that fail."""
+        for query in self._observe_queries.values():
+            if query in self._unbatched:
+                continue
+            probe = sql.SQL("SELECT ({})").format(sql.SQL(scalar_subquery(query)))
+            try:
+                with self._conn.transaction(), self._conn.cursor() as cur:
+                    cur.execute(probe)
+            except Exception:
+                self._unbatched.add(query)
+
+    def _observe_query(self, query: str) -> Any:
+        """Run one custom query on its own, in a savepoint; errors become its value."""
+        try:
+            with self._conn.transaction(), self._conn.cursor() as cur:
+                cur.execute(query)
+                result = cur.fetchone()
+            return result[0] if result else None
+        except Exception as e:
+            return f"ERROR: {e}"
+
+    def _observe_statement(self) -> tuple[list[str], Any]:
+        """Compiled batch SELECT and its fields, rebuilt only when the configuration changes.
+
+        Table counts and the custom queries that can be a single column
+        become scalar subqueries of one SELECT, so their number does not
+        add round trips.
+        """
+        key = (
+            tuple(self.observe_tables),
+            tuple(self._observe_queries.items()),
+            frozenset(self._unbatched),
+        )
+        if self._observe_sql is None or self._observe_sql[0] != key:
+            fields = [f"{table}_count" for table in self.observe_tables]
+            # Use sql.Identifier to prevent SQL injection
+            expressions = [
+                sql.SQL("(SELECT COUNT(*) FROM {})").format(sql.Identifier(table))
+                for table in self.observe_tables
+            ]
+            for name, query in self._observe_queries.items():
+                if query not in self._unbatched:
+                    fields.append(name)
+                    expressions.append(sql.SQL("({})").format(sql.SQL(scalar_subquery(query))))
+            statement = sql.SQL("SELECT ") + sql.SQL(", ").join(expressions)
+            self._observe_sql = (key, (fields, statement))
+        return self._observe_sql[1]
+
     def execute(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
         """Execute a query and return results."""
         if not self._conn:
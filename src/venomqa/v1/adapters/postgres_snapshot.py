@@ -0,0 +1,418 @@
+"""PostgreSQL adapter with arbitrary (non-LIFO) rollback."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    from psycopg import sql
+except ImportError:
+    sql = None  # type: ignore[assignment]
+
+from venomqa.v1.adapters.postgres import PostgresAdapter
+from venomqa.v1.world.rollbackable import SystemCheckpoint
+
+
+@dataclass
+class _TableSnapshot:
+    """Binary COPY of one table, shared by every checkpoint with that content."""
+
+    table: str
+    data: bytes
+    refs: int = 0
+
+
+@dataclass
+class _SnapshotRecord:
+    """Everything needed to restore one checkpoint."""
+
+    key: str
+    tables: dict[str, str]  # table -> snapshot digest
+    sequences: list[tuple[str, int, bool]]  # (sequence, value, is_called)
+    savepoint: str | None = None  # savepoint holding exactly this state, if alive
+
+
+@dataclass
+class RollbackPlan:
+    """How a rollback will be carried out, as chosen by the cost model.
+
+    Attributes:
+        savepoint: Savepoint to ROLLBACK TO first (None = restore in place).
+        restore: Tables to truncate and reload from snapshots.
+        cost: Estimated cost in bytes-equivalent.
+    """
+
+    savepoint: str | None
+    restore: list[str] = field(default_factory=list)
+    cost: int = 0
+
+
+class PostgresSnapshotAdapter(PostgresAdapter):
+    """PostgreSQL adapter that can roll back to any checkpoint, in any order.
+
+    PostgresAdapter only supports DFS: ROLLBACK TO an early savepoint
+    destroys every savepoint taken after it. This adapter keeps, next to
+    each savepoint, a copy-on-write snapshot of the tracked tables
+    (``COPY ... TO STDOUT (FORMAT BINARY)``, deduplicated by content hash so
+    unchanged tables are shared between checkpoints) plus sequence values.
+    Tables whose modification counters (``pg_stat_xact_user_tables``) did not
+    move since the last checkpoint are not copied again.
+
+    On rollback a cost model picks the cheapest way to reach the target:
+
+    - ``ROLLBACK TO SAVEPOINT`` if the target's savepoint is still alive
+      (cost: ``savepoint_cost``);
+    - ``ROLLBACK TO`` the alive savepoint whose tables differ least from the
+      target, then reload the differing tables from their snapshots;
+    - reload the differing tables in place, without any savepoint rollback.
+
+    Reloading truncates the tables (plus any table referencing them by
+    foreign key) and COPYs the snapshot back in, parents first. A new
+    savepoint is then taken for the target, so the next rollback to it is a
+    plain ``ROLLBACK TO``. Sequences are always reset to their checkpointed
+    values, which keeps generated IDs (and therefore state IDs) stable.
+
+    Because it supports arbitrary rollback, this adapter works with BFS,
+    CoverageGuided and Weighted strategies (shortest reproduction paths).
+
+    Caveats:
+        - Checkpoints cost one COPY of every modified tracked table, so
+          restrict ``snapshot_tables`` on large schemas.
+        - Triggers on tracked tables fire during reloads.
+        - Application-issued TRUNCATE is not visible to the modification
+          counters; list such tables in ``always_copy_tables``.
+
+    Example::
+
+        db = PostgresSnapshotAdapter(
+            "postgresql://localhost/app_test",
+            observe_tables=["users", "orders"],
+        )
+        agent = Agent(world=World(api=api, systems={"db": db}), actions=actions,
+                      strategy=BFS())
+
+    Args:
+        connection_string: PostgreSQL connection string.
+        observe_tables: Tables to count rows for observation.
+        observe_queries: Custom SQL queries for observation.
+        snapshot_tables: Tables to snapshot (default: every base table in
+            the current schema).
+        always_copy_tables: Tables to copy at every checkpoint regardless of
+            modification counters.
+        savepoint_cost: Estimated cost of ROLLBACK TO SAVEPOINT, in bytes of
+            table data reloaded.
+        table_cost: Fixed per-table overhead of a reload, in bytes.
+    """
+
+    supports_arbitrary_rollback = True
+
+    def __init__(
+        self,
+        connection_string: str,
+        observe_tables: list[str] | None = None,
+        observe_queries: dict[str, str] | None = None,
+        snapshot_tables: list[str] | None = None,
+        always_copy_tables: list[str] | None = None,
+        savepoint_cost: int = 4096,
+        table_cost: int = 8192,
+    ) -> None:
+        super().__init__(connection_string, observe_tables, observe_queries)
+        self.snapshot_tables = snapshot_tables
+        self.always_copy_tables = set(always_copy_tables or [])
+        self.savepoint_cost = savepoint_cost
+        self.table_cost = table_cost
+
+        self._snapshots: dict[str, _TableSnapshot] = {}  # digest -> snapshot
+        self._records: dict[str, _SnapshotRecord] = {}
+        self._stack: list[str] = []  # alive savepoints, oldest first
+        self._savepoint_owner: dict[str, str] = {}  # savepoint -> record key
+        self._referenced_by: dict[str, set[str]] = {}
+        self._references: dict[str, set[str]] = {}
+        self._tables: list[str] | None = None
+
+        # Table digests known to match the live database, valid as long as
+        # the modification counters still equal _baseline.
+        self._current: dict[str, str] = {}
+        self._baseline: dict[str, int] = {}
+
+        self.rollback_stats: dict[str, int] = {
+            "savepoint": 0,
+            "restore": 0,
+            "tables_restored": 0,
+            "bytes_restored": 0,
+        }
+
+    # ---------------------------------------------------------------- Rollbackable
+
+    def checkpoint(self, name: str) -> SystemCheckpoint:
+        """Snapshot modified tables and sequences, then take a savepoint."""
+        if not self._conn:
+            self.connect()
+
+        counters = self._modification_counts()
+        tables: dict[str, str] = {}
+        for table in self._tracked_tables():
+            known = self._current.get(table)
+            unchanged = counters.get(table, 0) == self._baseline.get(table, -1)
+            if (
+                known in self._snapshots
+                and unchanged
+                and table not in self.always_copy_tables
+            ):
+                tables[table] = known
+            else:
+                tables[table] = self._capture(table)
+
+        self._savepoint_counter += 1
+        key = f"venom_{name}_{self._savepoint_counter}"
+        record = _SnapshotRecord(key=key, tables=tables, sequences=self._read_sequences())
+        for digest in tables.values():
+            self._snapshots[digest].refs += 1
+        self._records[key] = record
+        self._push_savepoint(record)
+
+        self._current = dict(tables)
+        self._baseline = counters
+        return key
+
+    def rollback(self, checkpoint: SystemCheckpoint) -> None:
+        """Restore any checkpoint using the cheapest plan."""
+        if not self._conn:
+            raise RuntimeError("Not connected")
+        record = self._records.get(checkpoint)
+        if record is None:
+            raise ValueError(f"Unknown or released checkpoint: {checkpoint}")
+
+        plan = self.plan_rollback(checkpoint)
+        with self._conn.cursor() as cur:
+            if plan.savepoint is not None:
+                cur.execute(
+                    sql.SQL("ROLLBACK TO SAVEPOINT {}").format(sql.Identifier(plan.savepoint))
+                )
+                self._discard_savepoints_after(plan.savepoint)
+                self.rollback_stats["savepoint"] += 1
+            if plan.restore:
+                self._restore(cur, plan.restore, record)
+            self._write_sequences(cur, record.sequences)
+
+        if plan.restore or plan.savepoint != record.savepoint:
+            # Re-establish a savepoint for the target so the next rollback
+            # to it is a plain ROLLBACK TO.
+            self._push_savepoint(record)
+        self._current = dict(record.tables)
+        self._baseline = self._modification_counts()
+
+    def release(self, checkpoint: SystemCheckpoint) -> None:
+        """Forget a checkpoint and free snapshots no other checkpoint shares.
+
+        The savepoint itself is left alone: RELEASE SAVEPOINT would also
+        destroy every later savepoint.
+        """
+        record = self._records.pop(checkpoint, None)
+        if record is None:
+            return
+        if record.savepoint is not None:
+            self._savepoint_owner.pop(record.savepoint, None)
+        for digest in record.tables.values():
+            snapshot = self._snapshots[digest]
+            snapshot.refs -= 1
+            if snapshot.refs == 0:
+                del self._snapshots[digest]
+
+    def checkpoint_size(self, checkpoint: SystemCheckpoint) -> int:
+        """Bytes of snapshot data attributable to a checkpoint (shared data split)."""
+        record = self._records.get(checkpoint)
+        if record is None:
+            return 0
+        total = 0
+        for digest in record.tables.values():
+            snapshot = self._snapshots[digest]
+            total += len(snapshot.data) // max(snapshot.refs, 1)
+        return total
+
+    # ---------------------------------------------------------------- cost model
+
+    def plan_rollback(self, checkpoint: SystemCheckpoint) -> RollbackPlan:
+        """Choose the cheapest way to reach a checkpoint.
+
+        Candidates are every alive savepoint that still belongs to a known
+        checkpoint, plus restoring in place from the current database.
+        """
+        target = self._records[checkpoint]
+        candidates: list[RollbackPlan] = []
+
+        for savepoint in self._stack:
+            owner = self._records.get(self._savepoint_owner.get(savepoint, ""))
+            if owner is None:
+                continue
+            restore = self._diff(owner.tables, target.tables)
+            candidates.append(RollbackPlan(
+                savepoint=savepoint,
+                restore=restore,
+                cost=self.savepoint_cost + self._restore_cost(restore, target),
+            ))
+
+        if not self._in_failed_transaction():
+            counters = self._modification_counts()
+            current = {
+                table: digest for table, digest in self._current.items()
+                if counters.get(table, 0) == self._baseline.get(table, -1)
+            }
+            restore = self._diff(current, target.tables)
+            candidates.append(RollbackPlan(
+                savepoint=None, restore=restore, cost=self._restore_cost(restore, target),
+            ))
+
+        if not candidates:
+            raise RuntimeError(
+                f"No way to reach checkpoint {checkpoint}: the transaction is aborted "
+                "and no savepoint is alive."
+            )
+        return min(candidates, key=lambda plan: plan.cost)
+
+    def _diff(self, have: dict[str, str], want: dict[str, str]) -> list[str]:
+        """Tables to reload (FK-closed) to turn ``have`` into ``want``."""
+        changed = {table for table, digest in want.items() if have.get(table) != digest}
+        return self._with_referencing(changed)
+
+    def _restore_cost(self, tables: list[str], target: _SnapshotRecord) -> int:
+        cost = 0
+        for table in tables:
+            snapshot = self._snapshots[target.tables[table]]
+            cost += self.table_cost + len(snapshot.data)
+        return cost
+
+    # ---------------------------------------------------------------- internals
+
+    def _push_savepoint(self, record: _SnapshotRecord) -> None:
+        self._savepoint_counter += 1
+        savepoint = f"venom_sp_{self._savepoint_counter}"
+        with self._conn.cursor() as cur:
+            cur.execute(sql.SQL("SAVEPOINT {}").format(sql.Identifier(savepoint)))
+        if record.savepoint is not None:
+            self._savepoint_owner.pop(record.savepoint, None)
+        record.savepoint = savepoint
+        self._stack.append(savepoint)
+        self._savepoint_owner[savepoint] = record.key
+
+    def _discard_savepoints_after(self, savepoint: str) -> None:
+        """Forget savepoints destroyed by ROLLBACK TO ``savepoint``."""
+        index = self._stack.index(savepoint)
+        for destroyed in self._stack[index + 1:]:
+            record = self._records.get(self._savepoint_owner.pop(destroyed, ""))
+            if record is not None:
+                record.savepoint = None
+        del self._stack[index + 1:]
+
+    def _in_failed_transaction(self) -> bool:
+        if not self._conn:
+            return False
+        from psycopg import pq
+
+        return self._conn.info.transaction_status == pq.TransactionStatus.INERROR
+
+    def _tracked_tables(self) -> list[str]:
+        if self._tables is None:
+            if self.snapshot_tables is not None:
+                self._tables = list(self.snapshot_tables)
+            else:
+                rows = self.execute(
+                    "SELECT table_name FROM information_schema.tables "
+                    "WHERE table_schema = current_schema() AND table_type = 'BASE TABLE' "
+                    "ORDER BY table_name"
+                )
+                self._tables = [row[0] for row in rows]
+            self._load_foreign_keys()
+        return self._tables
+
+    def _load_foreign_keys(self) -> None:
+        rows = self.execute(
+            "SELECT child.relname, parent.relname FROM pg_constraint c "
+            "JOIN pg_class child ON child.oid = c.conrelid "
+            "JOIN pg_class parent ON parent.oid = c.confrelid "
+            "JOIN pg_namespace n ON n.oid = child.relnamespace "
+            "WHERE c.contype = 'f' AND n.nspname = current_schema()"
+        )
+        for child, parent in rows:
+            if child == parent:
+                continue
+            self._referenced_by.setdefault(parent, set()).add(child)
+            self._references.setdefault(child, set()).add(parent)
+
+    def _with_referencing(self, tables: set[str]) -> list[str]:
+        """Close over FK children (TRUNCATE requires them) and order parents first.
+
+        Untracked children are left out, so TRUNCATE fails loudly rather than
+        wiping data that cannot be restored.
+        """
+        tracked = set(self._tracked_tables())
+        closed = set(tables)
+        stack = list(tables)
+        while stack:
+            for child in self._referenced_by.get(stack.pop(), ()):
+                if child in tracked and child not in closed:
+                    closed.add(child)
+                    stack.append(child)
+
+        ordered: list[str] = []
+        visiting: set[str] = set()
+
+        def visit(table: str) -> None:
+            if table in visiting or table in ordered:
+                return  # cycles: any order; COPY will surface real violations
+            visiting.add(table)
+            for parent in sorted(self._references.get(table, ())):
+                if parent in closed:
+                    visit(parent)
+            visiting.discard(table)
+            ordered.append(table)
+
+        for table in sorted(closed):
+            visit(table)
+        return ordered
+
+    def _modification_counts(self) -> dict[str, int]:
+        rows = self.execute(
+            "SELECT relname, n_tup_ins + n_tup_upd + n_tup_del "
+            "FROM pg_stat_xact_user_tables WHERE schemaname = current_schema()"
+        )
+        counts = dict.fromkeys(self._tracked_tables(), 0)
+        counts.update((name, int(count)) for name, count in rows if name in counts)
+        return counts
+
+    def _capture(self, table: str) -> str:
+        """COPY a table out and store it under its content digest."""
+        query = sql.SQL("COPY {} TO STDOUT (FORMAT BINARY)").format(sql.Identifier(table))
+        with self._conn.cursor() as cur, cur.copy(query) as copy:
+            data = b"".join(bytes(chunk) for chunk in copy)
+        digest = f"{table}:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+        if digest not in self._snapshots:
+            self._snapshots[digest] = _TableSnapshot(table=table, data=data)
+        return digest
+
+    def _restore(self, cur: Any, tables: list[str], record: _SnapshotRecord) -> None:
+        cur.execute(
+            sql.SQL("TRUNCATE {}").format(sql.SQL(", ").join(sql.Identifier(t) for t in tables))
+        )
+        for table in tables:
+            snapshot = self._snapshots[record.tables[table]]
+            query = sql.SQL("COPY {} FROM STDIN (FORMAT BINARY)").format(sql.Identifier(table))
+            with cur.copy(query) as copy:
+                copy.write(snapshot.data)
+            self.rollback_stats["bytes_restored"] += len(snapshot.data)
+        self.rollback_stats["restore"] += 1
+        self.rollback_stats["tables_restored"] += len(tables)
+
+    def _read_sequences(self) -> list[tuple[str, int, bool]]:
+        rows = self.execute(
+            "SELECT sequencename, COALESCE(last_value, start_value), last_value IS NOT NULL "
+            "FROM pg_sequences WHERE schemaname = current_schema()"
+        )
+        return [(name, int(value), bool(called)) for name, value, called in rows]
+
+    def _write_sequences(self, cur: Any, sequences: list[tuple[str, int, bool]]) -> None:
+        # setval() is not transactional, so savepoint rollbacks need it too.
+        for name, value, called in sequences:
+            cur.execute("SELECT setval(%s::regclass, %s, %s)", (f'"{name}"', value, called))
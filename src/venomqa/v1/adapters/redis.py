@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import fnmatch
+import time
+import uuid
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
+# Seconds to wait for our own sync marker before giving up on a drain
+_SYNC_TIMEOUT = 5.0
+
+
+def _decode(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
 
 class RedisAdapter:
     """Redis adapter using key dump/restore for checkpoint/rollback.
@@ -16,6 +27,18 @@ class RedisAdapter:
     - checkpoint(): Dumps all tracked keys
     - rollback(): Restores keys from dump
     - observe(): Gets values of tracked keys
+
+    Keys are enumerated with SCAN (never the blocking KEYS), and the
+    per-key DUMP/PTTL, TYPE/read and RESTORE commands are sent in pipelines
+    of ``batch_size`` commands; rollback runs as one MULTI/EXEC transaction.
+
+    With ``track_dirty=True`` the adapter subscribes to keyspace
+    notifications and only re-dumps, re-reads and restores keys that
+    changed since the last checkpoint or rollback. Notifications are enabled
+    with CONFIG SET when the server allows it, and close() restores the
+    previous setting; a probe key verifies they arrive, otherwise the
+    adapter falls back to full scans. Commands that do not emit keyspace
+    events (FLUSHDB, FLUSHALL) are not seen by tracking.
     """
 
     def __init__(
@@ -23,11 +46,35 @@ class RedisAdapter:
         url: str = "redis://localhost:6379",
         track_keys: list[str] | None = None,
         track_patterns: list[str] | None = None,
+        scan_count: int = 1000,
+        batch_size: int = 1000,
+        track_dirty: bool = False,
     ) -> None:
         self.url = url
         self.track_keys = track_keys or []
         self.track_patterns = track_patterns or ["*"]
+        self.scan_count = scan_count
+        self.batch_size = batch_size
+        self.track_dirty = track_dirty
         self._client: Any = None
+        self._pubsub: Any = None
+        self._sync_channel = f"venomqa:sync:{uuid.uuid4().hex}"
+        # Dirty tracking state. _base is the dump of the tracked keyspace as
+        # of the last checkpoint/rollback, _values the last observed values;
+        # None means "unknown, do a full scan".
+        self._base: dict[str, tuple[bytes, int]] | None = None
+        self._values: dict[str, Any] | None = None
+        self._dirty_dump: set[str] = set()
+        self._dirty_values: set[str] = set()
+        # Set when the probe showed notifications do not arrive
+        self._tracking_unavailable = False
+        # Server's notify-keyspace-events before we changed it; restored by close()
+        self._saved_notify_events: str | None = None
+
+    @property
+    def dirty_tracking_active(self) -> bool:
+        """Whether keyspace notifications are being used."""
+        return self._pubsub is not None
 
     def connect(self) -> None:
         """Connect to Redis."""
@@ -36,83 +83,249 @@ class RedisAdapter:
             self._client = redis.from_url(self.url)
         except ImportError:
             raise ImportError("redis is required for RedisAdapter")
+        self._tracking_unavailable = False
 
     def close(self) -> None:
         """Close the connection."""
+        self._stop_dirty_tracking()
+        self._restore_notify_events()
         if self._client:
             self._client.close()
             self._client = None
 
+    @property
+    def client(self) -> Any:
+        if not self._client:
+            self.connect()
+        return self._client
+
+    # ── Key enumeration and batching ───────────────────────────────────────
+
     def _get_tracked_keys(self) -> list[str]:
-        """Get all keys matching tracked patterns."""
+        """Get all keys matching tracked patterns, using SCAN."""
         keys = set(self.track_keys)
         for pattern in self.track_patterns:
-            keys.update(self._client.keys(pattern))
+            for key in self.client.scan_iter(match=pattern, count=self.scan_count):
+                keys.add(_decode(key))
         return list(keys)
 
-    def checkpoint(self, name: str) -> SystemCheckpoint:
-        """Dump all tracked keys."""
-        if not self._client:
-            self.connect()
+    def _is_tracked(self, key: str) -> bool:
+        return key in self.track_keys or any(
+            fnmatch.fnmatchcase(key, pattern) for pattern in self.track_patterns
+        )
 
+    def _batched(self, keys: list[str], queue: Any, transaction: bool = False) -> list[Any]:
+        """Run queue(pipeline, key) for every key in pipelines of batch_size keys."""
+        results: list[Any] = []
+        for start in range(0, len(keys), self.batch_size):
+            pipe = self.client.pipeline(transaction=transaction)
+            for key in keys[start:start + self.batch_size]:
+                queue(pipe, key)
+            results.extend(pipe.execute())
+        return results
+
+    def _dump_keys(self, keys: list[str]) -> dict[str, tuple[bytes, int]]:
+        """DUMP + PTTL for keys; missing keys are left out."""
+        results = self._batched(keys, lambda pipe, key: (pipe.dump(key), pipe.pttl(key)))
         dump: dict[str, tuple[bytes, int]] = {}
-        for key in self._get_tracked_keys():
-            if isinstance(key, bytes):
-                key = key.decode()
-            data = self._client.dump(key)
+        for index, key in enumerate(keys):
+            data, ttl = results[2 * index], results[2 * index + 1]
             if data:
-                ttl = self._client.pttl(key)
                 dump[key] = (data, ttl if ttl > 0 else 0)
+        return dump
+
+    def _read_values(self, keys: list[str]) -> dict[str, Any]:
+        """Current values of keys (string, list, set and hash keys only)."""
+        types = [_decode(t) for t in self._batched(keys, lambda pipe, key: pipe.type(key))]
+        readers = {
+            "string": lambda pipe, key: pipe.get(key),
+            "list": lambda pipe, key: pipe.lrange(key, 0, -1),
+            "set": lambda pipe, key: pipe.smembers(key),
+            "hash": lambda pipe, key: pipe.hgetall(key),
+        }
+        readable = [(key, t) for key, t in zip(keys, types, strict=True) if t in readers]
+        kinds = dict(readable)
+        values = self._batched(
+            [key for key, _ in readable], lambda pipe, key: readers[kinds[key]](pipe, key)
+        )
+        data: dict[str, Any] = {}
+        for (key, key_type), value in zip(readable, values, strict=True):
+            data[key] = list(value) if key_type == "set" else value
+        return data
+
+    # ── Rollbackable protocol ──────────────────────────────────────────────
+
+    def checkpoint(self, name: str) -> SystemCheckpoint:
+        """Dump all tracked keys."""
+        if self._sync_dirty() and self._base is not None:
+            dirty = sorted(k for k in self._dirty_dump if self._is_tracked(k))
+            dump = dict(self._base)
+            for key in dirty:
+                dump.pop(key, None)
+            dump.update(self._dump_keys(dirty))
+            # Reused entries keep their dump, but remaining TTLs moved on
+            expiring = [k for k, (_, ttl) in dump.items() if ttl and k not in self._dirty_dump]
+            ttls = self._batched(expiring, lambda p, k: p.pttl(k))
+            for key, ttl in zip(expiring, ttls, strict=True):
+                dump[key] = (dump[key][0], ttl if ttl > 0 else 0)
+        else:
+            dump = self._dump_keys(self._get_tracked_keys())
 
+        self._dirty_dump.clear()
+        self._base = dump
         return dump
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Restore keys from dump."""
-        if not self._client:
-            self.connect()
-
         dump: dict[str, tuple[bytes, int]] = checkpoint
 
-        # Delete current keys
-        current_keys = self._get_tracked_keys()
-        if current_keys:
-            self._client.delete(*current_keys)
+        if self._sync_dirty() and self._base is not None:
+            base = self._base
+            changed = {k for k in self._dirty_dump if self._is_tracked(k)}
+            changed.update(k for k in base.keys() | dump.keys() if base.get(k) is not dump.get(k))
+            stale = [k for k in changed if k not in dump]
+            restore = [k for k in changed if k in dump]
+        else:
+            stale = [k for k in self._get_tracked_keys() if k not in dump]
+            restore = list(dump)
+            changed = None
+
+        pipe = self.client.pipeline(transaction=True)
+        if stale:
+            pipe.delete(*stale)
+        for key in restore:
+            data, ttl = dump[key]
+            pipe.restore(key, ttl, data, replace=True)
+        pipe.execute()
 
-        # Restore from dump
-        for key, (data, ttl) in dump.items():
-            self._client.restore(key, ttl, data, replace=True)
+        self._dirty_dump.clear()
+        self._base = dump
+        if changed is None:
+            self._values = None
+        else:
+            self._dirty_values.update(changed)
 
     def observe(self) -> Observation:
         """Get current state of tracked keys."""
-        if not self._client:
-            self.connect()
-
-        data: dict[str, Any] = {}
-        for key in self._get_tracked_keys():
-            if isinstance(key, bytes):
-                key = key.decode()
-            key_type = self._client.type(key)
-            if isinstance(key_type, bytes):
-                key_type = key_type.decode()
-
-            if key_type == "string":
-                data[key] = self._client.get(key)
-            elif key_type == "list":
-                data[key] = self._client.lrange(key, 0, -1)
-            elif key_type == "set":
-                data[key] = list(self._client.smembers(key))
-            elif key_type == "hash":
-                data[key] = self._client.hgetall(key)
+        if self._sync_dirty() and self._values is not None:
+            dirty = [k for k in self._dirty_values if self._is_tracked(k)]
+            data = {k: v for k, v in self._values.items() if k not in self._dirty_values}
+            data.update(self._read_values(dirty))
+        else:
+            data = self._read_values(self._get_tracked_keys())
+        self._dirty_values.clear()
+        if self.dirty_tracking_active:
+            self._values = data
 
         return Observation(
             system="cache",
-            data=data,
+            data=dict(data),
             observed_at=datetime.now(),
         )
 
+    # ── Dirty tracking ─────────────────────────────────────────────────────
+
+    def _sync_dirty(self) -> bool:
+        """Bring the dirty sets up to date.
+
+        Returns False when tracking is off or cached state cannot be
+        trusted; callers then do a full scan.
+        """
+        if self.track_dirty and self._pubsub is None and not self._tracking_unavailable:
+            # (Re)subscribe before the caller's full scan so that no write
+            # after the scan goes unnoticed
+            self._start_dirty_tracking()
+        return self._drain_notifications()
+
+    def _start_dirty_tracking(self) -> None:
+        client = self.client
+        try:
+            config = client.config_get("notify-keyspace-events")
+            current = _decode(config.get("notify-keyspace-events", ""))
+            flags = set(current)
+            if not {"K", "A"} <= flags:
+                client.config_set("notify-keyspace-events", "".join(sorted(flags | {"K", "A"})))
+                if self._saved_notify_events is None:
+                    self._saved_notify_events = current
+        except Exception:
+            pass  # CONFIG may be disabled; the probe below decides
+        db = client.connection_pool.connection_kwargs.get("db", 0)
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.psubscribe(f"__keyspace@{db}__:*")
+        self._pubsub.subscribe(self._sync_channel)
+
+        probe = f"venomqa:probe:{uuid.uuid4().hex}"
+        client.set(probe, 1, px=1000)
+        client.delete(probe)
+        seen = self._drain_notifications() and probe in self._dirty_dump
+        self._dirty_dump.clear()
+        self._dirty_values.clear()
+        if not seen:
+            self._stop_dirty_tracking()
+            self._tracking_unavailable = True
+
+    def _restore_notify_events(self) -> None:
+        """Put back the server's notify-keyspace-events if we changed it."""
+        if self._saved_notify_events is None or self._client is None:
+            return
+        try:
+            self._client.config_set("notify-keyspace-events", self._saved_notify_events)
+        except Exception:
+            pass  # Connection already gone; nothing more we can do
+        self._saved_notify_events = None
+
+    def _stop_dirty_tracking(self) -> None:
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._base = None
+        self._values = None
+
+    def _drain_notifications(self) -> bool:
+        """Collect keys changed since the last drain into the dirty sets.
+
+        Publishes a marker on a private channel and reads notifications
+        until it comes back, so every write the server processed before the
+        call is accounted for. Returns False if tracking is off or the
+        subscription was lost (callers then do a full scan).
+        """
+        if self._pubsub is None:
+            return False
+        token = uuid.uuid4().hex
+        try:
+            self.client.publish(self._sync_channel, token)
+            for message in self._messages():
+                channel = _decode(message["channel"])
+                if channel == self._sync_channel:
+                    if _decode(message["data"]) == token:
+                        return True
+                    continue
+                key = channel.split(":", 1)[1]
+                self._dirty_dump.add(key)
+                self._dirty_values.add(key)
+        except Exception:
+            pass
+        # Notifications may have been lost: forget cached state; the next
+        # call resubscribes
+        self._stop_dirty_tracking()
+        self._dirty_dump.clear()
+        self._dirty_values.clear()
+        return False
+
+    def _messages(self) -> Iterator[dict[str, Any]]:
+        deadline = time.monotonic() + _SYNC_TIMEOUT
+        while time.monotonic() < deadline:
+            message = self._pubsub.get_message(timeout=0.1)
+            if message is not None:
+                yield message
+
     def __enter__(self) -> RedisAdapter:
         self.connect()
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.close()
+
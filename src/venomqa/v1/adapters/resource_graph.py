@@ -6,15 +6,23 @@ enabling typed resource tracking with auto-cascade deletes.
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from venomqa.sandbox.canonical import Normalizer
+from venomqa.sandbox.persistent import PMap
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import Rollbackable, SystemCheckpoint
 
 if TYPE_CHECKING:
     pass
 
+# The alive-set digest is a sum of 128-bit entry hashes modulo 2**128
+_DIGEST_MASK = (1 << 128) - 1
+
 
 @dataclass
 class ResourceType:
@@ -63,10 +71,41 @@ class Resource:
 
 
 @dataclass
-class ResourceSnapshot(SystemCheckpoint):
-    """Snapshot of ResourceGraph state for rollback."""
+class ResourceSnapshot:
+    """Snapshot of ResourceGraph state for rollback.
+
+    The maps are persistent and shared with the graph and with other
+    snapshots; they must be treated as read-only.
+    """
+
+    resources: PMap[tuple[str, str], Resource] = field(default_factory=PMap)
+    # Parent key -> {child key: True}
+    children: PMap[tuple[str, str], PMap[tuple[str, str], bool]] = field(default_factory=PMap)
+    # Alive key -> (observation entry, entry hash)
+    alive: PMap[tuple[str, str], tuple[dict[str, Any], int]] = field(default_factory=PMap)
+    digest: int = 0
+    # Observation of the snapshotted state, reused after rollback
+    observation: Observation | None = None
+
+
+def _key_of(resource: Resource | None) -> tuple[str, str] | None:
+    return (resource.type, resource.id) if resource is not None else None
 
-    resources: dict[tuple[str, str], Resource] = field(default_factory=dict)
+
+def _alive_entry(resource: Resource) -> tuple[dict[str, Any], int]:
+    """Observation entry for an alive resource and its 128-bit hash."""
+    parent = resource.parent
+    entry = {
+        "type": resource.type,
+        "id": resource.id,
+        "parent_type": parent.type if parent else None,
+        "parent_id": parent.id if parent else None,
+        "alive": True,
+    }
+    encoded = json.dumps(
+        [entry["type"], entry["id"], entry["parent_type"], entry["parent_id"]], default=str
+    ).encode()
+    return entry, int.from_bytes(hashlib.sha256(encoded).digest()[:16], "big")
 
 
 class ResourceGraph(Rollbackable):
@@ -75,11 +114,60 @@ class ResourceGraph(Rollbackable):
     Tracks what resources exist and their relationships.
     Auto-cascades deletes to children.
     Integrates with VenomQA World via Rollbackable protocol.
+
+    Resources are kept in persistent maps (see venomqa.sandbox.persistent),
+    so checkpoint and rollback are O(1) plus the resources handed out since
+    the last rollback. Like Context values, Resource objects are shared with
+    checkpoints until first accessed; get() and friends return a private
+    copy. The alive count and a digest of the alive set are maintained
+    incrementally, so observe() does not re-encode every resource.
     """
 
     def __init__(self, schema: ResourceSchema | None = None) -> None:
         self.schema = schema or ResourceSchema()
-        self._resources: dict[tuple[str, str], Resource] = {}
+        self._resources: PMap[tuple[str, str], Resource] = PMap()
+        self._children: PMap[tuple[str, str], PMap[tuple[str, str], bool]] = PMap()
+        self._alive: PMap[tuple[str, str], tuple[dict[str, Any], int]] = PMap()
+        self._digest = 0
+        # Keys whose Resource object belongs to the live graph only (created
+        # or handed out since the last rollback); all others are shared with
+        # snapshots and copied before they are returned or changed
+        self._owned: set[tuple[str, str]] = set()
+        # Last checkpoint, reused while nothing is owned
+        self._snapshot: ResourceSnapshot | None = None
+        # Last observation, reused until the graph changes so its content
+        # hash is not recomputed for unchanged steps
+        self._observation: Observation | None = None
+
+    def _own(self, key: tuple[str, str]) -> Resource | None:
+        """The live graph's private Resource for key (copied if shared)."""
+        resource = self._resources.get(key)
+        if resource is None or key in self._owned:
+            return resource
+        parent_key = _key_of(resource.parent)
+        copied = Resource(
+            type=resource.type,
+            id=resource.id,
+            parent=self._own(parent_key) if parent_key else None,
+            data=resource.data.copy(),
+            alive=resource.alive,
+        )
+        self._resources = self._resources.set(key, copied)
+        self._owned.add(key)
+        self._snapshot = None
+        return copied
+
+    def _set_alive(self, key: tuple[str, str], resource: Resource | None) -> None:
+        """Update the alive index and digest for key (resource None = dead)."""
+        old = self._alive.get(key)
+        if old is not None:
+            self._alive = self._alive.delete(key)
+            self._digest = (self._digest - old[1]) & _DIGEST_MASK
+        if resource is not None:
+            entry = _alive_entry(resource)
+            self._alive = self._alive.set(key, entry)
+            self._digest = (self._digest + entry[1]) & _DIGEST_MASK
+        self._observation = None
 
     def create(
         self,
@@ -112,7 +200,18 @@ class ResourceGraph(Rollbackable):
             data=data or {},
             alive=True,
         )
-        self._resources[(type, id)] = resource
+        key = (type, id)
+        old_parent_key = _key_of(self._resources[key].parent) if key in self._resources else None
+        parent_key = _key_of(parent)
+        if old_parent_key is not None and old_parent_key != parent_key:
+            siblings = self._children[old_parent_key].discard(key)
+            self._children = self._children.set(old_parent_key, siblings)
+        if parent_key is not None:
+            self._children = self._children.set_in((parent_key, key), True)
+        self._resources = self._resources.set(key, resource)
+        self._owned.add(key)
+        self._snapshot = None
+        self._set_alive(key, resource)
         return resource
 
     def destroy(self, type: str, id: str) -> None:
@@ -122,33 +221,37 @@ class ResourceGraph(Rollbackable):
             type: Resource type name
             id: Resource ID
         """
-        resource = self._resources.get((type, id))
+        key = (type, id)
+        resource = self._own(key)
         if resource:
             resource.alive = False
+            if key in self._alive:
+                self._set_alive(key, None)
             # Cascade to children
-            for _, child in self._resources.items():
-                if child.parent is resource and child.alive:
-                    self.destroy(child.type, child.id)
+            for child_key in self._children.get(key, ()):
+                if child_key in self._alive:
+                    self.destroy(*child_key)
 
     def get(self, type: str, id: str) -> Resource | None:
         """Get a resource by type and ID."""
-        return self._resources.get((type, id))
+        return self._own((type, id))
 
     def exists(self, type: str, id: str) -> bool:
         """Check if a resource exists and is alive."""
-        resource = self._resources.get((type, id))
-        return resource is not None and resource.alive
+        return (type, id) in self._alive
 
     def get_children(self, type: str, id: str) -> list[Resource]:
         """Get all alive children of a resource."""
-        resource = self.get(type, id)
-        if not resource:
+        key = (type, id)
+        if key not in self._resources:
             return []
         return [
-            r for r in self._resources.values() if r.parent is resource and r.alive
+            self._own(child_key)  # type: ignore[misc]
+            for child_key in self._children.get(key, ())
+            if child_key in self._alive
         ]
 
-    def can_execute(self, requires: list[str], bindings: dict[str, str]) -> bool:
+    def can_execute(self, requires: list[str], bindings: Mapping[str, str]) -> bool:
         """Check if all required resources exist.
 
         Args:
@@ -168,63 +271,74 @@ class ResourceGraph(Rollbackable):
     # ── Rollbackable protocol ──────────────────────────────────────────────
 
     def observe(self) -> Observation:
-        """Get current state as an Observation."""
+        """Get current state as an Observation.
+
+        The content hash comes from the incrementally maintained digest of
+        the alive resources instead of re-encoding the resource list.
+        """
+        if self._observation is not None:
+            return self._observation
         data = {
-            "resources": [
-                {
-                    "type": r.type,
-                    "id": r.id,
-                    "parent_type": r.parent.type if r.parent else None,
-                    "parent_id": r.parent.id if r.parent else None,
-                    "alive": r.alive,
-                }
-                for r in self._resources.values()
-                if r.alive
-            ],
-            "count": sum(1 for r in self._resources.values() if r.alive),
+            "resources": [entry for entry, _ in self._alive.values()],
+            "count": len(self._alive),
         }
-        return Observation(system="resources", data=data)
+        self._observation = Observation.with_digest(
+            "resources", data, f"{self._digest:032x}"
+        )
+        return self._observation
+
+    def normalizer(self) -> Normalizer:
+        """Built-in normalizer: resource order and generated IDs do not matter.
+
+        Used by ``World(canonicalize=True)``; two graphs holding the same
+        resources under different IDs get the same state ID.
+        """
+        return Normalizer(sort_lists=["resources"], ordinal_ids=["id", "parent_id"])
 
     def checkpoint(self, name: str) -> ResourceSnapshot:
-        """Create a checkpoint of current state."""
-        # Deep copy resources
-        copied = {}
-        for key, resource in self._resources.items():
-            copied[key] = Resource(
-                type=resource.type,
-                id=resource.id,
-                parent=None,  # Will fix parent refs after
-                data=resource.data.copy(),
-                alive=resource.alive,
-            )
-        # Fix parent references
-        for key, resource in self._resources.items():
-            if resource.parent:
-                parent_key = (resource.parent.type, resource.parent.id)
-                copied[key].parent = copied.get(parent_key)
+        """Create a checkpoint of current state.
 
-        return ResourceSnapshot(resources=copied)
+        Shares the persistent maps; only Resource objects owned by the live
+        graph are copied, so later changes to them do not leak into the
+        snapshot.
+        """
+        if self._snapshot is None or self._owned:
+            copies = {
+                key: Resource(
+                    type=resource.type,
+                    id=resource.id,
+                    parent=resource.parent,
+                    data=resource.data.copy(),
+                    alive=resource.alive,
+                )
+                for key in self._owned
+                if (resource := self._resources.get(key)) is not None
+            }
+            for copied in copies.values():
+                parent_key = _key_of(copied.parent)
+                if parent_key in copies:
+                    copied.parent = copies[parent_key]
+            self._snapshot = ResourceSnapshot(
+                resources=self._resources.update(copies),
+                children=self._children,
+                alive=self._alive,
+                digest=self._digest,
+                observation=self.observe(),
+            )
+        return self._snapshot
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Rollback to a previous checkpoint."""
         if not isinstance(checkpoint, ResourceSnapshot):
             raise TypeError(f"Expected ResourceSnapshot, got {type(checkpoint)}")
 
-        # Deep copy from snapshot
-        self._resources = {}
-        for key, resource in checkpoint.resources.items():
-            self._resources[key] = Resource(
-                type=resource.type,
-                id=resource.id,
-                parent=None,
-                data=resource.data.copy(),
-                alive=resource.alive,
-            )
-        # Fix parent references
-        for key, resource in checkpoint.resources.items():
-            if resource.parent:
-                parent_key = (resource.parent.type, resource.parent.id)
-                self._resources[key].parent = self._resources.get(parent_key)
+        self._resources = checkpoint.resources
+        self._children = checkpoint.children
+        self._alive = checkpoint.alive
+        self._digest = checkpoint.digest
+        self._owned = set()
+        self._snapshot = checkpoint
+        self._observation = checkpoint.observation
 
     # ── Convenience methods ────────────────────────────────────────────────
 
@@ -239,12 +353,18 @@ class ResourceGraph(Rollbackable):
 
     def clear(self) -> None:
         """Clear all resources."""
-        self._resources.clear()
+        self._resources = PMap()
+        self._children = PMap()
+        self._alive = PMap()
+        self._digest = 0
+        self._owned.clear()
+        self._snapshot = None
+        self._observation = None
 
     @property
     def alive_count(self) -> int:
         """Count of alive resources."""
-        return sum(1 for r in self._resources.values() if r.alive)
+        return len(self._alive)
 
 
 def schema_from_openapi(spec: dict[str, Any]) -> ResourceSchema:
@@ -0,0 +1,60 @@
+"""Helpers for single-round-trip observation in SQL adapters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ObserveStats:
+    """Latency of an adapter's observe() calls, in milliseconds.
+
+    Attributes:
+        calls: Number of observe() calls measured.
+        total_ms: Sum of all observe() latencies.
+        last_ms: Latency of the most recent call.
+        max_ms: Slowest call seen.
+    """
+
+    calls: int = 0
+    total_ms: float = 0.0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Add one measured call."""
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        """Average latency per call."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Rounded figures for reports."""
+        return {
+            "calls": self.calls,
+            "mean_ms": round(self.mean_ms, 3),
+            "last_ms": round(self.last_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+def scalar_subquery(query: str) -> str:
+    """Wrap a single-value query so it can be one column of a batched SELECT.
+
+    ``LIMIT 1`` keeps the per-query semantics of ``fetchone()[0]`` when the
+    query happens to return several rows.
+    """
+    return f"SELECT * FROM ({query.strip().rstrip(';')}) AS venom_q LIMIT 1"
+
+
+def batched_select(expressions: list[str]) -> str:
+    """Compile scalar expressions into one statement returning a single row."""
+    return "SELECT " + ", ".join(f"({expr})" for expr in expressions)
+
+
+__all__ = ["ObserveStats", "batched_select", "scalar_subquery"]
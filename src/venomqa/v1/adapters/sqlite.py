@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import sqlite3
+import struct
 import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from venomqa.v1.adapters.sql_observe import ObserveStats, batched_select
 from venomqa.v1.core.state import Observation
 from venomqa.v1.world.rollbackable import SystemCheckpoint
 
@@ -23,6 +29,104 @@ def _quote_identifier(name: str) -> str:
     return f'"{escaped}"'
 
 
+SNAPSHOT_MODES = ("file", "pages")
+
+# SQLite WAL file layout: 32-byte header, then frames of a 24-byte header
+# followed by one page. Only the fields read here are unpacked.
+_WAL_MAGIC = (0x377F0682, 0x377F0683)
+_WAL_HEADER = struct.Struct(">6I")  # magic, version, page size, ckpt seq, salt-1, salt-2
+_WAL_HEADER_SIZE = 32
+_WAL_FRAME = struct.Struct(">4I")  # page number, db size after commit, salt-1, salt-2
+_WAL_FRAME_HEADER_SIZE = 24
+
+
+@dataclass
+class _PageSnapshot:
+    """One page-mode checkpoint: the database image as a list of pages."""
+
+    pages: list[bytes]
+    # Bytes of the pages this snapshot introduced (not shared with the
+    # snapshot it was diffed against)
+    new_bytes: int
+
+
+class _PageStore:
+    """Reference-counted pages shared between page-mode snapshots.
+
+    Unchanged pages are the same bytes object in every snapshot, so memory
+    grows with the pages each step modifies, not with the database size.
+    """
+
+    def __init__(self) -> None:
+        # id(page) -> [page, refcount]
+        self._entries: dict[int, list[Any]] = {}
+        self.total_bytes = 0
+
+    def retain(self, pages: list[bytes]) -> None:
+        for page in pages:
+            entry = self._entries.get(id(page))
+            if entry is None:
+                self._entries[id(page)] = [page, 1]
+                self.total_bytes += len(page)
+            else:
+                entry[1] += 1
+
+    def release(self, pages: list[bytes]) -> None:
+        for page in pages:
+            entry = self._entries[id(page)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._entries[id(page)]
+                self.total_bytes -= len(page)
+
+
+def _split_pages(
+    image: bytes, page_size: int, base: list[bytes]
+) -> tuple[list[bytes], int]:
+    """Cut a database image into pages, reusing equal pages from base.
+
+    Returns the page list and the number of bytes in pages not taken from base.
+    """
+    pages: list[bytes] = []
+    new_bytes = 0
+    for index, offset in enumerate(range(0, len(image), page_size)):
+        # Slicing bytes and comparing is much faster than memoryview compares
+        page = image[offset:offset + page_size]
+        if index < len(base) and page == base[index]:
+            pages.append(base[index])
+        else:
+            pages.append(page)
+            new_bytes += len(page)
+    return pages, new_bytes
+
+
+def _apply_changes(
+    base: list[bytes], changes: dict[int, bytes], db_pages: int
+) -> tuple[list[bytes], int] | None:
+    """Base pages with changed pages replaced, resized to db_pages.
+
+    Returns None if the database grew by pages the WAL does not contain.
+    """
+    pages = base[:db_pages]
+    new_bytes = 0
+    for index in sorted(changes):
+        if index >= db_pages:
+            continue
+        page = changes[index]
+        if index < len(pages):
+            if page == pages[index]:
+                continue
+            pages[index] = page
+        elif index == len(pages):
+            pages.append(page)
+        else:
+            return None
+        new_bytes += len(page)
+    if len(pages) != db_pages:
+        return None
+    return pages, new_bytes
+
+
 class SQLiteAdapter:
     """SQLite adapter using file copy for checkpoint/rollback.
 
@@ -31,29 +135,75 @@ class SQLiteAdapter:
     slower for large databases.
 
     For in-memory databases (:memory:), we use sqlite3's backup API.
+
+    With ``snapshot_mode="pages"`` checkpoints are kept in memory as lists
+    of database pages instead. Each checkpoint is diffed page by page
+    against the previous checkpoint (or the rollback target), and unchanged
+    pages are shared, so a step that touches a few rows stores a few pages.
+    Rollback writes back only the pages that differ from the current file
+    (file databases) or deserializes the image (``:memory:``, no reconnect).
+    ``snapshot_budget_bytes`` caps the memory held by page snapshots; over
+    budget, the least recently used snapshots are dropped and rolling back
+    to one of them raises ValueError (the agent then replays instead).
     """
 
     def __init__(
         self,
         database_path: str,
         observe_tables: list[str] | None = None,
+        snapshot_mode: str = "file",
+        snapshot_budget_bytes: int | None = None,
     ) -> None:
         """Initialize the SQLite adapter.
 
         Args:
             database_path: Path to SQLite database file, or ":memory:"
             observe_tables: Tables to include in observations
+            snapshot_mode: "file" (copy the whole database per checkpoint)
+                or "pages" (in-memory, page-level incremental snapshots)
+            snapshot_budget_bytes: Maximum bytes held by page snapshots
+                (None = unlimited). Only used in "pages" mode.
         """
+        if snapshot_mode not in SNAPSHOT_MODES:
+            raise ValueError(
+                f"snapshot_mode must be one of {SNAPSHOT_MODES}, got {snapshot_mode!r}"
+            )
+        if snapshot_budget_bytes is not None and snapshot_budget_bytes < 0:
+            raise ValueError(f"snapshot_budget_bytes must be >= 0, got {snapshot_budget_bytes}")
         self.database_path = database_path
         self.observe_tables = observe_tables or []
+        self.snapshot_mode = snapshot_mode
+        self.snapshot_budget_bytes = snapshot_budget_bytes
         self._conn: sqlite3.Connection | None = None
         self._is_memory = database_path == ":memory:"
+        if snapshot_mode == "pages" and self._is_memory and not hasattr(
+            sqlite3.Connection, "serialize"
+        ):
+            raise ValueError('snapshot_mode="pages" for :memory: requires Python 3.11+')
         self._temp_dir = tempfile.mkdtemp(prefix="venomqa_sqlite_")
+        # Page mode: checkpoint id -> snapshot, in least-recently-used order
+        self._page_snapshots: OrderedDict[str, _PageSnapshot] = OrderedDict()
+        self._page_store = _PageStore()
+        # Pages of the last checkpoint or rollback target; new checkpoints
+        # are diffed against it
+        self._base_pages: list[bytes] = []
+        self._page_size = 4096
+        # (mtime_ns, size) of the main file right after the WAL was folded
+        # into it; if it changes, someone else checkpointed and the WAL no
+        # longer lists every changed page
+        self._file_stat: tuple[int, int] | None = None
+        self._snapshot_counter = 0
+        self.evicted_snapshots = 0
+        self._observe_sql: tuple[tuple[str, ...], str] | None = None
+        self.observe_stats = ObserveStats()
 
     def connect(self) -> None:
         """Connect to the database."""
         self._conn = sqlite3.connect(self.database_path)
         self._conn.row_factory = sqlite3.Row
+        if self.snapshot_mode == "pages" and not self._is_memory:
+            # Page snapshots read changed pages from the WAL
+            self._conn.execute("PRAGMA journal_mode=WAL")
 
     def close(self) -> None:
         """Close the connection."""
@@ -72,7 +222,11 @@ class SQLiteAdapter:
 
         For file-based databases: copy the file
         For in-memory databases: use backup API to temp file
+        In "pages" mode: store only the pages changed since the last snapshot
         """
+        if self.snapshot_mode == "pages":
+            return self._page_checkpoint(name)
+
         checkpoint_path = Path(self._temp_dir) / f"{name}_{datetime.now().timestamp()}.db"
 
         if self._is_memory:
@@ -92,6 +246,10 @@ class SQLiteAdapter:
 
     def rollback(self, checkpoint: SystemCheckpoint) -> None:
         """Restore database from checkpoint file."""
+        if self.snapshot_mode == "pages":
+            self._page_rollback(checkpoint)
+            return
+
         checkpoint_path = Path(checkpoint)
 
         if not checkpoint_path.exists():
@@ -118,23 +276,217 @@ class SQLiteAdapter:
             shutil.copy2(checkpoint_path, self.database_path)
             self.connect()
 
+    def release(self, checkpoint: SystemCheckpoint) -> None:
+        """Delete a checkpoint file that will not be rolled back to."""
+        if self.snapshot_mode == "pages":
+            snapshot = self._page_snapshots.pop(checkpoint, None)
+            if snapshot is not None:
+                self._page_store.release(snapshot.pages)
+            return
+        Path(checkpoint).unlink(missing_ok=True)
+
+    def checkpoint_size(self, checkpoint: SystemCheckpoint) -> int:
+        """Size of the checkpoint file on disk.
+
+        In "pages" mode, the bytes of the pages the checkpoint introduced.
+        """
+        if self.snapshot_mode == "pages":
+            snapshot = self._page_snapshots.get(checkpoint)
+            return snapshot.new_bytes if snapshot is not None else 0
+        try:
+            return Path(checkpoint).stat().st_size
+        except OSError:
+            return 0
+
+    def has_checkpoint(self, checkpoint: SystemCheckpoint) -> bool:
+        """False for page snapshots dropped by snapshot_budget_bytes."""
+        return self.snapshot_mode != "pages" or checkpoint in self._page_snapshots
+
+    @property
+    def snapshot_bytes(self) -> int:
+        """Bytes currently held by page-mode snapshots."""
+        return self._page_store.total_bytes
+
+    def _page_checkpoint(self, name: str) -> str:
+        self.connection.commit()
+        changes = None if self._is_memory else self._wal_changes()
+        applied = _apply_changes(self._base_pages, *changes) if changes is not None else None
+        if applied is None:
+            applied = _split_pages(self._read_image(), self._page_size, self._base_pages)
+        pages, new_bytes = applied
+        if not self._is_memory:
+            self._fold_wal()
+        self._snapshot_counter += 1
+        checkpoint_id = f"pages:{name}:{self._snapshot_counter}"
+        self._page_snapshots[checkpoint_id] = _PageSnapshot(pages=pages, new_bytes=new_bytes)
+        self._page_store.retain(pages)
+        self._base_pages = pages
+        self._enforce_snapshot_budget(protect=checkpoint_id)
+        return checkpoint_id
+
+    def _page_rollback(self, checkpoint: SystemCheckpoint) -> None:
+        snapshot = self._page_snapshots.get(checkpoint)
+        if snapshot is None:
+            raise ValueError(f"Page snapshot not found (released or evicted): {checkpoint}")
+        self._page_snapshots.move_to_end(checkpoint)
+        target = snapshot.pages
+
+        if self._is_memory:
+            conn = self.connection
+            conn.rollback()
+            conn.deserialize(b"".join(target))
+        else:
+            self.connection.commit()
+            changes = self._wal_changes()
+            folded = self._fold_wal()
+            # Reconnect afterwards: this connection's page cache does not
+            # notice pages written behind SQLite's back
+            self.close()
+            if changes is None or not folded:
+                self._write_changed_pages(target)
+            else:
+                base = self._base_pages
+                dirty = {i for i in changes[0] if i < len(target)}
+                dirty.update(
+                    i for i in range(min(len(base), len(target))) if base[i] is not target[i]
+                )
+                dirty.update(range(min(len(base), len(target)), len(target)))
+                self._write_pages(target, dirty)
+            self._remember_file()
+            self.connect()
+        self._base_pages = target
+
+    def _read_image(self) -> bytes:
+        """Full database image (includes un-checkpointed WAL content)."""
+        conn = self.connection
+        self._page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        if hasattr(conn, "serialize"):
+            return conn.serialize()
+        conn.commit()
+        conn.execute("PRAGMA wal_checkpoint(FULL)")
+        return Path(self.database_path).read_bytes()
+
+    def _wal_changes(self) -> tuple[dict[int, bytes], int] | None:
+        """Pages written since the last snapshot, read from the WAL file.
+
+        Returns (page index -> page, database size in pages), or None when
+        the WAL cannot be trusted to hold every change (not in WAL mode, or
+        the main file changed since we last folded the WAL into it).
+        """
+        if not self._base_pages or self._file_stat is None:
+            return None
+        try:
+            stat = os.stat(self.database_path)
+        except OSError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != self._file_stat:
+            return None
+        try:
+            raw = Path(f"{self.database_path}-wal").read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        if len(raw) < _WAL_HEADER_SIZE:
+            return {}, len(self._base_pages)
+
+        magic, _, page_size, _, salt1, salt2 = _WAL_HEADER.unpack_from(raw)
+        if magic not in _WAL_MAGIC or page_size != self._page_size:
+            return None
+        changes: dict[int, bytes] = {}
+        pending: dict[int, bytes] = {}
+        db_pages = len(self._base_pages)
+        frame_size = _WAL_FRAME_HEADER_SIZE + page_size
+        offset = _WAL_HEADER_SIZE
+        while offset + frame_size <= len(raw):
+            pgno, commit_pages, frame_salt1, frame_salt2 = _WAL_FRAME.unpack_from(raw, offset)
+            if (frame_salt1, frame_salt2) != (salt1, salt2):
+                break  # left over from before the last WAL reset
+            start = offset + _WAL_FRAME_HEADER_SIZE
+            pending[pgno - 1] = raw[start:start + page_size]
+            if commit_pages:
+                changes.update(pending)
+                pending.clear()
+                db_pages = commit_pages
+            offset += frame_size
+        return changes, db_pages
+
+    def _fold_wal(self) -> bool:
+        """Move WAL content into the main file and empty the WAL."""
+        conn = self.connection
+        conn.commit()
+        busy = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+        if busy:
+            # A reader kept part of the WAL alive: stop trusting the WAL
+            self._file_stat = None
+            return False
+        self._remember_file()
+        return True
+
+    def _remember_file(self) -> None:
+        stat = os.stat(self.database_path)
+        self._file_stat = (stat.st_mtime_ns, stat.st_size)
+
+    def _write_pages(self, pages: list[bytes], indices: set[int]) -> None:
+        """Write the given pages into the database file and fix its length."""
+        with open(self.database_path, "r+b") as f:
+            for index in sorted(indices):
+                f.seek(index * self._page_size)
+                f.write(pages[index])
+            f.truncate(sum(len(page) for page in pages))
+
+    def _write_changed_pages(self, pages: list[bytes]) -> None:
+        """Make the database file equal to pages, writing only differing pages."""
+        current = Path(self.database_path).read_bytes()
+        size = self._page_size
+        self._write_pages(
+            pages,
+            {i for i, page in enumerate(pages) if current[i * size:(i + 1) * size] != page},
+        )
+
+    def _enforce_snapshot_budget(self, protect: str) -> None:
+        budget = self.snapshot_budget_bytes
+        if budget is None:
+            return
+        while self._page_store.total_bytes > budget and len(self._page_snapshots) > 1:
+            victim = next(iter(self._page_snapshots))
+            if victim == protect:
+                self._page_snapshots.move_to_end(victim)
+                victim = next(iter(self._page_snapshots))
+            self.release(victim)
+            self.evicted_snapshots += 1
+
     def observe(self) -> Observation:
-        """Query tables and return observation."""
+        """Query tables and return observation.
+
+        All table counts are fetched with one batched SELECT.
+        """
+        started = time.perf_counter()
         data: dict[str, Any] = {}
 
-        for table in self.observe_tables:
-            # Use _quote_identifier to prevent SQL injection
-            safe_table = _quote_identifier(table)
-            cursor = self.connection.execute(f"SELECT COUNT(*) FROM {safe_table}")
-            count = cursor.fetchone()[0]
-            data[f"{table}_count"] = count
+        if self.observe_tables:
+            row = self.connection.execute(self._observe_statement()).fetchone()
+            for table, count in zip(self.observe_tables, row, strict=True):
+                data[f"{table}_count"] = count
 
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.observe_stats.record(elapsed_ms)
         return Observation(
             system="db",
             data=data,
+            metadata={"observe_ms": round(elapsed_ms, 3)},
             observed_at=datetime.now(),
         )
 
+    def _observe_statement(self) -> str:
+        """Compiled observation SELECT, rebuilt only when observe_tables changes."""
+        key = tuple(self.observe_tables)
+        if self._observe_sql is None or self._observe_sql[0] != key:
+            # Use _quote_identifier to prevent SQL injection
+            statement = batched_select(
+                [f"SELECT COUNT(*) FROM {_quote_identifier(table)}" for table in key]
+            )
+            self._observe_sql = (key, statement)
+        return self._observe_sql[1]
+
     def execute(
         self,
         query: str,
@@ -166,8 +518,13 @@ class SQLiteAdapter:
         return [row[0] for row in cursor.fetchall()]
 
     def cleanup(self) -> None:
-        """Clean up temporary checkpoint files."""
-        shutil.rmtree(self._temp_dir, ignore_errors=True)
+        """Clean up temporary checkpoint files and page snapshots."""
+        temp_dir = getattr(self, "_temp_dir", None)
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        for checkpoint in list(getattr(self, "_page_snapshots", ())):
+            self.release(checkpoint)
+        self._base_pages = []
 
     def __enter__(self) -> SQLiteAdapter:
         self.connect()
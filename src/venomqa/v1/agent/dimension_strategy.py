@@ -46,24 +46,24 @@ class DimensionNoveltyStrategy:
 
     def pick(self, graph: Graph) -> tuple[State, Action] | None:
         """Pick the next (state, action) pair to explore."""
-        # get_unexplored() returns (State, Action) tuples for unexplored pairs
-        unexplored = graph.get_unexplored()
-        if not unexplored:
-            return None
-
         if self._hypergraph is None or self._hypergraph.node_count == 0:
             # Fallback: BFS order — return the first unexplored pair
-            return unexplored[0]
+            return graph.first_unexplored()
 
-        # Score each candidate by novelty (Hamming distance to centroid)
+        # Score each candidate by novelty (Hamming distance to centroid).
+        # The centroid and per-state scores only depend on the hypergraph,
+        # so compute them once per pick rather than once per pair.
+        centroid = self._centroid()
+        scores: dict[str, int] = {}
         best_score = -1
         best_pair: tuple[State, Action] | None = None
-        for state, action in unexplored:
-            edge = self._hypergraph.get_hyperedge(state.id)
-            if edge is None:
-                score = 0  # Unknown → treat as low novelty
-            else:
-                score = self._novelty_score(edge)
+        for state, action in graph.iter_unexplored():
+            score = scores.get(state.id)
+            if score is None:
+                edge = self._hypergraph.get_hyperedge(state.id)
+                # Unknown → treat as low novelty
+                score = 0 if edge is None else edge.hamming_distance(centroid)
+                scores[state.id] = score
 
             if score > best_score:
                 best_score = score
@@ -88,12 +88,14 @@ class DimensionNoveltyStrategy:
 
         Higher score = more novel = prefer picking this state.
         """
-        from venomqa.v1.core.hyperedge import Hyperedge
-
         if self._hypergraph is None:
             return 0
+        return edge.hamming_distance(self._centroid())
+
+    def _centroid(self) -> Hyperedge:
+        """Build the "centroid" — most commonly seen value per dimension."""
+        from venomqa.v1.core.hyperedge import Hyperedge
 
-        # Build the "centroid" — most commonly seen value per dimension
         centroid_dims: dict[str, Any] = {}
         for dim in self._hypergraph.all_dimensions():
             vals = self._hypergraph.all_values(dim)
@@ -105,8 +107,7 @@ class DimensionNoveltyStrategy:
                 }
                 centroid_dims[dim] = max(by_freq, key=lambda v: by_freq[v])
 
-        centroid = Hyperedge(dimensions=centroid_dims)
-        return edge.hamming_distance(centroid)
+        return Hyperedge(dimensions=centroid_dims)
 
     def _passes_constraints(self, edge: Hyperedge) -> bool:
         return all(c.is_valid(edge) for c in self._constraints)
@@ -0,0 +1,441 @@
+"""ParallelAgent - explore with a pool of isolated World replicas."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from venomqa.v1.agent import Agent
+from venomqa.v1.core.invariant import InvariantTiming
+from venomqa.v1.core.result import ExplorationResult
+from venomqa.v1.core.transition import Transition
+
+if TYPE_CHECKING:
+    import os
+
+    from venomqa.v1.agent.strategies import Strategy
+    from venomqa.v1.core.action import Action, ActionResult
+    from venomqa.v1.core.invariant import Invariant, Violation
+    from venomqa.v1.core.state import State
+    from venomqa.v1.world import World
+
+
+class ParallelAgent(Agent):
+    """Agent that drives N World replicas concurrently against one shared Graph.
+
+    Each worker thread owns a replica built by ``world_factory`` — with its
+    own API client, database connection, context and checkpoints — and runs
+    the usual (rollback, act, observe, checkpoint) cycle on it. All workers
+    share a single deduplicated Graph and the strategy's frontier; picks are
+    reserved under a lock (``Graph.mark_explored``) so no pair is executed
+    twice, while the slow parts (HTTP calls, observation, invariants) run
+    outside the lock. Against a network-bound API, throughput scales close
+    to linearly with ``workers`` until the API saturates.
+
+    Checkpoints only exist in the replica that created them. When a worker
+    picks a state it has never visited, it rolls back to the closest state
+    on the shortest path that it does hold a checkpoint for, replays the
+    remaining actions, and checkpoints the result for later picks.
+
+    Requirements on ``world_factory``:
+        - Every call returns a fresh, isolated World (separate DB/schema,
+          separate mock server instance, ...). Replicas must not share
+          mutable state, or workers will observe each other's writes.
+        - Every replica starts in the same observable state after setup,
+          so they agree on the initial state ID.
+
+    Example::
+
+        def make_world():
+            return World(
+                api=HttpClient("http://localhost:8000"),
+                systems={"db": SQLiteAdapter(copy_fixture_db())},
+            )
+
+        agent = ParallelAgent(
+            world_factory=make_world,
+            actions=actions,
+            invariants=invariants,
+            workers=8,
+        )
+        result = agent.explore()
+
+    Args:
+        world_factory: Zero-argument callable returning a new World replica.
+        actions: Actions to explore.
+        invariants: Invariants to check after each action.
+        strategy: Shared exploration strategy (default BFS). Strategy state
+            is only touched under the agent lock.
+        workers: Number of replicas / worker threads.
+        max_steps: Maximum number of transitions across all workers.
+        hypergraph, coverage_target, progress_every, shrink,
+            invariant_workers: As for Agent.
+        shrink_workers: As for Agent; the extra replicas come from world_factory.
+        journal, journal_every: As for Agent. resume() works as for Agent:
+            every replica reaches recorded states by replay from the
+            initial state.
+    """
+
+    def __init__(
+        self,
+        world_factory: Callable[[], World],
+        actions: list[Action],
+        invariants: list[Invariant] | None = None,
+        strategy: Strategy | None = None,
+        workers: int = 4,
+        max_steps: int = 1000,
+        hypergraph: bool = False,
+        coverage_target: float | None = None,
+        progress_every: int = 0,
+        shrink: bool = False,
+        invariant_workers: int = 1,
+        shrink_workers: int = 1,
+        journal: str | os.PathLike[str] | None = None,
+        journal_every: int = 50,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self._world_factory = world_factory
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._work_available = threading.Condition(self._lock)
+        self._replicas: list[World] = []
+        self._in_flight = 0
+        self._stopped = False
+        self._drained = False
+        self._journal_step = 0  # _step_count at the last journal flush
+        super().__init__(
+            world=world_factory(),
+            actions=actions,
+            invariants=invariants,
+            strategy=strategy,
+            max_steps=max_steps,
+            hypergraph=hypergraph,
+            coverage_target=coverage_target,
+            progress_every=progress_every,
+            shrink=shrink,
+            invariant_workers=invariant_workers,
+            shrink_workers=shrink_workers,
+            shrink_world_factory=world_factory,
+            journal=journal,
+            journal_every=journal_every,
+        )
+
+    # -- World routing ---------------------------------------------------
+
+    @property
+    def world(self) -> World:
+        """The replica driven by the calling worker thread (primary otherwise)."""
+        return getattr(self._local, "world", None) or self._primary_world
+
+    @world.setter
+    def world(self, value: World) -> None:
+        self._primary_world = value
+
+    @property
+    def replicas(self) -> list[World]:
+        """All World replicas used by the last explore() call."""
+        return list(self._replicas)
+
+    def _check_strategy_adapter_compatibility(self) -> None:
+        """Reject savepoint-stack PostgresAdapter when more than one worker runs.
+
+        Interleaved picks mean no replica rolls back in LIFO order, whatever
+        the strategy, so stack-based SAVEPOINTs cannot be used safely.
+        """
+        if self.workers == 1:
+            super()._check_strategy_adapter_compatibility()
+            return
+
+        from venomqa.v1.adapters.postgres import PostgresAdapter
+
+        for name, system in self.world.systems.items():
+            if isinstance(system, PostgresAdapter) and not system.supports_arbitrary_rollback:
+                raise ValueError(
+                    f"ParallelAgent(workers={self.workers}) cannot use PostgresAdapter ('{name}').\n"
+                    "Workers interleave their picks, so rollbacks are never LIFO and\n"
+                    "stack-based SAVEPOINTs are destroyed mid-run. Use workers=1, or\n"
+                    "an adapter that supports arbitrary rollback (e.g. SQLiteAdapter or\n"
+                    "PostgresSnapshotAdapter)."
+                )
+
+    # -- Exploration -----------------------------------------------------
+
+    def explore(self) -> ExplorationResult:
+        """Run exploration on all replicas and return the merged result."""
+        result = ExplorationResult(graph=self.graph)
+        self._replicas = [self._primary_world] + [
+            self._world_factory() for _ in range(self.workers - 1)
+        ]
+        self._in_flight = 0
+        self._stopped = False
+        self._drained = False
+        self._step_count = 0
+        self._journal_step = 0
+
+        try:
+            self._open_journal()
+            initial_states: list[State] = []
+            for replica in self._replicas:
+                replica.run_setup()
+                self._require_systems(replica)
+                initial = replica.observe_and_checkpoint("initial")
+                if initial.checkpoint_id is not None:
+                    replica.checkpoint_manager.pin(initial.checkpoint_id)
+                initial_states.append(initial)
+
+            initial_ids = {s.id for s in initial_states}
+            if len(initial_ids) != 1:
+                raise ValueError(
+                    "World replicas disagree on the initial state "
+                    f"({len(initial_ids)} distinct state IDs). world_factory must "
+                    "return isolated replicas that start from identical data."
+                )
+            if self._resume_state_id not in (None, *initial_ids):
+                raise ValueError(
+                    f"Cannot resume: the initial state is {initial_states[0].id}, but "
+                    f"the journal was recorded from {self._resume_state_id}. setup() "
+                    "must bring the systems to the same state as in the recorded run."
+                )
+
+            initial_state = self.graph.add_state(initial_states[0])
+            if self._hypergraph is not None:
+                self._register_hyperedge(initial_state)
+            # A resumed strategy already holds its frontier
+            if self._resume_state_id is None or not hasattr(self.strategy, "restore_frontier"):
+                self.strategy.notify(initial_state, self._get_valid_actions(initial_state))
+
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="venomqa-worker"
+            ) as pool:
+                futures = [
+                    pool.submit(self._run_worker, replica, {initial_state.id: state.checkpoint_id})
+                    for replica, state in zip(self._replicas, initial_states, strict=True)
+                ]
+                for future in futures:
+                    future.result()  # re-raise worker errors
+
+        finally:
+            self._shutdown_invariant_pool()
+            self._close_shrink_replicas()
+            self._close_journal()
+            for replica in self._replicas:
+                self._close_world(replica)
+
+        return self._finish_result(result, exhausted=self._drained)
+
+    def _run_worker(self, world: World, checkpoints: dict[str, str | None]) -> None:
+        """Worker loop: claim a pair, execute it on this replica, repeat."""
+        self._local.world = world
+        # state_id -> checkpoint ID valid in THIS replica
+        self._local.checkpoints = checkpoints
+        try:
+            while True:
+                pick = self._claim()
+                if pick is None:
+                    return
+                executed = False
+                try:
+                    executed = self._execute(*pick)
+                finally:
+                    self._release(executed)
+        except BaseException:
+            with self._work_available:
+                self._stopped = True
+                self._work_available.notify_all()
+            raise
+        finally:
+            self._local.world = None
+
+    def _claim(self) -> tuple[State, Action] | None:
+        """Reserve the next pair, waiting while other workers may still add work."""
+        with self._work_available:
+            while True:
+                if self._stopped or self._step_count >= self.max_steps:
+                    return None
+                if self._coverage_target_reached():
+                    self._drained = True
+                    self._stopped = True
+                    self._work_available.notify_all()
+                    return None
+                if self._journal is not None and (
+                    self._step_count - self._journal_step >= self.journal_every
+                ):
+                    if self._in_flight:
+                        # Flush only when no step is in flight: a claimed pair
+                        # is marked explored before its transition exists.
+                        self._work_available.wait()
+                        continue
+                    self._flush_journal()
+                    self._journal_step = self._step_count
+
+                pick = self.strategy.pick(self.graph)
+                if pick is not None:
+                    state, action = pick
+                    self.graph.mark_explored(state.id, action.name)
+                    self._in_flight += 1
+                    self._step_count += 1
+                    return pick
+
+                if self._in_flight == 0:
+                    # Nothing queued and nobody can discover more: done.
+                    self._drained = True
+                    self._work_available.notify_all()
+                    return None
+                self._work_available.wait()
+
+    def _release(self, executed: bool) -> None:
+        with self._work_available:
+            self._in_flight -= 1
+            if not executed:
+                self._step_count -= 1  # context-invalid picks don't count as steps
+            else:
+                self._maybe_print_progress()
+            self._work_available.notify_all()
+
+    def _execute(self, from_state: State, action: Action) -> bool:
+        """Run one reserved (state, action) pair on this worker's replica.
+
+        Mirrors Agent._step, with shared-graph updates done under the lock.
+
+        Returns:
+            False if the pick was invalid under the restored context.
+        """
+        self._rollback_to(from_state)
+
+        with self._lock:
+            used = set(self.graph.used_action_names)
+        if not action.can_execute_with_context(from_state, self.world.context, used):
+            return False
+
+        self._check_invariants_with_timing(from_state, action, None, InvariantTiming.PRE_ACTION)
+
+        action_result = self.world.act(action)
+        self._check_response_assertions(from_state, action, action_result)
+
+        with self._lock:
+            step = self._step_count
+        observed = self.world.observe_and_checkpoint(f"after_{action.name}_{step}")
+        known = self._local.checkpoints.get(observed.id)
+        if known is not None and self.world.has_checkpoint(known):
+            self.world.release(observed.checkpoint_id)
+        else:
+            self._local.checkpoints[observed.id] = observed.checkpoint_id
+
+        with self._lock:
+            to_state = self.graph.add_state(observed)
+            if self._hypergraph is not None:
+                self._register_hyperedge(to_state)
+            transition = Transition.create(
+                from_state_id=from_state.id,
+                action_name=action.name,
+                to_state_id=to_state.id,
+                result=action_result,
+            )
+            self.graph.add_transition(transition)
+            self._retire_checkpoints(from_state, observed, to_state)
+            self._track_noop(from_state, action, to_state)
+
+        self._check_invariants_with_timing(
+            to_state, action, transition, InvariantTiming.POST_ACTION,
+            action_result=action_result,
+        )
+
+        valid_actions = self._get_valid_actions(to_state)
+        with self._lock:
+            self.strategy.notify(to_state, valid_actions)
+        return True
+
+    # -- Per-replica rollback --------------------------------------------
+
+    def _rollback_to(self, target_state: State) -> None:
+        """Roll back this replica, using only checkpoints it created itself."""
+        checkpoint_id = self._local.checkpoints.get(target_state.id)
+        if checkpoint_id is not None and self.world.has_checkpoint(checkpoint_id):
+            self.world.rollback(checkpoint_id)
+            return
+        self._replay_to(target_state)
+
+    def _replay_to(self, target_state: State) -> None:
+        """Replay from this replica's deepest checkpoint on the shortest path."""
+        checkpoints = self._local.checkpoints
+        with self._lock:
+            path = self.graph.get_path_to(target_state.id)
+            initial_id = self.graph.initial_state_id or ""
+
+        checkpoint_id = checkpoints.get(initial_id)
+        replay_from = 0
+        for i, transition in enumerate(path):
+            cp = checkpoints.get(transition.to_state_id)
+            if cp is not None and self.world.has_checkpoint(cp):
+                checkpoint_id = cp
+                replay_from = i + 1
+
+        if checkpoint_id is not None:
+            self.world.rollback(checkpoint_id)
+        for transition in path[replay_from:]:
+            action = self.graph.get_action(transition.action_name)
+            if action:
+                self.world.act(action)
+
+        # Cache the reached state so the next pick from it is a plain rollback
+        checkpoints[target_state.id] = self.world.checkpoint(f"replay_{target_state.id}")
+
+    def _retire_checkpoints(self, from_state: State, observed: State, to_state: State) -> None:
+        """Mark this replica's checkpoint of a fully explored state for eviction.
+
+        Duplicate checkpoints were already released in _execute, against the
+        replica's own checkpoint map rather than the shared graph's.
+        """
+        checkpoint_id = self._local.checkpoints.get(from_state.id)
+        if checkpoint_id and not self.graph.has_unexplored_from(from_state.id):
+            self.world.checkpoint_manager.mark_exhausted(checkpoint_id)
+
+    def _explored_worlds(self) -> list[World]:
+        return list(self._replicas)
+
+    def _live_checkpoint(self, state_id: str) -> str | None:
+        checkpoints = getattr(self._local, "checkpoints", None)
+        if checkpoints is None:
+            return super()._live_checkpoint(state_id)
+        checkpoint_id = checkpoints.get(state_id)
+        if checkpoint_id is None or not self.world.has_checkpoint(checkpoint_id):
+            return None
+        return checkpoint_id
+
+    # -- Shared bookkeeping under the lock -------------------------------
+
+    def _claim_violation(self, invariant_name: str, state_id: str) -> bool:
+        with self._lock:
+            return super()._claim_violation(invariant_name, state_id)
+
+    def _reproduction_path(
+        self, state: State, transition: Transition | None
+    ) -> list[Transition]:
+        with self._lock:
+            return super()._reproduction_path(state, transition)
+
+    def _check_response_assertions(
+        self, state: State, action: Action, result: ActionResult
+    ) -> None:
+        with self._lock:
+            super()._check_response_assertions(state, action, result)
+
+    def _get_valid_actions(self, state: State) -> list[Action]:
+        # get_valid_actions syncs the shared precondition index and reads call counts
+        with self._lock:
+            valid = self.graph.get_valid_actions(
+                state, self.world.context, self.graph.used_action_names
+            )
+        return self._filter_by_resources(valid)
+
+    @property
+    def violations(self) -> list[Violation]:
+        with self._lock:
+            return list(self._violations)
+
+
+__all__ = ["ParallelAgent"]
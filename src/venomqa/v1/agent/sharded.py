@@ -0,0 +1,526 @@
+"""ShardedAgent - multi-process exploration with a state space partitioned by state ID."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import traceback
+import zlib
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from venomqa.v1.agent import Agent
+from venomqa.v1.agent.strategies import BFS
+from venomqa.v1.core.graph import Graph
+from venomqa.v1.core.invariant import InvariantTiming
+from venomqa.v1.core.result import ExplorationResult
+from venomqa.v1.core.transition import Transition
+
+if TYPE_CHECKING:
+    from venomqa.v1.core.action import Action
+    from venomqa.v1.core.invariant import Invariant, Violation
+    from venomqa.v1.core.state import State
+    from venomqa.v1.world import World
+
+# A path is the list of (action_name, to_state_id) hops from the initial state.
+_Path = list[tuple[str, str]]
+
+
+def shard_of(state_id: str, shards: int) -> int:
+    """Owning shard of a state ID (stable across processes, unlike hash())."""
+    return zlib.crc32(state_id.encode()) % shards
+
+
+@dataclass
+class _ShardPayload:
+    """Everything a shard sends back to the coordinator when it finishes."""
+
+    shard: int
+    initial_state: State
+    states: list[State] = field(default_factory=list)
+    transitions: list[Transition] = field(default_factory=list)
+    # Violations are shipped without their Action (callables may not pickle);
+    # the coordinator re-attaches it by name.
+    violations: list[tuple[Violation, str | None]] = field(default_factory=list)
+    steps: int = 0
+    replay_mismatches: int = 0
+    invariant_stats: dict[str, int] = field(default_factory=dict)
+
+
+class ShardedAgent:
+    """Explore a CPU-bound world with a pool of processes, one shard each.
+
+    Threads do not help when the world runs in-process (MockHTTPServer,
+    ASGIAdapter, SQLite ``:memory:``): hashing, deepcopy checkpoints and
+    invariant evaluation all hold the GIL. ShardedAgent instead starts
+    ``processes`` worker processes, each with its own World replica built by
+    ``world_factory``.
+
+    The state space is partitioned by state ID: shard ``k`` owns every state
+    with ``crc32(state_id) % processes == k`` and is the only one that
+    expands it. When a worker's transition lands on a state owned by
+    another shard, it hands the state over (with its path from the initial
+    state) to the owner's inbox; the owner replays the path on its own
+    replica, checkpoints it, and explores from there. Within a shard,
+    states are expanded in arrival (BFS-like) order.
+
+    When every shard is idle and no hand-off is in flight, the per-shard
+    Graphs and violations are merged into one ExplorationResult whose
+    reproduction paths are recomputed as shortest paths on the merged graph.
+
+    Requirements:
+        - ``world_factory`` returns isolated replicas that start from the
+          same observable state (same initial state ID).
+        - Observations and ActionResults must be picklable.
+        - With the ``"spawn"``/``"forkserver"`` start methods,
+          ``world_factory``, actions and invariants must be picklable too
+          (module-level functions). The default ``"fork"`` (where available)
+          has no such restriction.
+
+    Limitations compared to Agent: strategies, hypergraph mode and violation
+    shrinking are not supported, and ``max_calls`` / ``precondition_action_ran``
+    are evaluated per shard rather than globally.
+
+    Example::
+
+        def make_world():
+            server = MyMockServer()
+            return World(api=ASGIAdapter(app), systems={"app": server})
+
+        result = ShardedAgent(
+            world_factory=make_world,
+            actions=actions,
+            invariants=invariants,
+            processes=32,
+        ).explore()
+
+    Args:
+        world_factory: Zero-argument callable returning a new World replica.
+        actions: Actions to explore.
+        invariants: Invariants to check around each action.
+        processes: Number of shards/processes (default: ``os.cpu_count()``).
+        max_steps: Maximum number of transitions across all shards.
+        start_method: multiprocessing start method (default: ``"fork"`` if
+            available, else ``"spawn"``).
+        poll_interval: Seconds an idle shard waits for hand-offs before
+            re-checking for global termination.
+    """
+
+    def __init__(
+        self,
+        world_factory: Callable[[], World],
+        actions: list[Action],
+        invariants: list[Invariant] | None = None,
+        processes: int | None = None,
+        max_steps: int = 1000,
+        start_method: str | None = None,
+        poll_interval: float = 0.05,
+    ) -> None:
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError(f"processes must be >= 1, got {processes}")
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "fork" if "fork" in methods else "spawn"
+        self.world_factory = world_factory
+        self.actions = actions
+        self.invariants = invariants or []
+        self.processes = processes
+        self.max_steps = max_steps
+        self.start_method = start_method
+        self.poll_interval = poll_interval
+        self.replay_mismatches = 0
+
+    def explore(self) -> ExplorationResult:
+        """Run sharded exploration and return the merged result."""
+        ctx = multiprocessing.get_context(self.start_method)
+        inboxes = [ctx.Queue() for _ in range(self.processes)]
+        results = ctx.Queue()
+        pending = ctx.Value("q", 1)  # the initial state is pending from the start
+        steps = ctx.Value("q", 0)
+        stop = ctx.Event()
+        go = ctx.Event()
+
+        result = ExplorationResult(graph=Graph(self.actions))
+        procs = [
+            ctx.Process(
+                target=_run_shard,
+                args=(
+                    shard, self.processes, self.world_factory, self.actions,
+                    self.invariants, self.max_steps, self.poll_interval,
+                    inboxes, results, pending, steps, stop, go,
+                ),
+                name=f"venomqa-shard-{shard}",
+                daemon=True,
+            )
+            for shard in range(self.processes)
+        ]
+        for proc in procs:
+            proc.start()
+
+        try:
+            ready = self._collect(results, procs, "ready")
+            initial_ids = set(ready.values())
+            if len(initial_ids) != 1:
+                raise ValueError(
+                    "World replicas disagree on the initial state "
+                    f"({len(initial_ids)} distinct state IDs). world_factory must "
+                    "return isolated replicas that start from identical data."
+                )
+            go.set()
+            payloads = self._collect(results, procs, "done")
+        finally:
+            stop.set()
+            go.set()
+            for proc in procs:
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
+
+        with pending.get_lock():
+            truncated = pending.value > 0
+        self._merge(result, [payloads[k] for k in sorted(payloads)])
+        result.truncated_by_max_steps = truncated
+        result.finish()
+        return result
+
+    def _collect(
+        self,
+        results: Any,
+        procs: list[multiprocessing.process.BaseProcess],
+        kind: str,
+    ) -> dict[int, Any]:
+        """Wait for one ``kind`` message per shard, surfacing worker failures."""
+        received: dict[int, Any] = {}
+        # Shards seen exited without their message; given one more timeout
+        # for a message already in flight before they count as failed.
+        silent: set[int] = set()
+        while len(received) < len(procs):
+            try:
+                msg_kind, shard, data = results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [p for p in procs if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(
+                        f"Shard process {dead[0].name} exited with code {dead[0].exitcode}"
+                    )
+                exited = {
+                    shard for shard, p in enumerate(procs)
+                    if p.exitcode == 0 and shard not in received
+                }
+                if exited & silent:
+                    name = procs[min(exited & silent)].name
+                    raise RuntimeError(
+                        f"Shard process {name} exited without sending its {kind!r} message"
+                    )
+                silent = exited
+                continue
+            if msg_kind == "error":
+                raise RuntimeError(f"Shard {shard} failed:\n{data}")
+            received[shard] = data
+        return received
+
+    def _merge(self, result: ExplorationResult, payloads: list[_ShardPayload]) -> None:
+        """Merge per-shard graphs and violations into ``result``."""
+        graph = result.graph
+        actions = graph.actions
+        # Checkpoint IDs only meant something inside the worker processes.
+        graph.add_state(replace(payloads[0].initial_state, checkpoint_id=None))
+        for payload in payloads:
+            for state in payload.states:
+                graph.add_state(replace(state, checkpoint_id=None))
+        transitions = [t for p in payloads for t in p.transitions]
+        transitions.sort(key=lambda t: t.timestamp)
+        for transition in transitions:
+            graph.add_transition(transition)
+
+        # Rebuild violations: re-attach actions, recompute shortest repro
+        # paths on the merged graph, dedup (invariant, state) across shards.
+        seen: set[tuple[str, str]] = set()
+        violations = [v for p in payloads for v in p.violations]
+        violations.sort(key=lambda item: item[0].timestamp)
+        for violation, action_name in violations:
+            is_response = violation.invariant_name.endswith("_response_assertion")
+            if not is_response:
+                key = (violation.invariant_name, violation.state.id)
+                if key in seen:
+                    continue
+                seen.add(key)
+            if violation.reproduction_path:
+                last = violation.reproduction_path[-1]
+                path = graph.get_path_to(last.from_state_id) + [last]
+            else:
+                path = graph.get_path_to(violation.state.id)
+            result.violations.append(replace(
+                violation,
+                state=graph.get_state(violation.state.id) or violation.state,
+                action=actions.get(action_name) if action_name else None,
+                reproduction_path=path,
+            ))
+
+        self.replay_mismatches = sum(p.replay_mismatches for p in payloads)
+        for payload in payloads:
+            for counter, value in payload.invariant_stats.items():
+                result.invariant_stats[counter] = result.invariant_stats.get(counter, 0) + value
+
+
+class _ShardWorker(Agent):
+    """Agent running inside one shard process, expanding only owned states."""
+
+    def __init__(
+        self,
+        world: World,
+        actions: list[Action],
+        invariants: list[Invariant],
+        shard: int,
+        shards: int,
+        max_steps: int,
+        poll_interval: float,
+        inboxes: list[Any],
+        pending: Any,
+        steps: Any,
+        stop: Any,
+    ) -> None:
+        super().__init__(
+            world=world, actions=actions, invariants=invariants,
+            strategy=BFS(), max_steps=max_steps,
+        )
+        self._shard = shard
+        self._shards = shards
+        self._poll_interval = poll_interval
+        self._inboxes = inboxes
+        self._pending = pending
+        self._steps = steps
+        self._stop = stop
+        self._owned: set[str] = set()
+        self._handed_off: set[str] = set()
+        self._queue: deque[tuple[str, _Path]] = deque()
+        self._checkpoints: dict[str, str] = {}  # state_id -> checkpoint in this replica
+        self._replay_mismatches = 0
+
+    def start(self) -> State:
+        """Run setup and take the initial checkpoint."""
+        self.world.run_setup()
+        self._require_systems(self.world)
+        initial = self.graph.add_state(self.world.observe_and_checkpoint("initial"))
+        self._checkpoints[initial.id] = initial.checkpoint_id
+        if initial.checkpoint_id is not None:
+            self.world.checkpoint_manager.pin(initial.checkpoint_id)
+        return initial
+
+    def run(self, initial: State) -> _ShardPayload:
+        """Expand owned states until the whole pool is idle or stopped."""
+        if shard_of(initial.id, self._shards) == self._shard:
+            self._owned.add(initial.id)
+            self._queue.append((initial.id, []))
+
+        while not self._stop.is_set():
+            self._drain_inbox(block=not self._queue)
+            if not self._queue:
+                with self._pending.get_lock():
+                    if self._pending.value == 0:
+                        break
+                continue
+            state_id, path = self._queue.popleft()
+            try:
+                self._expand(state_id, path)
+            finally:
+                with self._pending.get_lock():
+                    self._pending.value -= 1
+
+        return _ShardPayload(
+            shard=self._shard,
+            initial_state=self.graph.get_state(initial.id) or initial,
+            states=list(self.graph.iter_states()),
+            transitions=list(self.graph.iter_transitions()),
+            violations=[
+                (replace(v, action=None), v.action.name if v.action else None)
+                for v in self._violations
+            ],
+            steps=self._step_count,
+            replay_mismatches=self._replay_mismatches,
+            invariant_stats=dict(self._invariant_stats),
+        )
+
+    def _drain_inbox(self, block: bool) -> None:
+        inbox = self._inboxes[self._shard]
+        while True:
+            try:
+                if block:
+                    state_id, path = inbox.get(timeout=self._poll_interval)
+                    block = False
+                else:
+                    state_id, path = inbox.get_nowait()
+            except queue.Empty:
+                return
+            if state_id in self._owned:
+                with self._pending.get_lock():
+                    self._pending.value -= 1  # duplicate hand-off
+                continue
+            self._owned.add(state_id)
+            self._queue.append((state_id, path))
+
+    def _expand(self, state_id: str, path: _Path) -> None:
+        """Try every valid action from an owned state."""
+        checkpoint_id = self._checkpoints.get(state_id)
+        if checkpoint_id is None or not self.world.has_checkpoint(checkpoint_id):
+            checkpoint_id = self._replay(state_id, path)
+            if checkpoint_id is None:
+                return
+        else:
+            self.world.rollback(checkpoint_id)
+
+        from_state = self.graph.get_state(state_id)
+        if from_state is None:
+            return
+        for action in self._get_valid_actions(from_state):
+            if not self._take_step():
+                return
+            if self.world.has_checkpoint(checkpoint_id):
+                self.world.rollback(checkpoint_id)
+            else:  # evicted by the World's CheckpointManager mid-expansion
+                checkpoint_id = self._replay(state_id, path)
+                if checkpoint_id is None:
+                    return
+
+            self._check_invariants_with_timing(
+                from_state, action, None, InvariantTiming.PRE_ACTION
+            )
+            action_result = self.world.act(action)
+            self._check_response_assertions(from_state, action, action_result)
+
+            observed = self.world.observe_and_checkpoint(
+                f"after_{action.name}_{self._step_count}"
+            )
+            to_state = self.graph.add_state(observed)
+            transition = Transition.create(
+                from_state_id=from_state.id,
+                action_name=action.name,
+                to_state_id=to_state.id,
+                result=action_result,
+            )
+            self.graph.add_transition(transition)
+            self._check_invariants_with_timing(
+                to_state, action, transition, InvariantTiming.POST_ACTION,
+                action_result=action_result,
+            )
+            self._keep_checkpoint(to_state.id, observed.checkpoint_id)
+            self._route(to_state.id, path + [(action.name, to_state.id)])
+
+    def _keep_checkpoint(self, state_id: str, checkpoint_id: str | None) -> None:
+        """Remember a checkpoint for a state, releasing it if one is already held."""
+        if checkpoint_id is None:
+            return
+        known = self._checkpoints.get(state_id)
+        if known is not None and self.world.has_checkpoint(known):
+            self.world.release(checkpoint_id)
+        else:
+            self._checkpoints[state_id] = checkpoint_id
+
+    def _route(self, state_id: str, path: _Path) -> None:
+        """Queue a discovered state locally or hand it to its owning shard."""
+        owner = shard_of(state_id, self._shards)
+        if owner == self._shard:
+            if state_id in self._owned:
+                return
+            self._owned.add(state_id)
+            with self._pending.get_lock():
+                self._pending.value += 1
+            self._queue.append((state_id, path))
+            return
+        if state_id in self._handed_off:
+            return
+        self._handed_off.add(state_id)
+        with self._pending.get_lock():
+            self._pending.value += 1
+        self._inboxes[owner].put((state_id, path))
+
+    def _replay(self, state_id: str, path: _Path) -> str | None:
+        """Reach a handed-off state from this replica's deepest known prefix."""
+        checkpoint_id = self._checkpoints.get(self.graph.initial_state_id or "")
+        replay_from = 0
+        for i, (_, hop_state_id) in enumerate(path):
+            cp = self._checkpoints.get(hop_state_id)
+            if cp is not None and self.world.has_checkpoint(cp):
+                checkpoint_id = cp
+                replay_from = i + 1
+        if checkpoint_id is not None:
+            self.world.rollback(checkpoint_id)
+        for action_name, _ in path[replay_from:]:
+            action = self.graph.get_action(action_name)
+            if action is not None:
+                self.world.act(action)
+
+        observed = self.world.observe_and_checkpoint(f"replay_{state_id}")
+        if observed.id != state_id:
+            # Non-deterministic API: the path does not lead back to the state.
+            self._replay_mismatches += 1
+            return None
+        self.graph.add_state(observed)
+        self._checkpoints[state_id] = observed.checkpoint_id
+        return observed.checkpoint_id
+
+    def _take_step(self) -> bool:
+        """Reserve one step from the global budget."""
+        with self._steps.get_lock():
+            if self._steps.value >= self.max_steps:
+                self._stop.set()
+                return False
+            self._steps.value += 1
+        self._step_count += 1
+        return True
+
+    def _reproduction_path(
+        self, state: State, transition: Transition | None
+    ) -> list[Transition]:
+        # Only the last hop is known locally; the coordinator recomputes the
+        # shortest path once all shard graphs are merged.
+        return [transition] if transition is not None else []
+
+
+def _run_shard(
+    shard: int,
+    shards: int,
+    world_factory: Callable[[], World],
+    actions: list[Action],
+    invariants: list[Invariant],
+    max_steps: int,
+    poll_interval: float,
+    inboxes: list[Any],
+    results: Any,
+    pending: Any,
+    steps: Any,
+    stop: Any,
+    go: Any,
+) -> None:
+    """Process entry point for one shard."""
+    # Leftover hand-offs must not keep this process alive at exit.
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+    worker: _ShardWorker | None = None
+    try:
+        worker = _ShardWorker(
+            world_factory(), actions, invariants, shard, shards,
+            max_steps, poll_interval, inboxes, pending, steps, stop,
+        )
+        initial = worker.start()
+        results.put(("ready", shard, initial.id))
+        go.wait()
+        if stop.is_set():
+            # The budget ran out (or the run was aborted) before this shard
+            # started; the coordinator still waits for its "done".
+            results.put(("done", shard, _ShardPayload(shard=shard, initial_state=initial)))
+            return
+        results.put(("done", shard, worker.run(initial)))
+    except BaseException:
+        stop.set()
+        results.put(("error", shard, traceback.format_exc()))
+    finally:
+        if worker is not None:
+            Agent._close_world(worker.world)
+
+
+__all__ = ["ShardedAgent", "shard_of"]
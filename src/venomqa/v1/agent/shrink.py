@@ -0,0 +1,242 @@
+"""Violation path shrinking - delta debugging anchored at checkpoints.
+
+PathShrinker runs ddmin (Zeller's delta debugging) over a violation's
+reproduction path. It looks for a 1-minimal subsequence of actions after
+which the invariant still fails. Each candidate starts from the deepest
+checkpoint whose action prefix it shares, not from the initial state:
+
+- the graph's checkpoints along the original path are used as anchors
+- every prefix replayed while shrinking is checkpointed as well
+- outcomes are cached per candidate
+- a prefix whose replay raised an error fails every candidate that starts with it
+
+With more than one World, the candidates of a ddmin round are tested
+concurrently, one per World, and the first failing candidate in ddmin order
+wins, so the result does not depend on thread timing.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from venomqa.v1.core.action import Action
+    from venomqa.v1.core.transition import Transition
+    from venomqa.v1.world import World
+
+Prefix = tuple[str, ...]
+
+
+@dataclass
+class ShrinkTarget:
+    """A World the shrinker may replay on, with checkpoints by action prefix.
+
+    Attributes:
+        world: The World to replay on.
+        anchors: Action-name prefix -> checkpoint ID valid in this World. The
+            empty prefix must map to a checkpoint of the initial state.
+    """
+
+    world: World
+    anchors: dict[Prefix, str]
+    created: list[str] = field(default_factory=list)
+
+    def deepest_anchor(self, names: Prefix) -> tuple[int, str] | None:
+        for k in range(len(names), -1, -1):
+            checkpoint_id = self.anchors.get(names[:k])
+            if checkpoint_id is not None and self.world.has_checkpoint(checkpoint_id):
+                return k, checkpoint_id
+        return None
+
+    def release(self) -> None:
+        """Release the checkpoints taken while shrinking."""
+        for checkpoint_id in self.created:
+            self.world.release(checkpoint_id)
+        self.created.clear()
+
+
+@dataclass
+class ShrinkStats:
+    """Cost of one shrink.
+
+    ``actions_naive`` is what replaying every tested candidate in full from
+    the initial state would have cost; ``actions_saved`` is the difference
+    to what was actually replayed.
+    """
+
+    original_steps: int = 0
+    shrunk_steps: int = 0
+    candidates_tested: int = 0
+    cache_hits: int = 0
+    actions_replayed: int = 0
+    actions_naive: int = 0
+
+    @property
+    def actions_saved(self) -> int:
+        return self.actions_naive - self.actions_replayed
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "original_steps": self.original_steps,
+            "shrunk_steps": self.shrunk_steps,
+            "candidates_tested": self.candidates_tested,
+            "cache_hits": self.cache_hits,
+            "actions_replayed": self.actions_replayed,
+            "actions_naive": self.actions_naive,
+            "actions_saved": self.actions_saved,
+        }
+
+
+class PathShrinker:
+    """Minimize a reproduction path with ddmin over checkpoint-anchored replays.
+
+    Args:
+        path: The violation's reproduction path.
+        fires: Returns True if the invariant fails in the given World.
+        actions: Actions by name.
+        targets: Worlds to replay on; more than one tests candidates concurrently.
+    """
+
+    def __init__(
+        self,
+        path: list[Transition],
+        fires: Callable[[World], bool],
+        actions: Mapping[str, Action],
+        targets: list[ShrinkTarget],
+    ) -> None:
+        if not targets:
+            raise ValueError("PathShrinker needs at least one ShrinkTarget")
+        self.path = path
+        self.fires = fires
+        self.actions = actions
+        self.targets = targets
+        self.stats = ShrinkStats(original_steps=len(path))
+        self._outcomes: dict[Prefix, bool] = {}
+        self._broken: set[Prefix] = set()  # prefixes whose replay raised
+        self._lock = threading.Lock()
+
+    def run(self) -> list[Transition]:
+        """Return the shortest failing subsequence found (the path itself if none)."""
+        indices = list(range(len(self.path)))
+        n = 2
+        while len(indices) >= 2:
+            chunks = _split(indices, n)
+            complements = [
+                [i for j, chunk in enumerate(chunks) if j != k for i in chunk]
+                for k in range(len(chunks))
+            ]
+            candidates = chunks + (complements if n > 2 else [])
+            found = self._first_failing(candidates)
+            if found is not None:
+                shrunk_to_chunk = found < len(chunks)
+                indices = candidates[found]
+                n = 2 if shrunk_to_chunk else max(n - 1, 2)
+                continue
+            if n >= len(indices):
+                break
+            n = min(len(indices), 2 * n)
+
+        self.stats.shrunk_steps = len(indices)
+        return [self.path[i] for i in indices]
+
+    def release(self) -> None:
+        """Release the checkpoints taken on every target."""
+        for target in self.targets:
+            target.release()
+
+    # -- Candidate evaluation --
+
+    def _first_failing(self, candidates: list[list[int]]) -> int | None:
+        """Index of the first candidate (in ddmin order) that still fails."""
+        names = [tuple(self.path[i].action_name for i in c) for c in candidates]
+        found = self._search(names)
+        # A plain ddmin replays each candidate in full, up to the first failing one
+        decided = names if found is None else names[:found + 1]
+        self.stats.actions_naive += sum(len(key) for key in decided)
+        return found
+
+    def _search(self, names: list[Prefix]) -> int | None:
+
+        # Cached outcomes decide a candidate without replaying it; only the
+        # candidates before the first cached failure need testing.
+        pending: list[int] = []
+        cached_failure: int | None = None
+        for k, key in enumerate(names):
+            if key in self._outcomes or self._is_broken(key):
+                self.stats.cache_hits += 1
+                if self._outcomes.get(key, False):
+                    cached_failure = k
+                    break
+                continue
+            pending.append(k)
+
+        width = len(self.targets)
+        if width == 1:
+            for j in pending:
+                if self._test(self.targets[0], names[j]):
+                    return j
+            return cached_failure
+        with ThreadPoolExecutor(max_workers=width, thread_name_prefix="venomqa-shrink") as pool:
+            for start in range(0, len(pending), width):
+                batch = pending[start:start + width]
+                results = list(pool.map(self._test, self.targets, [names[j] for j in batch]))
+                for j, failed in zip(batch, results, strict=True):
+                    if failed:
+                        return j
+        return cached_failure
+
+    def _is_broken(self, names: Prefix) -> bool:
+        return any(names[:k] in self._broken for k in range(1, len(names) + 1))
+
+    def _test(self, target: ShrinkTarget, names: Prefix) -> bool:
+        """Replay a candidate from its deepest anchor and check the invariant."""
+        with self._lock:
+            self.stats.candidates_tested += 1
+        anchor = target.deepest_anchor(names)
+        if anchor is None:
+            self._outcomes[names] = False
+            return False
+        start, checkpoint_id = anchor
+        world = target.world
+        world.rollback(checkpoint_id)
+        for k in range(start, len(names)):
+            action = self.actions.get(names[k])
+            if action is None:
+                self._broken.add(names[:k + 1])
+                return False
+            try:
+                world.act(action)
+            except Exception:
+                self._broken.add(names[:k + 1])
+                return False
+            with self._lock:
+                self.stats.actions_replayed += 1
+            prefix = names[:k + 1]
+            if prefix not in target.anchors:
+                checkpoint_id = world.checkpoint("_shrink_prefix")
+                target.anchors[prefix] = checkpoint_id
+                target.created.append(checkpoint_id)
+        try:
+            failed = self.fires(world)
+        except Exception:
+            failed = False
+        self._outcomes[names] = failed
+        return failed
+
+
+def _split(items: list[int], n: int) -> list[list[int]]:
+    """Split items into n contiguous chunks of near-equal size."""
+    size, extra = divmod(len(items), n)
+    chunks, start = [], 0
+    for k in range(n):
+        end = start + size + (1 if k < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [c for c in chunks if c]
+
+
+__all__ = ["PathShrinker", "ShrinkStats", "ShrinkTarget"]
@@ -124,7 +124,9 @@ def main(args: list[str] | None = None) -> int:
     replay_parser = subparsers.add_parser(
         "replay", help="Re-run a violation's reproduction path from a report JSON"
     )
-    replay_parser.add_argument("report_file", help="Path to a JSONReporter output file")
+    replay_parser.add_argument(
+        "report_file", help="Path to a JSONReporter output file or an event log (.jsonl.gz)"
+    )
     replay_parser.add_argument(
         "--violation", "-V",
         type=int,
@@ -341,10 +343,14 @@ def cmd_replay(args: Any) -> int:
     if not report_path.exists():
         print(f"Error: report file not found: {report_path}", file=sys.stderr)
         return 1
+    recorded: dict[str, Any] = {}
     try:
-        report = _json.loads(report_path.read_text())
+        if report_path.read_bytes()[:2] == b"\x1f\x8b":
+            report, recorded = _load_event_log_report(report_path)
+        else:
+            report = _json.loads(report_path.read_text())
     except Exception as exc:
-        print(f"Error: could not parse report JSON: {exc}", file=sys.stderr)
+        print(f"Error: could not parse report: {exc}", file=sys.stderr)
         return 1
 
     # Pull unique_violations (preferred — shortest paths) or fall back to violations
@@ -364,6 +370,8 @@ def cmd_replay(args: Any) -> int:
 
     violation = all_violations[idx]
     path_actions: list[str] = violation.get("reproduction_path", [])
+    # Event logs also hold the recorded result of every step
+    recorded_steps = [recorded.get(t) for t in violation.get("transition_ids", [])]
     if not path_actions:
         print("Violation has an empty reproduction path — nothing to replay.", file=sys.stderr)
         return 1
@@ -440,6 +448,14 @@ def cmd_replay(args: Any) -> int:
                 print(f"  Res body: {body_str}")
         elif hasattr(result, "error") and result.error:
             print(f"  Error:    {result.error}")
+        if step_num <= len(recorded_steps) and recorded_steps[step_num - 1] is not None:
+            rec = recorded_steps[step_num - 1]
+            if rec["response"] is not None:
+                print(f"  Recorded: HTTP {rec['response']['status_code']}")
+                if rec["response"]["body"] is not None:
+                    print(f"  Rec body: {repr(rec['response']['body'])[:300]}")
+            elif rec["error"]:
+                print(f"  Recorded: {rec['error']}")
 
         if is_last:
             print()
@@ -455,6 +471,25 @@ def cmd_replay(args: Any) -> int:
     return 0
 
 
+def _load_event_log_report(path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Violations and recorded step results from an event log.
+
+    Returns a report dict shaped like JSONReporter output (only
+    ``violations``) and a map of transition ID to recorded result for the
+    transitions on the violations' reproduction paths.
+    """
+    from venomqa.exploration.events import EventLog
+
+    violations = list(EventLog.read(path, types={"violation"}))
+    wanted = {t for v in violations for t in v.get("transition_ids", [])}
+    recorded = {
+        event["id"]: event["result"]
+        for event in EventLog.read(path, types={"transition"})
+        if event["id"] in wanted
+    }
+    return {"violations": violations}, recorded
+
+
 def _load_module(path: str) -> Any:
     """Load a Python module from a file path."""
     import importlib.util as _ilu
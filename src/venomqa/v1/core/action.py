@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -13,7 +14,43 @@ if TYPE_CHECKING:
     from venomqa.v1.core.state import State
 
 
-@dataclass
+class _SharedHeaders(dict):
+    """A header dict that may be held by many results, so it refuses mutation."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("shared headers are read-only; copy them with dict(headers) first")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = pop = popitem = clear = setdefault = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+
+# Header dicts shared between results with identical headers (see shared_headers)
+_HEADER_CACHE: dict[tuple[tuple[str, str], ...], _SharedHeaders] = {}
+_HEADER_CACHE_SIZE = 4096
+
+
+def shared_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return a read-only dict equal to headers, shared with identical header sets.
+
+    Keys are interned. Requests sent with the same default headers, and
+    responses with the same headers, then hold one dict between them
+    instead of a copy each. Mutating the result raises TypeError.
+    """
+    key = tuple(headers.items())
+    cached = _HEADER_CACHE.get(key)
+    if cached is None:
+        if len(_HEADER_CACHE) >= _HEADER_CACHE_SIZE:
+            _HEADER_CACHE.clear()
+        cached = _HEADER_CACHE[key] = _SharedHeaders((sys.intern(k), v) for k, v in key)
+    return cached
+
+
+@dataclass(slots=True)
 class HTTPRequest:
     """Represents an HTTP request."""
 
@@ -26,7 +63,7 @@ class HTTPRequest:
         return f"{self.method} {self.url}"
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPResponse:
     """Represents an HTTP response."""
 
@@ -43,7 +80,7 @@ class HTTPResponse:
         return self.body
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of executing an action."""
 
@@ -78,6 +115,13 @@ class ActionResult:
             error=error,
         )
 
+    def lean(self) -> ActionResult:
+        """Copy without the request's headers and body, for keeping in memory.
+
+        The response (status, headers, body) is kept.
+        """
+        return replace(self, request=HTTPRequest(self.request.method, self.request.url))
+
     # ── Convenience proxies — so actions can treat ActionResult like a response ──
 
     @property
@@ -362,6 +406,21 @@ class Action:
             preconditions=["create_connection"],  # action name
         )
 
+    Read-only actions:
+        Action(
+            name="list_users",
+            execute=list_users,
+            read_only=True,  # Agent runs these concurrently, without rollbacks
+        )
+
+    Resource footprints (for Agent(por=True)):
+        Action(
+            name="create_product",
+            execute=create_product,
+            reads=["catalog"],
+            writes=["product"],  # commutes with actions that never touch products
+        )
+
     The framework automatically detects whether your action accepts context.
     """
 
@@ -375,6 +434,10 @@ class Action:
     expect_failure: bool = False
     response_assertion: Any = None  # ResponseAssertion, avoid circular import
     max_calls: int | None = None  # Max times this action can be called (prevents data explosion)
+    read_only: bool = False  # Never changes systems or context (e.g. a GET); see Agent fan-out
+    # Resource footprint for partial-order reduction (Agent(por=True)); None = undeclared
+    reads: list[str] | None = None
+    writes: list[str] | None = None
     _accepts_context: bool | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
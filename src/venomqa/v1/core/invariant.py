@@ -56,6 +56,16 @@ class Invariant:
             check=lambda world: world.context.has("user_id"),
             timing=InvariantTiming.PRE_ACTION,
         )
+
+    Set ``pure=True`` when the result depends only on the observed state
+    (not on the last action or its result, or on anything the World does
+    not observe). The Agent then evaluates it once per state and reuses the
+    result whenever exploration revisits that state.
+
+    Set ``parallel_safe=True`` when the check only reads and can run at the
+    same time as other checks (its own HTTP client calls or DB queries, no
+    writes, no shared mutable helpers). With ``Agent(invariant_workers=N)``
+    such invariants are evaluated concurrently.
     """
 
     name: str
@@ -63,6 +73,8 @@ class Invariant:
     severity: Severity = Severity.MEDIUM
     message: str = ""
     timing: InvariantTiming = InvariantTiming.POST_ACTION
+    pure: bool = False
+    parallel_safe: bool = False
 
     def __hash__(self) -> int:
         return hash(self.name)
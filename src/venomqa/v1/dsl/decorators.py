@@ -42,6 +42,8 @@ def invariant(
     name: str | None = None,
     message: str = "",
     severity: Severity = Severity.MEDIUM,
+    pure: bool = False,
+    parallel_safe: bool = False,
 ) -> Callable[[Callable[..., bool]], Invariant]:
     """Decorator to create an Invariant from a function.
 
@@ -55,6 +57,10 @@ def invariant(
             db_count = world.systems["db"].execute("SELECT COUNT(*) FROM orders")[0][0]
             api_count = len(world.api.get("/orders").response.json()["orders"])
             return db_count == api_count
+
+    Pass ``pure=True`` if the check depends only on observed state, so its
+    result can be reused when exploration revisits a state, and
+    ``parallel_safe=True`` if it may run concurrently with other checks.
     """
 
     def decorator(func: Callable[..., bool]) -> Invariant:
@@ -64,6 +70,8 @@ def invariant(
             check=func,
             message=message or func.__doc__ or "",
             severity=severity,
+            pure=pure,
+            parallel_safe=parallel_safe,
         )
 
     return decorator
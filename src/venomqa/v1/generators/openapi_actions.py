@@ -21,6 +21,9 @@ from venomqa.v1.core.action import Action, ActionResult, HTTPRequest
 
 OperationType = Literal["create", "read", "update", "delete", "list", "action"]
 
+# Safe methods (RFC 9110): generated actions for them are marked read_only
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 @dataclass
 class EndpointInfo:
@@ -297,7 +300,10 @@ def _endpoint_to_action(endpoint: EndpointInfo, base_url: str) -> Action:
         name=name,
         execute=make_execute(endpoint, base_url),
         description=endpoint.summary or f"{endpoint.method} {endpoint.path}",
+        read_only=endpoint.method.upper() in READ_ONLY_METHODS,
     )
+    if endpoint.resource_type is not None:
+        action.reads, action.writes = _footprint(endpoint)
 
     # Set requires attribute for ResourceGraph integration
     action.requires = endpoint.requires
@@ -305,6 +311,16 @@ def _endpoint_to_action(endpoint: EndpointInfo, base_url: str) -> Action:
     return action
 
 
+def _footprint(endpoint: EndpointInfo) -> tuple[list[str] | None, list[str] | None]:
+    """Resource types an endpoint reads and writes: its parents and its own type."""
+    resource = endpoint.resource_type
+    if endpoint.operation in ("read", "list"):
+        return [*endpoint.requires, resource], []
+    if endpoint.operation in ("create", "update", "delete"):
+        return [*endpoint.requires, resource], [resource]
+    return None, None  # custom operation: unknown effects
+
+
 def generate_schema_and_actions(
     spec: dict[str, Any] | str | Path,
     **kwargs,
@@ -328,6 +344,7 @@ def generate_schema_and_actions(
 __all__ = [
     "EndpointInfo",
     "OperationType",
+    "READ_ONLY_METHODS",
     "generate_actions",
     "generate_schema_and_actions",
     "load_openapi_spec",
@@ -5,14 +5,21 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from venomqa.exploration.events import result_to_dict
 from venomqa.v1.core.result import ExplorationResult
+from venomqa.v1.core.transition import Transition
 
 
 class JSONReporter:
-    """Formats ExplorationResult as JSON."""
+    """Formats ExplorationResult as JSON.
 
-    def __init__(self, indent: int | None = 2) -> None:
+    With ``include_bodies=True`` each transition also carries its request
+    and response, reloaded from the run's event log when it had one.
+    """
+
+    def __init__(self, indent: int | None = 2, include_bodies: bool = False) -> None:
         self.indent = indent
+        self.include_bodies = include_bodies
 
     def report(self, result: ExplorationResult) -> str:
         """Generate JSON report."""
@@ -74,17 +81,26 @@ class JSONReporter:
                     for s in result.graph.iter_states()
                 ],
                 "transitions": [
-                    {
-                        "id": t.id,
-                        "from": t.from_state_id,
-                        "to": t.to_state_id,
-                        "action": t.action_name,
-                        "success": t.result.success,
-                        "duration_ms": t.result.duration_ms,
-                    }
+                    self._transition_dict(result, t)
                     for t in result.graph.iter_transitions()
                 ],
             },
             "started_at": result.started_at.isoformat(),
             "finished_at": result.finished_at.isoformat() if result.finished_at else None,
         }
+
+    def _transition_dict(self, result: ExplorationResult, t: Transition) -> dict[str, Any]:
+        entry: dict[str, Any] = {
+            "id": t.id,
+            "from": t.from_state_id,
+            "to": t.to_state_id,
+            "action": t.action_name,
+            "success": t.result.success,
+            "status_code": t.result.status_code,
+            "duration_ms": t.result.duration_ms,
+        }
+        if self.include_bodies:
+            full = result_to_dict(result.action_result(t))
+            entry["request"] = full["request"]
+            entry["response"] = full["response"]
+        return entry
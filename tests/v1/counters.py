@@ -0,0 +1,110 @@
+"""Counter world shared by the Agent exploration tests.
+
+Every ``inc_<key>`` action bumps one counter up to a limit, so a world with
+keys ``a`` and ``b`` and limit 2 has 9 states and 18 transitions.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Iterable
+
+from venomqa.core.state import Observation
+
+from venomqa import Action, ActionResult, CheckpointManager, HTTPRequest, HTTPResponse, World
+
+
+class CounterStore:
+    """Rollbackable counters that count checkpoints, rollbacks and releases."""
+
+    def __init__(self, keys: Iterable[str] = ("a", "b"), **start: int) -> None:
+        self.data = {key: start.get(key, 0) for key in keys}
+        self.checkpoints = 0
+        self.rollbacks = 0
+        self.released: list[dict] = []
+
+    def checkpoint(self, name: str) -> dict:
+        self.checkpoints += 1
+        return copy.deepcopy(self.data)
+
+    def rollback(self, checkpoint: dict) -> None:
+        self.rollbacks += 1
+        self.data = copy.deepcopy(checkpoint)
+
+    def release(self, checkpoint: dict) -> None:
+        self.released.append(checkpoint)
+
+    def checkpoint_size(self, checkpoint: dict) -> int:
+        return 10
+
+    def observe(self) -> Observation:
+        return Observation(system="store", data=dict(self.data))
+
+
+class CounterApi:
+    """POST /<key> increments a counter up to ``limit``; other methods only read.
+
+    Records the number of calls, the calling threads and the peak number of
+    concurrent calls (each call sleeps ``delay`` seconds).
+    """
+
+    def __init__(
+        self,
+        store: CounterStore,
+        limit: int = 2,
+        delay: float = 0.0,
+        threads: list[str] | None = None,
+    ) -> None:
+        self.store = store
+        self.limit = limit
+        self.delay = delay
+        self.calls = 0
+        self.threads = threads if threads is not None else []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def call(self, method: str, path: str, status: int = 200) -> ActionResult:
+        with self._lock:
+            self.calls += 1
+            self.threads.append(threading.current_thread().name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if self.delay:
+            time.sleep(self.delay)
+        key = path.strip("/")
+        if method == "POST" and self.store.data[key] < self.limit:
+            self.store.data[key] += 1
+        with self._lock:
+            self.active -= 1
+        return ActionResult.from_response(
+            HTTPRequest(method, path), HTTPResponse(status, body={"value": self.store.data.get(key)})
+        )
+
+    def post(self, path: str) -> ActionResult:
+        return self.call("POST", path)
+
+
+def inc(key: str) -> Action:
+    return Action(name=f"inc_{key}", execute=lambda api: api.post(f"/{key}"))
+
+
+def counter_actions(keys: Iterable[str] = ("a", "b")) -> list[Action]:
+    return [inc(key) for key in keys]
+
+
+def counter_world(
+    keys: Iterable[str] = ("a", "b"),
+    limit: int = 2,
+    checkpoint_manager: CheckpointManager | None = None,
+    **api_options,
+) -> World:
+    """A World over a fresh CounterStore (``world.systems["store"]``)."""
+    store = CounterStore(keys)
+    return World(
+        api=CounterApi(store, limit, **api_options),
+        systems={"store": store},
+        checkpoint_manager=checkpoint_manager,
+    )
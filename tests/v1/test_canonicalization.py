@@ -0,0 +1,177 @@
+"""Tests for observation canonicalization (symmetry reduction)."""
+
+from __future__ import annotations
+
+import uuid
+
+from venomqa.core.state import Observation, State
+
+from venomqa import (
+    BFS,
+    Action,
+    ActionResult,
+    Agent,
+    HTTPRequest,
+    HTTPResponse,
+    Normalizer,
+    World,
+)
+from venomqa.sandbox import Canonicalizer
+from venomqa.v1.adapters.mock_storage import MockStorage
+from venomqa.v1.adapters.resource_graph import ResourceGraph, ResourceSchema, ResourceType
+from venomqa.v1.agent.parallel import ParallelAgent
+
+SCHEMA = ResourceSchema(
+    types={
+        "workspace": ResourceType(name="workspace"),
+        "upload": ResourceType(name="upload", parent="workspace"),
+    }
+)
+
+
+class TestNormalizer:
+    def test_ignore_keys_at_any_depth(self):
+        normalizer = Normalizer(ignore_keys=["updated_at"])
+        data = {"updated_at": 1, "rows": [{"name": "a", "updated_at": 2}]}
+        assert normalizer.apply(data) == {"rows": [{"name": "a"}]}
+
+    def test_sorted_lists_ignore_row_order(self):
+        normalizer = Normalizer(sort_lists=["rows"])
+        a = normalizer.apply({"rows": [{"n": 2}, {"n": 1}]})
+        b = normalizer.apply({"rows": [{"n": 1}, {"n": 2}]})
+        assert a == b == {"rows": [{"n": 1}, {"n": 2}]}
+
+    def test_ordinal_ids_keep_references(self):
+        normalizer = Normalizer(sort_lists=["rows"], ordinal_ids=["id", "parent_id"])
+        data = {
+            "rows": [
+                {"type": "upload", "id": "u-9f", "parent_id": "w-31"},
+                {"type": "workspace", "id": "w-31", "parent_id": None},
+            ]
+        }
+        assert normalizer.apply(data) == {
+            "rows": [
+                {"type": "upload", "id": "#0", "parent_id": "#1"},
+                {"type": "workspace", "id": "#1", "parent_id": None},
+            ]
+        }
+
+    def test_different_structure_stays_distinct(self):
+        normalizer = Normalizer(ordinal_ids=["files"])
+        one = normalizer.apply({"files": ["x"]})
+        two = normalizer.apply({"files": ["x", "y"]})
+        assert one != two
+
+
+def _graph(*workspace_ids: str) -> ResourceGraph:
+    graph = ResourceGraph(schema=SCHEMA)
+    for workspace_id in workspace_ids:
+        graph.create("workspace", workspace_id)
+    return graph
+
+
+class TestCanonicalizer:
+    def test_resource_graph_states_collapse(self):
+        canonicalizer = Canonicalizer({"resources": ResourceGraph().normalizer()})
+        first = canonicalizer.canonicalize({"resources": _graph("a1", "b2").observe()})
+        second = canonicalizer.canonicalize({"resources": _graph("c3", "d4").observe()})
+        assert first.id == second.id
+        assert canonicalizer.stats() == {first.id: 2}
+        # Observations keep the raw data
+        ids = {entry["id"] for entry in second.observations["resources"].data["resources"]}
+        assert ids == {"c3", "d4"}
+
+    def test_mock_storage_file_names(self):
+        canonicalizer = Canonicalizer({"storage": MockStorage().normalizer()})
+        states = []
+        for name in ("report-1.pdf", "report-2.pdf"):
+            storage = MockStorage()
+            storage.put(name, "content")
+            states.append(canonicalizer.canonicalize({"storage": storage.observe()}))
+        assert states[0].id == states[1].id
+
+    def test_seen_observation_is_not_normalized_again(self):
+        applied = []
+        normalizer = Normalizer(ordinal_ids=["id"], custom=lambda data: applied.append(1) or data)
+        canonicalizer = Canonicalizer({"resources": normalizer})
+        graph = _graph("a1")
+        first = canonicalizer.canonicalize({"resources": graph.observe()})
+        second = canonicalizer.canonicalize({"resources": graph.observe()})
+        assert first.id == second.id
+        assert len(applied) == 1
+        # The same raw state is counted once
+        assert canonicalizer.collapsed == {first.id: 1}
+
+    def test_other_systems_hash_as_before(self):
+        obs = {"db": Observation(system="db", data={"id": 1})}
+        canonicalizer = Canonicalizer({"resources": Normalizer(ordinal_ids=["id"])})
+        assert canonicalizer.canonicalize(obs).id == State.create(obs).id
+        assert canonicalizer.stats() == {}
+
+
+class WorkspaceApi:
+    """Creates workspaces (at most two) under freshly generated IDs."""
+
+    def __init__(self, graph: ResourceGraph) -> None:
+        self.graph = graph
+
+    def create(self) -> ActionResult:
+        if self.graph.alive_count < 2:
+            self.graph.create("workspace", f"ws-{uuid.uuid4().hex[:8]}")
+        return ActionResult.from_response(HTTPRequest("POST", "/workspaces"), HTTPResponse(201))
+
+
+# Two routes to the same kind of resource: without canonicalization every
+# creation order is a new state because the generated IDs differ.
+ACTIONS = [
+    Action(name="create_workspace", execute=lambda api: api.create()),
+    Action(name="import_workspace", execute=lambda api: api.create()),
+]
+
+
+def _world(**kwargs) -> World:
+    graph = ResourceGraph(schema=SCHEMA)
+    return World(api=WorkspaceApi(graph), systems={"resources": graph}, **kwargs)
+
+
+def _explore(world: World):
+    return Agent(world=world, actions=ACTIONS, strategy=BFS(), max_steps=100).explore()
+
+
+class TestWorldCanonicalize:
+    def test_generated_ids_no_longer_split_states(self):
+        raw = _explore(_world())
+        canonical = _explore(_world(canonicalize=True))
+        assert raw.states_visited == 7
+        assert canonical.states_visited == 3
+        # Each canonical state past the initial one was reached under two IDs
+        assert sorted(canonical.canonical_collapse.values()) == [2, 2]
+        assert canonical.summary()["raw_states_collapsed"] == 2
+
+    def test_explicit_normalizer(self):
+        world = _world(normalizers={"resources": Normalizer(sort_lists=["resources"], ordinal_ids=["id"])})
+        assert _explore(world).states_visited == 3
+
+    def test_off_by_default(self):
+        world = _world()
+        assert world.canonicalizer is None
+        assert _explore(world).canonical_collapse == {}
+
+    def test_checkpointed_state_keeps_canonical_id(self):
+        world = _world(canonicalize=True)
+        world.api.create()
+        state = world.observe_and_checkpoint("one")
+        assert state.checkpoint_id is not None
+        assert state.id == world.observe().id
+
+    def test_parallel_agent_merges_replica_collapses(self):
+        agent = ParallelAgent(
+            world_factory=lambda: _world(canonicalize=True),
+            actions=ACTIONS,
+            strategy=BFS(),
+            workers=2,
+            max_steps=100,
+        )
+        result = agent.explore()
+        assert result.states_visited == 3
+        assert result.summary()["raw_states_collapsed"] > 0
@@ -0,0 +1,149 @@
+"""Tests for CheckpointManager and World checkpoint eviction."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import BFS, Agent, CheckpointManager, World
+from venomqa.v1.agent.parallel import ParallelAgent
+
+
+class TestCheckpointManager:
+    def test_unlimited_by_default(self):
+        manager = CheckpointManager()
+        for i in range(100):
+            manager.add(f"cp_{i}", 1000)
+        assert not manager.over_budget()
+        assert manager.victims() == []
+
+    def test_lru_order(self):
+        manager = CheckpointManager(max_checkpoints=2)
+        for cp in ("a", "b", "c"):
+            manager.add(cp)
+        manager.touch("a")
+        assert manager.victims(protect="c") == ["b"]
+
+    def test_exhausted_evicted_first_and_pinned_never(self):
+        manager = CheckpointManager(max_checkpoints=2)
+        for cp in ("a", "b", "c", "d"):
+            manager.add(cp)
+        manager.pin("a")
+        manager.mark_exhausted("c")
+        assert manager.victims(protect="d") == ["c", "b"]
+
+    def test_byte_budget(self):
+        manager = CheckpointManager(max_bytes=25)
+        for cp in ("a", "b", "c"):
+            manager.add(cp, 10)
+        assert manager.over_budget()
+        assert manager.victims(protect="c") == ["a"]
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            CheckpointManager(max_checkpoints=0)
+
+
+class TestWorldCheckpointBudget:
+    def test_release_frees_system_checkpoint(self):
+        world = counter_world()
+        store = world.systems["store"]
+        cp = world.checkpoint("one")
+
+        assert world.release(cp)
+        assert not world.has_checkpoint(cp)
+        assert store.released == [{"a": 0, "b": 0}]
+        assert not world.release(cp)
+        assert world.checkpoint_manager.released_count == 1
+
+    def test_evicts_over_budget(self):
+        world = counter_world(checkpoint_manager=CheckpointManager(max_checkpoints=3))
+        store = world.systems["store"]
+        ids = [world.checkpoint(f"cp{i}") for i in range(5)]
+
+        assert [world.has_checkpoint(cp) for cp in ids] == [False, False, True, True, True]
+        assert len(store.released) == 2
+        assert world.checkpoint_manager.evicted_count == 2
+
+    def test_byte_budget_uses_checkpoint_size(self):
+        world = counter_world(checkpoint_manager=CheckpointManager(max_bytes=20))
+        ids = [world.checkpoint(f"cp{i}") for i in range(3)]
+        assert [world.has_checkpoint(cp) for cp in ids] == [False, True, True]
+        assert world.checkpoint_manager.total_bytes == 20
+
+    def test_systems_without_release_are_supported(self):
+        system = MagicMock(spec=["checkpoint", "rollback", "observe"])
+        system.checkpoint.return_value = "sp"
+        world = World(api=MagicMock(), systems={"db": system})
+        assert world.release(world.checkpoint("x"))
+
+
+class TestAgentWithCheckpointBudget:
+    def test_explores_same_space_by_replaying_evicted_states(self):
+        unlimited = counter_world()
+        expected = Agent(world=unlimited, actions=counter_actions(), strategy=BFS()).explore()
+
+        world = counter_world(checkpoint_manager=CheckpointManager(max_checkpoints=2))
+        result = Agent(world=world, actions=counter_actions(), strategy=BFS()).explore()
+
+        assert result.states_visited == expected.states_visited == 9
+        assert {(t.from_state_id, t.action_name, t.to_state_id) for t in result.graph.transitions} == {
+            (t.from_state_id, t.action_name, t.to_state_id) for t in expected.graph.transitions
+        }
+        assert len(world.checkpoint_manager) <= 2
+        assert world.checkpoint_manager.evicted_count > 0
+        # Replays cost extra API calls
+        assert world.api.calls > unlimited.api.calls
+
+    def test_duplicate_state_checkpoints_are_released(self):
+        world = counter_world()
+        result = Agent(world=world, actions=counter_actions(), strategy=BFS()).explore()
+
+        # One checkpoint per distinct state survives; every other one was released.
+        assert len(world.checkpoint_manager) == result.states_visited
+        assert world.checkpoint_manager.released_count == (
+            result.transitions_taken + 1 - result.states_visited
+        )
+
+    def test_revisited_state_adopts_fresh_checkpoint(self):
+        world = counter_world()
+        agent = Agent(world=world, actions=counter_actions(), strategy=BFS())
+        state = agent._add_state(world.observe_and_checkpoint("first"))
+        world.release(state.checkpoint_id)
+
+        again = agent._add_state(world.observe_and_checkpoint("again"))
+        assert again.checkpoint_id != state.checkpoint_id
+        assert world.has_checkpoint(again.checkpoint_id)
+        assert agent.graph.get_state(state.id) is again
+
+    def test_replayed_state_is_checkpointed(self):
+        world = counter_world()
+        agent = Agent(world=world, actions=counter_actions(), strategy=BFS(), max_steps=1)
+        result = agent.explore()
+        reached = next(t.to_state_id for t in result.graph.transitions)
+        world.release(result.graph.get_state(reached).checkpoint_id)
+        calls = world.api.calls
+
+        agent._rollback_to(result.graph.get_state(reached))
+        agent._rollback_to(result.graph.get_state(reached))
+        # Replayed once, then rolled back to the adopted checkpoint
+        assert world.api.calls == calls + 1
+        assert world.has_checkpoint(result.graph.get_state(reached).checkpoint_id)
+
+    def test_parallel_replicas_mark_exhausted_states(self, monkeypatch):
+        marked = []
+        mark_exhausted = CheckpointManager.mark_exhausted
+
+        def record(manager, checkpoint_id):
+            marked.append(checkpoint_id)
+            mark_exhausted(manager, checkpoint_id)
+
+        monkeypatch.setattr(CheckpointManager, "mark_exhausted", record)
+        agent = ParallelAgent(
+            world_factory=counter_world, actions=counter_actions(), strategy=BFS(), workers=2
+        )
+        result = agent.explore()
+        assert result.states_visited == 9
+        assert marked
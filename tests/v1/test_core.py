@@ -1,6 +1,10 @@
 """Unit tests for core data objects."""
 
 
+import json
+import pickle
+import sys
+
 import pytest
 from venomqa.core.action import Action, ActionResult, HTTPRequest, HTTPResponse
 from venomqa.core.invariant import Invariant, Severity, Violation
@@ -9,6 +13,7 @@ from venomqa.core.state import Observation, State
 from venomqa.core.transition import Transition
 
 from venomqa.core.graph import Graph
+from venomqa.v1.core.action import shared_headers
 
 
 class TestObservation:
@@ -42,6 +47,28 @@ class TestState:
         assert state.id.startswith("s_")
         assert "db" in state.observations
 
+    def test_id_is_content_based(self):
+        a = State.create(observations={"db": Observation(system="db", data={"n": 1})})
+        b = State.create(observations={"db": Observation(system="db", data={"n": 1})})
+        c = State.create(observations={"db": Observation(system="db", data={"n": 2})})
+        assert a.id == b.id
+        assert a.id != c.id
+        assert len(a.content_hash()) == 16
+
+    def test_id_ignores_system_order(self):
+        db = Observation(system="db", data={"n": 1})
+        cache = Observation(system="cache", data={"k": "v"})
+        assert (
+            State.create(observations={"db": db, "cache": cache}).id
+            == State.create(observations={"cache": cache, "db": db}).id
+        )
+
+    def test_observation_hash_cached(self):
+        obs = Observation(system="db", data={"n": 1})
+        first = obs.content_hash()
+        obs.data["n"] = 2  # cached: mutation after hashing is not observed
+        assert obs.content_hash() == first
+
     def test_get_observation(self):
         obs = Observation(system="db", data={})
         state = State.create(observations={"db": obs})
@@ -112,6 +139,40 @@ class TestActionResult:
         assert not result.success
         assert result.error == "Connection refused"
 
+    def test_lean_drops_request_payload(self):
+        request = HTTPRequest("POST", "/users", headers={"a": "1"}, body={"name": "x"})
+        response = HTTPResponse(status_code=201, headers={"b": "2"}, body={"id": 1})
+        lean = ActionResult.from_response(request, response).lean()
+        assert (lean.request.method, lean.request.url) == ("POST", "/users")
+        assert lean.request.headers == {}
+        assert lean.request.body is None
+        assert lean.response is response
+
+    def test_slotted(self):
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        for obj in (result, result.request, HTTPResponse(200)):
+            assert not hasattr(obj, "__dict__")
+
+    def test_shared_headers(self):
+        first = shared_headers({"content-type": "application/json"})
+        second = shared_headers({"content-" + "type": "application/json"})
+        assert first == {"content-type": "application/json"}
+        assert second is first
+        assert shared_headers({"content-type": "text/plain"}) is not first
+
+    def test_shared_headers_are_read_only(self):
+        headers = shared_headers({"x-request-id": "1"})
+        with pytest.raises(TypeError):
+            headers["x-request-id"] = "2"
+        with pytest.raises(TypeError):
+            headers.update({"authorization": "secret"})
+        with pytest.raises(TypeError):
+            headers |= {"authorization": "secret"}
+        assert shared_headers({"x-request-id": "1"}) == {"x-request-id": "1"}
+        copy = pickle.loads(pickle.dumps(headers))
+        assert copy == headers
+        assert json.dumps(headers) == '{"x-request-id": "1"}'
+
 
 class TestTransition:
     def test_create(self):
@@ -126,6 +187,13 @@ class TestTransition:
         assert transition.from_state_id == "s_1"
         assert transition.to_state_id == "s_2"
 
+    def test_slotted_and_interned(self):
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        name = "".join(["log", "in"])
+        transition = Transition.create("s_1", name, "s_2", result)
+        assert not hasattr(transition, "__dict__")
+        assert transition.action_name is sys.intern("login")
+
 
 class TestGraph:
     def test_add_state(self):
@@ -149,6 +217,25 @@ class TestGraph:
         assert graph.transition_count == 1
         assert graph.is_explored("s_1", "action")
 
+    def test_action_usage_statistics(self):
+        a1 = Action(name="a1", execute=lambda api: None)
+        a2 = Action(name="a2", execute=lambda api: None)
+        graph = Graph([a1, a2])
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        assert graph.used_action_count == 0
+        assert graph.unused_action_names == ["a1", "a2"]
+
+        graph.add_transition(Transition.create("s_1", "a1", "s_2", result))
+        graph.add_transition(Transition.create("s_2", "a1", "s_3", result))
+        # Duplicate (from, action, to) is not counted twice
+        graph.add_transition(Transition.create("s_2", "a1", "s_3", result))
+
+        assert graph.used_action_names == {"a1"}
+        assert graph.used_action_count == 1
+        assert graph.unused_action_names == ["a2"]
+        assert graph.action_call_counts["a1"] == 2
+        assert graph.get_action_call_count("a2") == 0
+
     def test_get_valid_actions(self):
         action1 = Action(name="a1", execute=lambda api: None)
         action2 = Action(name="a2", execute=lambda api: None, preconditions=[lambda s: False])
@@ -170,6 +257,67 @@ class TestGraph:
         assert len(unexplored) == 1
         assert unexplored[0] == (state, action)
 
+    def test_unexplored_index_tracks_explored_pairs(self):
+        a1 = Action(name="a1", execute=lambda api: None)
+        a2 = Action(name="a2", execute=lambda api: None)
+        a3 = Action(name="a3", execute=lambda api: None, preconditions=[lambda s: False])
+        graph = Graph([a1, a2, a3])
+        s1 = graph.add_state(State(id="s_1", observations={}))
+        s2 = graph.add_state(State(id="s_2", observations={}))
+
+        assert graph.unexplored_count() == 4
+        assert graph.first_unexplored() == (s1, a1)
+
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        graph.add_transition(Transition.create("s_1", "a1", "s_2", result))
+        graph.mark_explored("s_1", "a2")
+        graph.mark_noop("s_2", "a1")
+
+        assert graph.unexplored_count() == 1
+        assert graph.first_unexplored() == (s2, a2)
+        assert graph.get_unexplored() == [(s2, a2)]
+        assert not graph.is_unexplored("s_1", "a1")
+
+    def test_unexplored_index_respects_max_calls(self):
+        limited = Action(name="limited", execute=lambda api: None, max_calls=1)
+        other = Action(name="other", execute=lambda api: None)
+        graph = Graph([limited, other])
+        graph.add_state(State(id="s_1", observations={}))
+        graph.add_state(State(id="s_2", observations={}))
+        assert graph.unexplored_count("limited") == 2
+
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        graph.add_transition(Transition.create("s_1", "limited", "s_3", result))
+        graph.add_state(State(id="s_3", observations={}))
+
+        assert graph.unexplored_count("limited") == 0
+        assert graph.unexplored_action_names() == ["other"]
+        assert graph.unexplored_count() == 3
+
+    def test_sample_unexplored(self):
+        import random
+
+        actions = [Action(name=f"a{i}", execute=lambda api: None) for i in range(5)]
+        graph = Graph(actions)
+        graph.add_state(State(id="s_1", observations={}))
+        rng = random.Random(0)
+        seen = set()
+        while graph.has_unexplored():
+            state, action = graph.sample_unexplored(rng)
+            seen.add(action.name)
+            graph.mark_explored(state.id, action.name)
+        assert seen == {a.name for a in actions}
+        assert graph.sample_unexplored(rng) is None
+        assert graph.first_unexplored() is None
+
+    def test_add_action_indexes_existing_states(self):
+        graph = Graph()
+        state = graph.add_state(State(id="s_1", observations={}))
+        assert not graph.has_unexplored()
+        action = Action(name="late", execute=lambda api: None)
+        graph.add_action(action)
+        assert graph.first_unexplored() == (state, action)
+
     def test_get_path_to(self):
         graph = Graph()
         s1 = State(id="s_1", observations={})
@@ -190,6 +338,31 @@ class TestGraph:
         assert path[0].id == "t_1"
         assert path[1].id == "t_2"
 
+    def test_get_path_to_follows_later_shortcut(self):
+        graph = Graph()
+        for sid in ("s_1", "s_2", "s_3", "s_4"):
+            graph.add_state(State(id=sid, observations={}))
+
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        graph.add_transition(Transition(id="t_1", from_state_id="s_1", action_name="a", to_state_id="s_2", result=result))
+        graph.add_transition(Transition(id="t_2", from_state_id="s_2", action_name="b", to_state_id="s_3", result=result))
+        graph.add_transition(Transition(id="t_3", from_state_id="s_3", action_name="c", to_state_id="s_4", result=result))
+        assert [t.id for t in graph.get_path_to("s_4")] == ["t_1", "t_2", "t_3"]
+
+        # A shortcut s_1 -> s_3 shortens the path to s_3 and everything below it
+        graph.add_transition(Transition(id="t_4", from_state_id="s_1", action_name="d", to_state_id="s_3", result=result))
+        assert [t.id for t in graph.get_path_to("s_4")] == ["t_4", "t_3"]
+        assert graph.get_depth("s_4") == 2
+        assert [t.id for t in graph.get_outgoing("s_1")] == ["t_1", "t_4"]
+
+    def test_get_path_to_unreachable(self):
+        graph = Graph()
+        graph.add_state(State(id="s_1", observations={}))
+        result = ActionResult(success=True, request=HTTPRequest("GET", "/"))
+        graph.add_transition(Transition(id="t_1", from_state_id="s_9", action_name="a", to_state_id="s_2", result=result))
+        assert graph.get_path_to("s_2") == []
+        assert graph.get_depth("s_2") is None
+
 
 class TestInvariant:
     def test_create(self):
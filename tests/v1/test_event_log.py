@@ -0,0 +1,141 @@
+"""Tests for the streaming exploration event log."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from tests.v1.counters import CounterApi, CounterStore, counter_actions
+from venomqa import (
+    BFS,
+    ActionResult,
+    Agent,
+    HTTPRequest,
+    HTTPResponse,
+    Invariant,
+    World,
+)
+from venomqa.exploration import EventLog, Transition
+from venomqa.v1.cli.main import _load_event_log_report
+from venomqa.v1.reporters.json import JSONReporter
+
+
+class VerboseCounterApi(CounterApi):
+    """Responses with headers and a large body, for compaction to drop."""
+
+    def post(self, path: str) -> ActionResult:
+        value = super().post(path).response.body["value"]
+        key = path.strip("/")
+        return ActionResult.from_response(
+            HTTPRequest("POST", path, headers={"x-key": key}, body={"key": key}),
+            HTTPResponse(201, headers={"content-type": "application/json"},
+                         body={"value": value, "pad": "x" * 500}),
+        )
+
+
+def _explore(event_log, invariants=(), lean=False):
+    store = CounterStore()
+    agent = Agent(
+        world=World(api=VerboseCounterApi(store), systems={"store": store}),
+        actions=counter_actions(),
+        invariants=list(invariants),
+        strategy=BFS(),
+        event_log=event_log,
+        lean=lean,
+    )
+    return agent.explore()
+
+
+class TestAgentEventLog:
+    def test_graph_keeps_compact_transitions(self, tmp_path):
+        result = _explore(tmp_path / "run.jsonl.gz")
+
+        t = result.graph.transitions[0]
+        assert t.result.status_code == 201
+        assert t.result.request.method == "POST"
+        assert t.result.request.body is None
+        assert t.result.response.body is None
+        assert t.result.headers == {}
+
+        full = result.action_result(t)
+        assert full.response.body["value"] == 1
+        assert full.request.headers == {"x-key": "a"}
+        assert full.headers == {"content-type": "application/json"}
+
+    def test_log_holds_states_transitions_and_violations(self, tmp_path):
+        path = tmp_path / "run.jsonl.gz"
+        a_below_2 = Invariant(name="a_below_2", check=lambda w: w.systems["store"].data["a"] < 2)
+        result = _explore(path, invariants=[a_below_2])
+
+        # Plain gzip JSONL
+        with gzip.open(path, "rt") as f:
+            events = [json.loads(line) for line in f]
+        by_type: dict[str, list[dict]] = {}
+        for event in events:
+            by_type.setdefault(event["type"], []).append(event)
+
+        assert len(by_type["state"]) == result.states_visited
+        assert len(by_type["transition"]) >= result.transitions_taken
+        assert [v["id"] for v in by_type["violation"]] == [v.id for v in result.violations]
+        assert by_type["state"][0]["observations"]["store"]["data"] == {"a": 0, "b": 0}
+
+    def test_without_event_log_results_are_kept(self):
+        result = _explore(None)
+        assert result.event_log is None
+        t = result.graph.transitions[0]
+        assert t.result.response.body["value"] == 1
+        assert result.action_result(t) is t.result
+
+    def test_lean_mode_keeps_responses_only(self):
+        result = _explore(None, lean=True)
+        t = result.graph.transitions[0]
+        assert t.result.request.body is None
+        assert t.result.request.headers == {}
+        assert t.result.response.body["value"] == 1
+
+
+class TestEventLog:
+    def test_load_result_across_blocks(self, tmp_path):
+        log = EventLog(tmp_path / "run.jsonl.gz", block_events=3)
+        result = _explore(log)
+        assert len(log._blocks) > 1
+        for t in reversed(result.graph.transitions):
+            assert result.action_result(t).response.body["pad"] == "x" * 500
+
+    def test_load_result_before_flush(self, tmp_path):
+        log = EventLog(tmp_path / "run.jsonl.gz")
+        result = ActionResult.from_response(HTTPRequest("GET", "/x"), HTTPResponse(200, body=[1]))
+        compact = log.write_transition(Transition.create("s_a", "get", "s_a", result))
+        assert compact.result.response.body is None
+        assert log.load_result(compact.id).response.body == [1]
+        assert log.load_result("t_missing") is None
+        log.close()
+
+    def test_rejects_bad_block_size(self, tmp_path):
+        with pytest.raises(ValueError, match="block_events"):
+            EventLog(tmp_path / "run.jsonl.gz", block_events=0)
+
+
+class TestReporting:
+    def test_json_reporter_includes_bodies(self, tmp_path):
+        result = _explore(tmp_path / "run.jsonl.gz")
+        report = json.loads(JSONReporter(include_bodies=True).report(result))
+        transition = report["graph"]["transitions"][0]
+        assert transition["status_code"] == 201
+        assert transition["response"]["body"]["value"] == 1
+
+        compact = json.loads(JSONReporter().report(result))["graph"]["transitions"][0]
+        assert "response" not in compact
+
+    def test_replay_reads_event_log(self, tmp_path):
+        path = tmp_path / "run.jsonl.gz"
+        a_below_2 = Invariant(name="a_below_2", check=lambda w: w.systems["store"].data["a"] < 2)
+        _explore(path, invariants=[a_below_2])
+
+        report, recorded = _load_event_log_report(path)
+        violation = report["violations"][0]
+        assert violation["reproduction_path"] == ["inc_a", "inc_a"]
+        steps = [recorded[t] for t in violation["transition_ids"]]
+        assert [s["response"]["body"]["value"] for s in steps] == [1, 2]
@@ -0,0 +1,119 @@
+"""Tests for how the Agent evaluates invariants (caching, concurrency, timing)."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import BFS, Agent, Invariant, World
+from venomqa.v1.dsl.decorators import invariant
+
+
+def _explore(invariants: list[Invariant], invariant_workers: int = 1):
+    agent = Agent(
+        world=counter_world(),
+        actions=counter_actions(),
+        invariants=invariants,
+        strategy=BFS(),
+        invariant_workers=invariant_workers,
+    )
+    return agent.explore()
+
+
+class TestPureInvariantCache:
+    def test_pure_invariant_runs_once_per_state(self):
+        calls: list[dict] = []
+
+        def check(world):
+            calls.append(dict(world.systems["store"].data))
+            return True
+
+        result = _explore([Invariant(name="pure", check=check, pure=True)])
+
+        # 3x3 counter grid: one evaluation per state reached by an action
+        assert len(calls) == result.states_visited - 1
+        assert result.invariant_stats["cache_hits"] == result.transitions_taken - len(calls)
+        assert result.invariant_cache_hit_rate > 0
+        assert result.summary()["invariant_cache_hits"] == result.invariant_stats["cache_hits"]
+
+    def test_impure_invariant_runs_every_transition(self):
+        calls = []
+        result = _explore([Invariant(name="impure", check=lambda w: calls.append(1) or True)])
+        assert len(calls) == result.transitions_taken
+        assert result.invariant_stats["cache_hits"] == 0
+        assert result.invariant_cache_hit_rate == 0.0
+
+    def test_cached_failure_reported_once(self):
+        @invariant(name="a_below_two", pure=True)
+        def a_below_two(world):
+            return world.systems["store"].data["a"] < 2
+
+        result = _explore([a_below_two])
+        states_with_a2 = {
+            v.state.id for v in result.violations if v.invariant_name == "a_below_two"
+        }
+        assert len(states_with_a2) == len(result.violations) == 3
+
+    def test_exceptions_are_not_cached(self):
+        calls = []
+
+        def flaky(world):
+            calls.append(1)
+            raise RuntimeError("backend unavailable")
+
+        result = _explore([Invariant(name="flaky", check=flaky, pure=True)])
+        assert len(calls) == result.transitions_taken
+        assert result.invariant_stats["cache_hits"] == 0
+
+
+class TestConcurrentInvariants:
+    def test_parallel_safe_invariants_run_concurrently(self):
+        # Each check waits for the other two: only passes if all three overlap
+        barrier = threading.Barrier(3, timeout=5)
+
+        def rendezvous(world):
+            barrier.wait()
+            return True
+
+        invariants = [
+            Invariant(name=f"read_{i}", check=rendezvous, parallel_safe=True) for i in range(3)
+        ]
+        result = _explore(invariants, invariant_workers=3)
+        assert result.violations == []
+        assert result.invariant_stats["checks"] == 3 * result.transitions_taken
+
+    def test_violation_order_matches_invariant_order(self):
+        def fails_slowly(world):
+            threading.Event().wait(0.01)
+            return "slow"
+
+        invariants = [
+            Invariant(name="first", check=fails_slowly, parallel_safe=True),
+            Invariant(name="serial", check=lambda w: "serial"),
+            Invariant(name="last", check=lambda w: "fast", parallel_safe=True),
+        ]
+        serial = _explore(invariants)
+        concurrent = _explore(invariants, invariant_workers=4)
+        names = [v.invariant_name for v in concurrent.violations]
+        assert names == [v.invariant_name for v in serial.violations]
+        assert names[:3] == ["first", "serial", "last"]
+
+    def test_latency_reported_per_invariant(self):
+        def slow(world):
+            threading.Event().wait(0.005)
+            return True
+
+        result = _explore([
+            Invariant(name="fast", check=lambda w: True),
+            Invariant(name="slow", check=slow),
+        ])
+        latency = result.invariant_latency
+        assert list(latency) == ["slow", "fast"]
+        assert latency["slow"]["calls"] == result.transitions_taken
+        assert latency["slow"]["mean_ms"] >= 5
+
+    def test_rejects_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            Agent(world=World(api=None, state_from_context=[]), actions=[], invariant_workers=0)
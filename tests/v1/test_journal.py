@@ -0,0 +1,198 @@
+"""Tests for the exploration journal and Agent.resume()."""
+
+from __future__ import annotations
+
+import pytest
+from venomqa.core.state import Observation, State
+
+from tests.v1.counters import CounterApi, CounterStore, counter_actions
+from venomqa import (
+    BFS,
+    DFS,
+    ActionResult,
+    Agent,
+    HTTPRequest,
+    HTTPResponse,
+    Invariant,
+    World,
+)
+from venomqa.exploration import ExplorationJournal, Graph, Transition
+from venomqa.v1.agent.parallel import ParallelAgent
+
+ACTIONS = counter_actions()
+
+NO_A3 = Invariant(
+    name="a_below_3",
+    check=lambda world: world.systems["store"].data["a"] < 3,
+)
+
+
+def _world(start: int = 0) -> World:
+    store = CounterStore(a=start)
+    return World(api=CounterApi(store, limit=3), systems={"store": store})
+
+
+def _agent(journal=None, strategy=None, max_steps=1000, start=0, invariants=()):
+    return Agent(
+        world=_world(start),
+        actions=ACTIONS,
+        invariants=list(invariants),
+        strategy=strategy or BFS(),
+        max_steps=max_steps,
+        journal=journal,
+        journal_every=2,
+    )
+
+
+def _edges(graph: Graph) -> set[tuple[str, str, str]]:
+    return {(t.from_state_id, t.action_name, t.to_state_id) for t in graph.transitions}
+
+
+class TestJournal:
+    def test_restore_rebuilds_graph(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        result = _agent(journal=path).explore()
+
+        graph = Graph(ACTIONS)
+        journal = ExplorationJournal(path)
+        journal.restore(graph)
+        journal.close()
+
+        assert graph.initial_state_id == result.graph.initial_state_id
+        assert set(graph.states) == set(result.graph.states)
+        assert _edges(graph) == _edges(result.graph)
+        assert graph.explored_pairs == result.graph.explored_pairs
+        assert dict(graph.action_call_counts) == dict(result.graph.action_call_counts)
+        state = graph.get_state(graph.initial_state_id)
+        assert state.checkpoint_id is None
+        assert state.observations["store"].data == {"a": 0, "b": 0}
+        assert graph.transitions[0].result.response.body == {"value": 1}
+
+    def test_record_appends_only_new_rows(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        _agent(journal=path, max_steps=3).explore()
+        journal = ExplorationJournal(path)
+        counts = dict(journal._written)
+        journal.record(Graph(ACTIONS))
+        assert journal._written == counts
+        journal.close()
+
+    def test_unpicklable_body_stored_as_repr(self, tmp_path):
+        graph = Graph(ACTIONS)
+        state = graph.add_state(_state({"a": 0}))
+        to_state = graph.add_state(_state({"a": 1}))
+        request = HTTPRequest("POST", "/a", body=lambda: None)
+        graph.add_transition(Transition.create(
+            state.id, "inc_a", to_state.id,
+            ActionResult.from_response(request, HTTPResponse(200)),
+        ))
+        journal = ExplorationJournal(tmp_path / "run.venomqa")
+        journal.record(graph)
+        restored = Graph(ACTIONS)
+        journal.restore(restored)
+        journal.close()
+        assert restored.transitions[0].result.request.body.startswith("<function")
+
+    def test_rejects_incompatible_version(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        ExplorationJournal(path).close()
+        import sqlite3
+
+        conn = sqlite3.connect(path)
+        conn.execute("UPDATE meta SET value = '0' WHERE key = 'journal_version'")
+        conn.commit()
+        conn.close()
+        with pytest.raises(ValueError, match="incompatible"):
+            ExplorationJournal(path)
+
+
+def _state(data: dict) -> State:
+    return State.create({"store": Observation(system="store", data=data)})
+
+
+class TestAgentResume:
+    @pytest.mark.parametrize("strategy", [BFS, DFS])
+    def test_resume_finishes_interrupted_run(self, tmp_path, strategy):
+        full = _agent(strategy=strategy()).explore()
+
+        path = tmp_path / "run.venomqa"
+        first = _agent(journal=path, strategy=strategy(), max_steps=5).explore()
+        assert first.truncated_by_max_steps
+
+        resumed = _agent(strategy=strategy()).resume(path)
+        assert not resumed.truncated_by_max_steps
+        assert set(resumed.graph.states) == set(full.graph.states)
+        assert _edges(resumed.graph) == _edges(full.graph)
+
+    def test_resume_across_several_jobs(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        _agent(journal=path, max_steps=4).explore()
+        for _ in range(10):
+            result = _agent(max_steps=4).resume(path)
+            if not result.truncated_by_max_steps:
+                break
+        assert result.states_visited == 16
+        assert not result.truncated_by_max_steps
+
+    def test_resume_checkpoints_replayed_states(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        _agent(journal=path, max_steps=6).explore()
+
+        agent = _agent()
+        agent.resume(path)
+        # Every state explored from after the resume was reached once by replay
+        # and checkpointed then
+        checkpointed = [s for s in agent.graph.iter_states() if s.checkpoint_id]
+        assert len(checkpointed) > 1
+
+    def test_violations_survive_resume(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        first = _agent(journal=path, strategy=DFS(), max_steps=3, invariants=[NO_A3]).explore()
+        assert len(first.violations) == 1
+
+        resumed = _agent(strategy=DFS(), invariants=[NO_A3]).resume(path)
+        names = [(v.invariant_name, v.state.id) for v in resumed.violations]
+        # Recorded once, not re-reported when the state is reached again
+        assert len(names) == len(set(names))
+        restored = resumed.violations[0]
+        assert restored.id == first.violations[0].id
+        assert [t.id for t in restored.reproduction_path] == [
+            t.id for t in first.violations[0].reproduction_path
+        ]
+
+    def test_parallel_agent_resume(self, tmp_path):
+        def parallel(**kwargs):
+            return ParallelAgent(
+                world_factory=_world, actions=ACTIONS, strategy=BFS(), workers=3,
+                journal_every=2, **kwargs,
+            )
+
+        full = _agent().explore()
+        path = tmp_path / "run.venomqa"
+        first = parallel(journal=path, max_steps=7).explore()
+        assert first.truncated_by_max_steps
+
+        resumed = parallel().resume(path)
+        assert not resumed.truncated_by_max_steps
+        assert set(resumed.graph.states) == set(full.graph.states)
+        assert _edges(resumed.graph) == _edges(full.graph)
+
+    def test_explore_refuses_existing_journal(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        _agent(journal=path, max_steps=2).explore()
+        with pytest.raises(ValueError, match="resume"):
+            _agent(journal=path).explore()
+
+    def test_resume_requires_same_initial_state(self, tmp_path):
+        path = tmp_path / "run.venomqa"
+        _agent(journal=path, max_steps=2).explore()
+        with pytest.raises(ValueError, match="initial state"):
+            _agent(start=1).resume(path)
+
+    def test_resume_empty_journal(self, tmp_path):
+        with pytest.raises(ValueError, match="no exploration"):
+            _agent().resume(tmp_path / "missing.venomqa")
+
+    def test_journal_every_validated(self):
+        with pytest.raises(ValueError, match="journal_every"):
+            Agent(world=World(api=None, state_from_context=[]), actions=ACTIONS, journal_every=0)
@@ -3,10 +3,14 @@
 from datetime import datetime
 
 import pytest
+from venomqa.adapters.mock_http_server import MockHTTPServer
 from venomqa.adapters.mock_mail import MockMail
 from venomqa.adapters.mock_queue import MockQueue
 from venomqa.adapters.mock_storage import MockStorage
 from venomqa.adapters.mock_time import MockTime
+from venomqa.core.state import Observation
+
+from venomqa.sandbox.persistent import PMap
 
 
 class TestMockQueue:
@@ -47,6 +51,20 @@ class TestMockQueue:
         queue.rollback(cp)
         assert queue.pending_count == 1
 
+    def test_rollback_undoes_pop(self):
+        queue = MockQueue()
+        queue.push("a")
+        cp = queue.checkpoint("before_pop")
+
+        msg = queue.pop()
+        assert msg.processed
+        assert queue.pending_count == 0
+
+        queue.rollback(cp)
+        assert queue.pending_count == 1
+        assert queue.processed_count == 0
+        assert not queue.peek().processed
+
     def test_observe(self):
         queue = MockQueue(name="tasks")
         queue.push("a")
@@ -90,6 +108,7 @@ class TestMockMail:
 
         mail.rollback(cp)
         assert mail.sent_count == 1
+        assert mail.observe().data["recipients"] == ["a@ex.com"]
 
     def test_observe(self):
         mail = MockMail()
@@ -147,6 +166,20 @@ class TestMockStorage:
         assert storage.file_count == 1
         assert not storage.exists("file2.txt")
 
+    def test_total_size_tracks_overwrite_delete_and_rollback(self):
+        storage = MockStorage()
+        storage.put("a.txt", b"1234")
+        cp = storage.checkpoint("cp")
+        storage.put("a.txt", b"12")
+        storage.put("b.txt", b"123")
+        assert storage.total_size == 5
+        storage.delete("b.txt")
+        assert storage.total_size == 2
+
+        storage.rollback(cp)
+        assert storage.total_size == 4
+        assert storage.get("a.txt").content == b"1234"
+
     def test_observe(self):
         storage = MockStorage(bucket="uploads")
         storage.put("a.txt", b"123")
@@ -203,3 +236,35 @@ class TestMockTime:
         assert obs.system == "time"
         assert obs.data["frozen"]
         assert "2024-01-01" in obs.data["current"]
+
+
+class _PersistentServer(MockHTTPServer):
+    state: PMap = PMap({"users": PMap()})
+
+    def __init__(self) -> None:
+        super().__init__("persistent")
+
+    @staticmethod
+    def get_state_snapshot() -> PMap:
+        return _PersistentServer.state
+
+    @staticmethod
+    def rollback_from_snapshot(snapshot: PMap) -> None:
+        _PersistentServer.state = snapshot
+
+    def observe_from_state(self, state: PMap) -> Observation:
+        return Observation(system=self.name, data={"user_count": len(state["users"])})
+
+
+class TestMockHTTPServerPersistentState:
+    def test_pmap_snapshot_is_shared_not_copied(self):
+        server = _PersistentServer()
+        _PersistentServer.state = _PersistentServer.state.set_in(("users", "u1"), "Alice")
+        cp = server.checkpoint("one_user")
+        assert cp is _PersistentServer.state
+
+        _PersistentServer.state = _PersistentServer.state.set_in(("users", "u2"), "Bob")
+        assert server.observe().data["user_count"] == 2
+
+        server.rollback(cp)
+        assert server.observe().data["user_count"] == 1
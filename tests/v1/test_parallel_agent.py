@@ -0,0 +1,74 @@
+"""Tests for ParallelAgent (multi-replica exploration)."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import BFS, Agent, Invariant, ParallelAgent, Severity, World
+
+
+class TestParallelAgent:
+    def test_explores_same_state_space_as_sequential_agent(self):
+        sequential = Agent(world=counter_world(), actions=counter_actions(), strategy=BFS()).explore()
+
+        parallel = ParallelAgent(
+            world_factory=counter_world, actions=counter_actions(), workers=3
+        ).explore()
+
+        assert parallel.states_visited == sequential.states_visited == 9
+        assert {(t.from_state_id, t.action_name, t.to_state_id) for t in parallel.graph.transitions} == {
+            (t.from_state_id, t.action_name, t.to_state_id) for t in sequential.graph.transitions
+        }
+        assert not parallel.truncated_by_max_steps
+
+    def test_work_is_spread_across_replicas(self):
+        threads: list[str] = []
+        world_factory = partial(counter_world, threads=threads)
+        agent = ParallelAgent(world_factory=world_factory, actions=counter_actions(), workers=2)
+        agent.explore()
+
+        assert len(agent.replicas) == 2
+        assert len({name for name in threads if name.startswith("venomqa-worker")}) >= 1
+
+    def test_violations_are_reported_once(self):
+        inv = Invariant(
+            name="a_below_two",
+            check=lambda world: world.systems["store"].data["a"] < 2,
+            severity=Severity.HIGH,
+        )
+        result = ParallelAgent(
+            world_factory=counter_world, actions=counter_actions(), invariants=[inv], workers=4
+        ).explore()
+
+        # a == 2 in states (2, 0), (2, 1), (2, 2)
+        assert len(result.violations) == 3
+        assert len({v.state.id for v in result.violations}) == 3
+        for v in result.violations:
+            assert [t.action_name for t in v.reproduction_path].count("inc_a") == 2
+
+    def test_max_steps_is_respected(self):
+        result = ParallelAgent(
+            world_factory=counter_world, actions=counter_actions(), workers=4, max_steps=5
+        ).explore()
+        assert result.transitions_taken == 5
+        assert result.truncated_by_max_steps
+
+    def test_replicas_must_agree_on_initial_state(self):
+        made = []
+
+        def make_world() -> World:
+            world = counter_world()
+            world.systems["store"].data["a"] = len(made)  # each replica starts differently
+            made.append(world)
+            return world
+
+        agent = ParallelAgent(world_factory=make_world, actions=counter_actions(), workers=2)
+        with pytest.raises(ValueError, match="disagree on the initial state"):
+            agent.explore()
+
+    def test_rejects_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            ParallelAgent(world_factory=counter_world, actions=counter_actions(), workers=0)
@@ -0,0 +1,196 @@
+"""Tests for partial-order reduction over action footprints."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+from venomqa.core.state import Observation
+
+from venomqa import (
+    BFS,
+    DFS,
+    Action,
+    ActionResult,
+    Agent,
+    HTTPRequest,
+    HTTPResponse,
+    Invariant,
+    World,
+)
+from venomqa.exploration import Footprint, Graph, SleepSets, Transition
+from venomqa.v1.generators.openapi_actions import generate_actions
+
+
+class Store:
+    def __init__(self, kinds) -> None:
+        self.data = dict.fromkeys(kinds, 0)
+
+    def checkpoint(self, name: str) -> dict:
+        return copy.deepcopy(self.data)
+
+    def rollback(self, checkpoint: dict) -> None:
+        self.data = copy.deepcopy(checkpoint)
+
+    def observe(self) -> Observation:
+        return Observation(system="store", data=dict(self.data))
+
+
+class Api:
+    def __init__(self, store: Store) -> None:
+        self.store = store
+
+    def create(self, kind: str) -> ActionResult:
+        if self.store.data[kind] < 2:
+            self.store.data[kind] += 1
+        return ActionResult.from_response(HTTPRequest("POST", f"/{kind}s"), HTTPResponse(201))
+
+
+def _create(kind: str, **footprint) -> Action:
+    return Action(
+        name=f"create_{kind}",
+        execute=lambda api: api.create(kind),
+        **footprint,
+    )
+
+
+KINDS = ("user", "product", "order")
+
+
+def _actions(declared: bool = True) -> list[Action]:
+    return [_create(k, writes=[k]) if declared else _create(k) for k in KINDS]
+
+
+def _explore(actions, strategy=None, invariants=(), **kwargs):
+    store = Store(KINDS)
+    world = World(api=Api(store), systems={"store": store})
+    agent = Agent(
+        world=world,
+        actions=actions,
+        invariants=list(invariants),
+        strategy=strategy or BFS(),
+        max_steps=1000,
+        **kwargs,
+    )
+    return agent.explore()
+
+
+class TestFootprint:
+    def test_writes_default_reads(self):
+        fp = Footprint.of(Action(name="x", execute=lambda api: None, writes=["user"]))
+        assert fp == Footprint(reads=frozenset({"user"}), writes=frozenset({"user"}))
+
+    def test_requires_are_read(self):
+        action = Action(name="x", execute=lambda api: None, writes=["project"])
+        action.requires = ["workspace"]
+        assert Footprint.of(action).reads == frozenset({"project", "workspace"})
+
+    def test_undeclared_conflicts_with_writers(self):
+        unknown = Footprint.of(Action(name="x", execute=lambda api: None))
+        writer = Footprint.of(Action(name="y", execute=lambda api: None, writes=["user"]))
+        reader = Footprint.of(Action(name="z", execute=lambda api: None, read_only=True))
+        assert unknown.conflicts_with(writer)
+        assert unknown.conflicts_with(reader)
+        assert reader.conflicts_with(writer)
+        assert not reader.conflicts_with(reader)
+
+    def test_disjoint_writers_commute(self):
+        sleep_sets = SleepSets(_actions())
+        assert sleep_sets.independent("create_user", "create_product")
+        assert not sleep_sets.independent("create_user", "create_user")
+        assert not SleepSets(_actions(declared=False)).independent("create_user", "create_product")
+
+
+class TestAgentPor:
+    @pytest.mark.parametrize("strategy", [BFS, DFS])
+    def test_same_states_with_fewer_transitions(self, strategy):
+        full = _explore(_actions(), strategy())
+        reduced = _explore(_actions(), strategy(), por=True)
+        assert set(reduced.graph.states) == set(full.graph.states)
+        assert reduced.states_visited == 27
+        assert reduced.transitions_taken < full.transitions_taken
+        assert reduced.por_stats["pairs_pruned"] > 0
+        assert reduced.summary()["pairs_pruned"] == reduced.por_stats["pairs_pruned"]
+        assert not reduced.graph.has_unexplored()
+
+    def test_undeclared_footprints_prune_nothing(self):
+        full = _explore(_actions(declared=False))
+        reduced = _explore(_actions(declared=False), por=True)
+        assert reduced.transitions_taken == full.transitions_taken
+        assert reduced.por_stats["pairs_pruned"] == 0
+
+    def test_violations_still_found(self):
+        both = Invariant(
+            name="not_user_and_order",
+            check=lambda w: not (w.systems["store"].data["user"] and w.systems["store"].data["order"]),
+        )
+        result = _explore(_actions(), invariants=[both], por=True)
+        assert {v.invariant_name for v in result.violations} == {"not_user_and_order"}
+
+    def test_off_by_default(self):
+        result = _explore(_actions())
+        assert result.por_stats == {}
+
+
+class TestGraphSleep:
+    def test_sleeping_pair_is_skipped_until_woken(self):
+        from venomqa.core.state import State
+
+        actions = _actions()
+        graph = Graph(actions)
+        state = graph.add_state(State.create({"s": Observation(system="s", data={})}))
+        assert graph.sleep(state.id, "create_user")
+        assert graph.is_explored(state.id, "create_user")
+        assert not graph.is_unexplored(state.id, "create_user")
+        assert graph.sleeping_count == 1
+        assert graph.explored_count == 0
+
+        assert graph.wake(state.id, "create_user")
+        assert graph.is_unexplored(state.id, "create_user")
+        assert not graph.wake(state.id, "create_user")
+
+
+class TestSleepSets:
+    def test_only_valid_actions_go_to_sleep(self):
+        from venomqa.core.state import State
+
+        actions = _actions()
+        graph = Graph(actions)
+        states = [
+            graph.add_state(State.create({"s": Observation(system="s", data={"n": n})}))
+            for n in range(3)
+        ]
+        result = ActionResult.from_response(HTTPRequest("POST", "/"), HTTPResponse(201))
+        for name, to_state in (("create_product", states[1]), ("create_user", states[2])):
+            graph.add_transition(Transition.create(states[0].id, name, to_state.id, result))
+        sleep_sets = SleepSets(actions)
+        sleep_sets.start(states[0].id)
+
+        # create_product has used up its calls: nothing to prune in states[2]
+        sleep_sets.after(
+            graph, states[0].id, "create_user", states[2].id, valid={"create_user", "create_order"}
+        )
+        assert sleep_sets.asleep(states[2].id) == frozenset()
+        assert graph.sleeping_count == 0
+        assert graph.is_unexplored(states[2].id, "create_order")
+
+
+def test_openapi_footprints():
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {
+            "/users": {"post": {"operationId": "create_user"}},
+            "/products": {"post": {"operationId": "create_product"}},
+            "/workspaces/{workspace_id}/projects": {
+                "post": {"operationId": "create_project"},
+                "get": {"operationId": "list_projects"},
+            },
+        },
+    }
+    actions = {a.name: a for a in generate_actions(spec)}
+    assert actions["create_user"].writes == ["user"]
+    assert actions["create_project"].reads == ["workspace", "project"]
+    assert actions["list_projects"].writes == []
+    sleep_sets = SleepSets(list(actions.values()))
+    assert sleep_sets.independent("create_user", "create_product")
+    assert not sleep_sets.independent("create_project", "list_projects")
@@ -0,0 +1,102 @@
+"""Unit tests for the persistent PMap / PVector containers."""
+
+from __future__ import annotations
+
+import pickle
+import random
+
+import pytest
+
+from venomqa.sandbox.persistent import PMap, PVector
+
+
+class _CollidingKey:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CollidingKey) and other.value == self.value
+
+
+class TestPMap:
+    def test_set_leaves_old_version_untouched(self):
+        v1 = PMap({"a": 1})
+        v2 = v1.set("b", 2)
+        assert dict(v1.items()) == {"a": 1}
+        assert dict(v2.items()) == {"a": 1, "b": 2}
+
+    def test_unchanged_update_returns_self(self):
+        value = object()
+        m = PMap({"a": value})
+        assert m.set("a", value) is m
+        assert m.discard("missing") is m
+
+    def test_delete(self):
+        m = PMap({"a": 1, "b": 2}).delete("a")
+        assert m == {"b": 2}
+        with pytest.raises(KeyError):
+            m.delete("a")
+
+    def test_matches_dict_under_random_operations(self):
+        rng = random.Random(7)
+        m: PMap = PMap()
+        reference: dict = {}
+        versions = []
+        for step in range(2000):
+            key = rng.choice([rng.randrange(300), str(rng.randrange(200)), _CollidingKey(rng.randrange(20))])
+            if rng.random() < 0.6:
+                m = m.set(key, step)
+                reference[key] = step
+            else:
+                m = m.discard(key)
+                reference.pop(key, None)
+            if step % 250 == 0:
+                versions.append((m, dict(reference)))
+        assert len(m) == len(reference)
+        assert m == reference
+        for version, expected in versions:
+            assert version == expected
+
+    def test_set_in_copies_only_the_path(self):
+        state = PMap({"users": PMap(), "repos": PMap({"r1": 1})})
+        new = state.set_in(("users", "u1"), {"name": "Alice"})
+        assert new["users"]["u1"] == {"name": "Alice"}
+        assert "u1" not in state["users"]
+        assert new["repos"] is state["repos"]
+
+    def test_pickle_round_trip(self):
+        m = PMap({"a": 1, "b": [1, 2]})
+        assert pickle.loads(pickle.dumps(m)) == m
+
+
+class TestPVector:
+    def test_append_and_set_keep_old_versions(self):
+        v1 = PVector(range(100))
+        v2 = v1.append(100).set(5, "x")
+        assert len(v1) == 100 and v1[5] == 5
+        assert len(v2) == 101 and v2[5] == "x" and v2[-1] == 100
+
+    def test_matches_list_across_trie_levels(self):
+        rng = random.Random(3)
+        vec: PVector = PVector()
+        reference: list = []
+        for step in range(5000):
+            if reference and rng.random() < 0.3:
+                index = rng.randrange(len(reference))
+                vec = vec.set(index, step)
+                reference[index] = step
+            else:
+                vec = vec.append(step)
+                reference.append(step)
+        assert list(vec) == reference
+        assert all(vec[i] == reference[i] for i in range(0, len(reference), 37))
+        assert vec[100:140] == reference[100:140]
+
+    def test_index_errors(self):
+        with pytest.raises(IndexError):
+            PVector([1])[1]
+        with pytest.raises(IndexError):
+            PVector().set(0, 1)
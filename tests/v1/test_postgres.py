@@ -69,6 +69,28 @@ class TestPostgresAdapter:
         assert obs.system == "db"
         assert obs.data["test_table_count"] == 2
 
+    def test_observe_with_failing_custom_query(self, adapter):
+        adapter.execute("INSERT INTO test_table (name) VALUES ('a')")
+        cp = adapter.checkpoint("before_observe")
+        adapter.add_observation_query("bad", "SELECT * FROM no_such_table")
+
+        obs = adapter.observe()
+        assert obs.data["test_table_count"] == 1
+        assert obs.data["bad"].startswith("ERROR:")
+        # The transaction is still usable, checkpoints included
+        adapter.execute("INSERT INTO test_table (name) VALUES ('b')")
+        adapter.rollback(cp)
+        assert adapter.execute("SELECT COUNT(*) FROM test_table")[0][0] == 1
+
+    def test_observe_with_multi_column_query(self, adapter):
+        adapter.execute("INSERT INTO test_table (name) VALUES ('a')")
+        adapter.add_observation_query("first", "SELECT id, name FROM test_table")
+
+        for _ in range(2):
+            obs = adapter.observe()
+            assert obs.data["test_table_count"] == 1
+            assert isinstance(obs.data["first"], int)
+
     def test_multiple_savepoints(self, adapter):
         adapter.execute("INSERT INTO test_table (name) VALUES ('1')")
         cp1 = adapter.checkpoint("cp1")
@@ -0,0 +1,168 @@
+"""Tests for PostgresSnapshotAdapter (arbitrary rollback).
+
+The cost-model tests run without a database. Integration tests require
+a running PostgreSQL instance (TEST_POSTGRES_URL).
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from venomqa import BFS, Agent, World
+from venomqa.v1.adapters.postgres import PostgresAdapter
+from venomqa.v1.adapters.postgres_snapshot import (
+    PostgresSnapshotAdapter,
+    _SnapshotRecord,
+    _TableSnapshot,
+)
+
+needs_postgres = pytest.mark.skipif(
+    os.environ.get("TEST_POSTGRES_URL") is None,
+    reason="TEST_POSTGRES_URL environment variable not set",
+)
+
+
+def _offline_adapter() -> PostgresSnapshotAdapter:
+    """Adapter with hand-built bookkeeping: users (parent) <- orders (child), logs."""
+    adapter = PostgresSnapshotAdapter("postgresql://unused", table_cost=0, savepoint_cost=10)
+    adapter._tables = ["logs", "orders", "users"]
+    adapter._referenced_by = {"users": {"orders"}}
+    adapter._references = {"orders": {"users"}}
+    adapter._snapshots = {
+        "users:0": _TableSnapshot("users", b"u" * 100),
+        "users:1": _TableSnapshot("users", b"u" * 200),
+        "orders:0": _TableSnapshot("orders", b"o" * 50),
+        "logs:0": _TableSnapshot("logs", b"l" * 1000),
+        "logs:1": _TableSnapshot("logs", b"l" * 2000),
+    }
+    adapter._records = {
+        "root": _SnapshotRecord("root", {"users": "users:0", "orders": "orders:0", "logs": "logs:0"}, []),
+        "a": _SnapshotRecord("a", {"users": "users:1", "orders": "orders:0", "logs": "logs:0"}, []),
+        "b": _SnapshotRecord("b", {"users": "users:0", "orders": "orders:0", "logs": "logs:1"}, []),
+    }
+    adapter._stack = ["sp_root"]
+    adapter._savepoint_owner = {"sp_root": "root"}
+    adapter._records["root"].savepoint = "sp_root"
+    adapter._modification_counts = lambda: {"logs": 0, "orders": 0, "users": 0}  # type: ignore[method-assign]
+    adapter._in_failed_transaction = lambda: False  # type: ignore[method-assign]
+    return adapter
+
+
+class TestRollbackPlan:
+    def test_alive_savepoint_of_target_is_cheapest(self):
+        adapter = _offline_adapter()
+        plan = adapter.plan_rollback("root")
+        assert plan.savepoint == "sp_root"
+        assert plan.restore == []
+
+    def test_fk_children_are_restored_after_parents(self):
+        adapter = _offline_adapter()
+        plan = adapter.plan_rollback("a")
+        # users changed; orders references users so TRUNCATE needs it too
+        assert plan.restore == ["users", "orders"]
+        assert plan.cost == 10 + 200 + 50
+
+    def test_restores_in_place_when_current_state_is_closer(self):
+        adapter = _offline_adapter()
+        # The live database is known to hold "a"'s tables
+        adapter._current = dict(adapter._records["a"].tables)
+        adapter._baseline = {"logs": 0, "orders": 0, "users": 0}
+
+        plan = adapter.plan_rollback("b")
+        # from root: reload logs (2000); in place: users+orders+logs (2250)
+        assert plan.savepoint == "sp_root"
+        assert plan.restore == ["logs"]
+
+        plan = adapter.plan_rollback("a")
+        assert plan.savepoint is None
+        assert plan.restore == []
+
+    def test_dirty_tables_are_not_trusted(self):
+        adapter = _offline_adapter()
+        adapter._current = dict(adapter._records["a"].tables)
+        adapter._baseline = {"logs": 0, "orders": 0, "users": 0}
+        adapter._modification_counts = lambda: {"logs": 0, "orders": 3, "users": 0}  # type: ignore[method-assign]
+
+        plan = adapter.plan_rollback("a")
+        assert plan.savepoint is None
+        assert plan.restore == ["orders"]
+
+    def test_aborted_transaction_requires_savepoint(self):
+        adapter = _offline_adapter()
+        adapter._current = dict(adapter._records["a"].tables)
+        adapter._baseline = {"logs": 0, "orders": 0, "users": 0}
+        adapter._in_failed_transaction = lambda: True  # type: ignore[method-assign]
+        assert adapter.plan_rollback("a").savepoint == "sp_root"
+
+    def test_release_frees_unshared_snapshots(self):
+        adapter = _offline_adapter()
+        for record in adapter._records.values():
+            for digest in record.tables.values():
+                adapter._snapshots[digest].refs += 1
+
+        adapter.release("b")
+        assert "logs:1" not in adapter._snapshots
+        assert "logs:0" in adapter._snapshots
+        assert adapter.checkpoint_size("b") == 0
+
+
+class TestStrategyCompatibility:
+    def _world(self, db: PostgresAdapter) -> World:
+        return World(api=MagicMock(), systems={"db": db})
+
+    def test_bfs_accepted_with_snapshot_adapter(self):
+        Agent(world=self._world(PostgresSnapshotAdapter("postgresql://unused")), actions=[], strategy=BFS())
+
+    def test_bfs_still_rejected_with_savepoint_adapter(self):
+        with pytest.raises(ValueError, match="PostgresSnapshotAdapter"):
+            Agent(world=self._world(PostgresAdapter("postgresql://unused")), actions=[], strategy=BFS())
+
+
+@needs_postgres
+class TestPostgresSnapshotIntegration:
+    @pytest.fixture
+    def adapter(self):
+        adapter = PostgresSnapshotAdapter(
+            os.environ["TEST_POSTGRES_URL"], observe_tables=["snap_users", "snap_orders"]
+        )
+        adapter.connect()
+        adapter.execute("DROP TABLE IF EXISTS snap_orders, snap_users")
+        adapter.execute("CREATE TABLE snap_users (id SERIAL PRIMARY KEY, name TEXT)")
+        adapter.execute(
+            "CREATE TABLE snap_orders (id SERIAL PRIMARY KEY, "
+            "user_id INT REFERENCES snap_users(id))"
+        )
+        adapter.commit()
+        adapter.snapshot_tables = ["snap_users", "snap_orders"]
+        yield adapter
+        adapter._conn.rollback()
+        adapter.execute("DROP TABLE IF EXISTS snap_orders, snap_users")
+        adapter.commit()
+        adapter.close()
+
+    def test_rollback_to_destroyed_savepoint(self, adapter):
+        root = adapter.checkpoint("root")
+        adapter.execute("INSERT INTO snap_users (name) VALUES ('a')")
+        one = adapter.checkpoint("one")
+        adapter.execute("INSERT INTO snap_orders (user_id) VALUES (1)")
+        two = adapter.checkpoint("two")
+
+        adapter.rollback(root)  # destroys the savepoints of one and two
+        assert adapter.observe().data == {"snap_users_count": 0, "snap_orders_count": 0}
+
+        adapter.rollback(two)
+        assert adapter.observe().data == {"snap_users_count": 1, "snap_orders_count": 1}
+        assert adapter.rollback_stats["restore"] == 1
+
+        adapter.rollback(one)
+        assert adapter.observe().data == {"snap_users_count": 1, "snap_orders_count": 0}
+
+    def test_sequences_are_restored(self, adapter):
+        root = adapter.checkpoint("root")
+        adapter.execute("INSERT INTO snap_users (name) VALUES ('a')")
+        adapter.rollback(root)
+        adapter.execute("INSERT INTO snap_users (name) VALUES ('b')")
+        assert adapter.execute("SELECT id FROM snap_users") == [(1,)]
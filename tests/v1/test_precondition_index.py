@@ -0,0 +1,149 @@
+"""Tests for indexed precondition evaluation in Graph.get_valid_actions."""
+
+from __future__ import annotations
+
+import gc
+import random
+
+from venomqa.core.state import Observation, State
+
+from venomqa.exploration import Graph, PreconditionIndex
+from venomqa.sandbox import Context
+from venomqa.v1.core.action import Action, precondition_action_ran, precondition_has_context
+
+STATE = State.create({"db": Observation(system="db", data={"n": 1})})
+
+
+def _action(name: str, *preconditions, **kwargs) -> Action:
+    return Action(name=name, execute=lambda api: None, preconditions=list(preconditions), **kwargs)
+
+
+def _names(actions) -> list[str]:
+    return [a.name for a in actions]
+
+
+ACTIONS = [
+    _action("login"),
+    _action("create_user", precondition_action_ran("login")),
+    _action("get_user", precondition_has_context("user_id")),
+    _action(
+        "delete_user",
+        precondition_has_context("user_id", "token"),
+        precondition_action_ran("login", "create_user"),
+    ),
+    _action("has_rows", lambda state: state.observations["db"].data["n"] > 0),
+    _action("admin_only", lambda ctx: ctx.get("role") == "admin"),
+]
+
+
+class TestGetValidActions:
+    def test_context_and_prior_action_markers(self):
+        graph = Graph(ACTIONS)
+        context = Context()
+        assert _names(graph.get_valid_actions(STATE, context, set())) == ["login", "has_rows"]
+
+        context.set("user_id", 7)
+        context.set("token", "t")
+        valid = graph.get_valid_actions(STATE, context, {"login", "create_user"})
+        assert _names(valid) == ["login", "create_user", "get_user", "delete_user", "has_rows"]
+
+        # Counts are updated in both directions
+        context.set("token", None)
+        valid = graph.get_valid_actions(STATE, context, {"login"})
+        assert _names(valid) == ["login", "create_user", "get_user", "has_rows"]
+
+    def test_matches_can_execute_with_context(self):
+        rng = random.Random(3)
+        keys = [f"k{i}" for i in range(6)]
+        actions = [
+            _action(
+                f"a{i}",
+                precondition_has_context(*rng.sample(keys, rng.randint(0, 2))),
+                precondition_action_ran(*(f"a{j}" for j in rng.sample(range(20), rng.randint(0, 2)))),
+            )
+            for i in range(20)
+        ]
+        graph = Graph(actions)
+        context = Context()
+        executed: set[str] = set()
+        for _ in range(200):
+            key = rng.choice(keys)
+            context.set(key, None if rng.random() < 0.4 else 1)
+            name = f"a{rng.randrange(20)}"
+            executed.symmetric_difference_update({name})
+            expected = [a for a in actions if a.can_execute_with_context(STATE, context, executed)]
+            assert _names(graph.get_valid_actions(STATE, context, executed)) == _names(expected)
+
+    def test_markers_are_never_called(self):
+        calls = []
+
+        def counting(*keys):
+            def check(state):
+                calls.append(keys)
+                return True
+
+            check._required_context_keys = keys
+            return check
+
+        graph = Graph([_action("a", counting("x")), _action("b", counting("y"))])
+        context = Context()
+        context.set("x", 1)
+        assert _names(graph.get_valid_actions(STATE, context, set())) == ["a"]
+        assert graph.can_execute(STATE, graph.get_action("b"))
+        assert calls == []
+
+    def test_max_calls_still_applies(self):
+        graph = Graph([_action("once", max_calls=1), _action("other")])
+        graph._action_call_counts["once"] = 1
+        assert _names(graph.get_valid_actions(STATE, Context(), set())) == ["other"]
+
+    def test_add_action_after_sync(self):
+        graph = Graph(ACTIONS)
+        context = Context()
+        context.set("order_id", 1)
+        graph.get_valid_actions(STATE, context, set())
+        graph.add_action(_action("get_order", precondition_has_context("order_id")))
+        assert "get_order" in _names(graph.get_valid_actions(STATE, context, set()))
+
+    def test_without_context_markers_pass(self):
+        graph = Graph(ACTIONS)
+        assert _names(graph.get_valid_actions(STATE)) == _names(ACTIONS)
+
+
+class TestPreconditionIndex:
+    def test_one_cursor_per_context(self):
+        index = PreconditionIndex(ACTIONS)
+        with_user, without_user = Context(), Context()
+        with_user.set("user_id", 1)
+        index.sync(with_user, set())
+        index.sync(without_user, set())
+        get_user = ACTIONS[2]
+        assert index.allows(get_user, STATE, with_user)
+        assert not index.allows(get_user, STATE, without_user)
+
+    def test_replaced_action_is_reindexed(self):
+        index = PreconditionIndex(ACTIONS)
+        context = Context()
+        index.sync(context, set())
+        gated = _action("login", precondition_has_context("session"))
+        assert not index.allows(gated, STATE, context)
+        context.set("session", "s")
+        index.sync(context, set())
+        assert index.allows(gated, STATE, context)
+
+    def test_collected_context_drops_its_cursor(self):
+        index = PreconditionIndex(ACTIONS)
+        context = Context()
+        context.set("user_id", 1)
+        index.sync(context, set())
+        del context
+        gc.collect()
+        assert index._cursors == {}
+        # A fresh context (possibly at the same address) starts from scratch
+        assert not index.allows(ACTIONS[2], STATE, Context())
+
+    def test_unsynced_context_is_synced_on_filter(self):
+        index = PreconditionIndex(ACTIONS)
+        context = Context()
+        context.set("user_id", 1)
+        assert index.allows(ACTIONS[2], STATE, context)
@@ -0,0 +1,135 @@
+"""Tests for concurrent fan-out of read_only actions."""
+
+from __future__ import annotations
+
+import pytest
+from venomqa.core.invariant import InvariantTiming
+
+from tests.v1.counters import counter_world
+from venomqa import BFS, Action, Agent, Invariant
+from venomqa.v1.generators.openapi_actions import generate_actions
+
+
+def _get(name: str, status: int = 200, **kwargs) -> Action:
+    return Action(
+        name=name,
+        execute=lambda api: api.call("GET", f"/{name}", status),
+        read_only=True,
+        **kwargs,
+    )
+
+
+INC = Action(name="inc", execute=lambda api: api.call("POST", "/a"))
+READS = [_get("get_a"), _get("get_b"), _get("get_c")]
+
+
+def _agent(actions, invariants=(), delay=0.0, **kwargs):
+    world = counter_world(keys=("a",), delay=delay)
+    agent = Agent(
+        world=world,
+        actions=actions,
+        invariants=list(invariants),
+        strategy=BFS(),
+        **kwargs,
+    )
+    return agent, world.systems["store"]
+
+
+class TestFanOut:
+    def test_read_only_actions_become_self_loops(self):
+        agent, _ = _agent([INC, *READS])
+        result = agent.explore()
+        loops = [t for t in result.graph.transitions if t.action_name.startswith("get_")]
+        # Every read runs once from each of the 3 states
+        assert len(loops) == 9
+        assert all(t.from_state_id == t.to_state_id for t in loops)
+        assert result.fan_out_stats == {"fan_outs": 3, "actions": 9, "rollbacks_avoided": 6}
+        assert result.summary()["read_only_fanned_out"] == 9
+
+    def test_no_checkpoint_or_rollback_between_reads(self):
+        agent, store = _agent(READS)
+        agent.explore()
+        # Only the initial checkpoint: the reads never checkpoint or roll back
+        assert store.checkpoints == 1
+        assert store.rollbacks == 0
+
+    def test_reads_run_concurrently(self):
+        agent, _ = _agent(READS, delay=0.05, read_only_workers=3)
+        agent.explore()
+        assert agent.world.api.peak == 3
+
+    def test_reads_run_in_turn_by_default(self):
+        agent, _ = _agent(READS, delay=0.01)
+        result = agent.explore()
+        assert agent.world.api.peak == 1
+        assert result.fan_out_stats["actions"] == 3
+
+    def test_each_fanned_out_action_counts_as_a_step(self):
+        agent, _ = _agent(READS, max_steps=2)
+        result = agent.explore()
+        # The batch is cut to the 2 steps left
+        assert result.fan_out_stats["actions"] == 2
+        assert len(result.graph.transitions) == 2
+        assert agent.step_count == 2
+
+    def test_assertions_and_post_invariants_see_each_result(self):
+        seen = []
+
+        def check(world):
+            seen.append(world.last_action_result.request.url)
+            return True
+
+        post = Invariant(name="post", check=check, timing=InvariantTiming.POST_ACTION)
+        actions = [_get("get_a"), _get("get_missing", status=404, expected_status=[200])]
+        agent, _ = _agent(actions, invariants=[post])
+        result = agent.explore()
+        assert seen == ["/get_a", "/get_missing"]
+        assert [v.invariant_name for v in result.violations] == ["get_missing_response_assertion"]
+
+    def test_state_change_falls_back_to_regular_steps(self):
+        sneaky = Action(name="sneaky", execute=lambda api: api.call("POST", "/a"), read_only=True)
+        agent, _ = _agent([sneaky, _get("get_a")])
+        with pytest.warns(UserWarning, match="read_only actions changed state"):
+            result = agent.explore()
+        edges = {(t.from_state_id == t.to_state_id, t.action_name) for t in result.graph.transitions}
+        assert (False, "sneaky") in edges
+        assert result.states_visited == 3
+
+    def test_context_change_falls_back_to_regular_steps(self):
+        def remember(api, context):
+            context.set("seen", True)  # not part of the state ID
+            return api.call("GET", "/a")
+
+        agent, store = _agent([Action(name="remember", execute=remember, read_only=True)])
+        with pytest.warns(UserWarning, match="or the context"):
+            result = agent.explore()
+        assert result.fan_out_stats["fan_outs"] == 0
+        assert store.rollbacks >= 1
+        assert [t.action_name for t in result.graph.transitions] == ["remember"]
+
+    def test_read_only_workers_validated(self):
+        with pytest.raises(ValueError, match="read_only_workers"):
+            _agent(READS, read_only_workers=0)
+
+
+def test_openapi_actions_infer_read_only():
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {
+            "/items": {
+                "get": {"operationId": "list_items"},
+                "post": {"operationId": "create_item"},
+            },
+            "/items/{item_id}": {
+                "get": {"operationId": "get_item"},
+                "delete": {"operationId": "delete_item"},
+            },
+        },
+    }
+    flags = {a.name: a.read_only for a in generate_actions(spec)}
+    assert flags == {
+        "list_items": True,
+        "create_item": False,
+        "get_item": True,
+        "delete_item": False,
+    }
@@ -0,0 +1,138 @@
+"""Unit tests for RedisAdapter against an in-process fakeredis server."""
+
+from __future__ import annotations
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+redis = pytest.importorskip("redis")
+
+from venomqa.adapters.redis import RedisAdapter  # noqa: E402
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis, "from_url", lambda url: fakeredis.FakeRedis(server=server))
+    return server
+
+
+@pytest.fixture(params=[False, True], ids=["full", "dirty"])
+def adapter(request, server):
+    a = RedisAdapter(track_patterns=["app:*"], track_dirty=request.param)
+    a.connect()
+    yield a
+    a.close()
+
+
+@pytest.fixture
+def other(server):
+    """A second client, standing in for the application under test."""
+    return fakeredis.FakeRedis(server=server)
+
+
+class TestRedisAdapterObserve:
+    def test_observe_types(self, adapter, other):
+        other.set("app:s", "v")
+        other.rpush("app:l", "a", "b")
+        other.sadd("app:set", "x")
+        other.hset("app:h", "f", "1")
+        other.set("ignored", "v")
+
+        data = adapter.observe().data
+        assert data["app:s"] == b"v"
+        assert data["app:l"] == [b"a", b"b"]
+        assert data["app:set"] == [b"x"]
+        assert data["app:h"] == {b"f": b"1"}
+        assert "ignored" not in data
+
+    def test_observe_sees_changes(self, adapter, other):
+        other.set("app:a", "1")
+        assert adapter.observe().data == {"app:a": b"1"}
+        other.set("app:a", "2")
+        other.set("app:b", "3")
+        assert adapter.observe().data == {"app:a": b"2", "app:b": b"3"}
+        other.delete("app:a")
+        assert adapter.observe().data == {"app:b": b"3"}
+
+
+class TestRedisAdapterCheckpointRollback:
+    def test_rollback_restores_values_and_deletes_new_keys(self, adapter, other):
+        other.set("app:a", "1")
+        cp = adapter.checkpoint("cp")
+        other.set("app:a", "2")
+        other.set("app:new", "x")
+
+        adapter.rollback(cp)
+        assert other.get("app:a") == b"1"
+        assert not other.exists("app:new")
+        assert adapter.observe().data == {"app:a": b"1"}
+
+    def test_non_lifo_rollback(self, adapter, other):
+        cp0 = adapter.checkpoint("empty")
+        other.set("app:a", "1")
+        cp1 = adapter.checkpoint("one")
+        other.set("app:b", "2")
+        other.delete("app:a")
+        cp2 = adapter.checkpoint("two")
+
+        adapter.rollback(cp0)
+        assert adapter.observe().data == {}
+        adapter.rollback(cp2)
+        assert adapter.observe().data == {"app:b": b"2"}
+        adapter.rollback(cp1)
+        assert adapter.observe().data == {"app:a": b"1"}
+
+    def test_ttl_preserved(self, adapter, other):
+        other.set("app:t", "v", px=60_000)
+        cp = adapter.checkpoint("cp")
+        other.persist("app:t")
+        adapter.rollback(cp)
+        assert 0 < other.pttl("app:t") <= 60_000
+
+    def test_untracked_keys_untouched(self, adapter, other):
+        cp = adapter.checkpoint("cp")
+        other.set("other:k", "v")
+        adapter.rollback(cp)
+        assert other.get("other:k") == b"v"
+
+
+class TestRedisAdapterDirtyTracking:
+    def test_tracking_active_with_fakeredis(self, server):
+        a = RedisAdapter(track_patterns=["app:*"], track_dirty=True)
+        a.connect()
+        a.checkpoint("cp")
+        assert a.dirty_tracking_active
+        a.close()
+
+    def test_close_restores_notify_config(self, server, monkeypatch):
+        # fakeredis has no CONFIG; keep the setting on the client class
+        config = {"notify-keyspace-events": "Ex"}
+
+        class ConfigurableRedis(fakeredis.FakeRedis):
+            def config_get(self, name):
+                return {name: config[name]}
+
+            def config_set(self, name, value):
+                config[name] = value
+
+        monkeypatch.setattr(redis, "from_url", lambda url: ConfigurableRedis(server=server))
+        a = RedisAdapter(track_patterns=["app:*"], track_dirty=True)
+        a.connect()
+        a.checkpoint("cp")
+        assert set(config["notify-keyspace-events"]) == {"A", "E", "K", "x"}
+        a.close()
+        assert config["notify-keyspace-events"] == "Ex"
+
+    def test_only_dirty_keys_dumped(self, server, other):
+        a = RedisAdapter(track_patterns=["app:*"], track_dirty=True)
+        a.connect()
+        for i in range(20):
+            other.set(f"app:{i}", i)
+        first = a.checkpoint("base")
+        other.set("app:3", "changed")
+        second = a.checkpoint("step")
+
+        assert second["app:3"] != first["app:3"]
+        assert all(second[k] is first[k] for k in first if k != "app:3")
+        a.close()
@@ -305,6 +305,94 @@ class TestResourceGraphObserve:
         obs = graph.observe()
         assert obs.data["count"] == 1
 
+    def test_observe_reused_until_changed(self):
+        graph = ResourceGraph()
+        graph.create("workspace", "ws_123")
+        obs = graph.observe()
+        assert graph.observe() is obs
+        graph.create("workspace", "ws_456")
+        assert graph.observe() is not obs
+        assert graph.observe().data["count"] == 2
+
+    def test_rollback_restores_observation(self):
+        graph = ResourceGraph()
+        graph.create("workspace", "ws_123")
+        cp = graph.checkpoint("cp")
+        graph.destroy("workspace", "ws_123")
+        assert graph.observe().data["count"] == 0
+        graph.rollback(cp)
+        assert graph.observe() is cp.observation
+        assert graph.observe().data["count"] == 1
+
+    def test_content_hash_independent_of_creation_order(self):
+        first = ResourceGraph()
+        first.create("workspace", "a")
+        first.create("workspace", "b")
+        second = ResourceGraph()
+        second.create("workspace", "b")
+        second.create("workspace", "a")
+        second.create("workspace", "c")
+        second.destroy("workspace", "c")
+        assert first.observe().content_hash() == second.observe().content_hash()
+
+    def test_content_hash_tracks_alive_set(self):
+        graph = ResourceGraph()
+        graph.create("workspace", "a")
+        before = graph.observe().content_hash()
+        cp = graph.checkpoint("cp")
+        graph.destroy("workspace", "a")
+        assert graph.observe().content_hash() != before
+        graph.rollback(cp)
+        assert graph.observe().content_hash() == before
+        assert graph.alive_count == 1
+
+
+class TestResourceGraphSharing:
+    def test_unchanged_graph_reuses_snapshot(self):
+        graph = ResourceGraph()
+        graph.create("workspace", "ws_1")
+        cp = graph.checkpoint("cp1")
+        graph.rollback(cp)
+        assert graph.checkpoint("cp2") is cp
+
+    def test_snapshots_share_untouched_resources(self):
+        graph = ResourceGraph()
+        for i in range(50):
+            graph.create("workspace", f"ws_{i}")
+        cp1 = graph.checkpoint("cp1")
+        graph.rollback(cp1)
+        graph.create("workspace", "ws_new")
+        cp2 = graph.checkpoint("cp2")
+        key = ("workspace", "ws_7")
+        assert cp2.resources[key] is cp1.resources[key]
+
+    def test_resource_held_across_checkpoint_does_not_leak(self):
+        graph = ResourceGraph()
+        ws = graph.create("workspace", "ws_1")
+        cp = graph.checkpoint("cp")
+        ws.data["late"] = True
+        graph.rollback(cp)
+        assert "late" not in graph.get("workspace", "ws_1").data
+
+    def test_cascade_after_rollback(self):
+        schema = ResourceSchema(
+            types={
+                "workspace": ResourceType(name="workspace"),
+                "upload": ResourceType(name="upload", parent="workspace"),
+            }
+        )
+        graph = ResourceGraph(schema=schema)
+        graph.create("workspace", "ws_1")
+        graph.create("upload", "up_1", parent_id="ws_1")
+        cp = graph.checkpoint("cp")
+        graph.rollback(cp)
+        graph.destroy("workspace", "ws_1")
+        assert not graph.exists("upload", "up_1")
+        assert graph.get("upload", "up_1").parent is graph.get("workspace", "ws_1")
+        graph.rollback(cp)
+        assert graph.exists("upload", "up_1")
+        assert cp.resources[("upload", "up_1")].alive
+
 
 class TestOpenAPIParser:
     def test_parse_path_segments_simple(self):
@@ -0,0 +1,68 @@
+"""Tests for RollbackScheduler (rollback-distance-aware pick ordering)."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import BFS, DFS, Agent, CoverageGuided
+from venomqa.exploration import RollbackScheduler
+
+
+def _explore(strategy, slack: int = 0):
+    world = counter_world()
+    result = Agent(
+        world=world, actions=counter_actions(), strategy=strategy, rollback_slack=slack
+    ).explore()
+    return result, world.systems["store"]
+
+
+def _edges(result) -> set[tuple[str, str, str]]:
+    return {(t.from_state_id, t.action_name, t.to_state_id) for t in result.graph.transitions}
+
+
+class TestRollbackScheduler:
+    def test_skips_rollback_when_pick_is_current_state(self):
+        result, store = _explore(DFS())
+        stats = result.rollback_stats
+
+        assert result.states_visited == 9
+        assert stats["rollbacks_avoided"] > 0
+        assert stats["rollbacks"] == store.rollbacks
+        assert stats["rollbacks"] + stats["rollbacks_avoided"] == result.transitions_taken
+        assert result.summary()["rollbacks_avoided"] == stats["rollbacks_avoided"]
+
+    def test_slack_trades_bfs_order_for_fewer_rollbacks(self):
+        strict, strict_store = _explore(BFS())
+        relaxed, relaxed_store = _explore(BFS(), slack=4)
+
+        assert _edges(relaxed) == _edges(strict)
+        assert relaxed_store.rollbacks < strict_store.rollbacks
+        assert relaxed.rollback_stats["reordered"] > 0
+        assert strict.rollback_stats["reordered"] == 0
+
+    def test_stateless_strategies_keep_their_order(self):
+        result, _ = _explore(CoverageGuided(), slack=4)
+        assert result.states_visited == 9
+        assert result.rollback_stats["reordered"] == 0
+
+    def test_landing_on_known_state_is_not_exact(self):
+        scheduler = RollbackScheduler()
+        scheduler.advanced("s0", exact=True)
+        scheduler.advanced("s1", exact=False)
+        assert scheduler.current_state_id is None
+        assert scheduler.needs_rollback("s1")
+
+    def test_branch_rollbacks_are_counted(self):
+        scheduler = RollbackScheduler()
+        scheduler.advanced("s0", exact=True)
+        scheduler.advanced("s1", exact=True)
+        scheduler.advanced("s2", exact=True)
+        scheduler.rolled_back("s0")
+        scheduler.rolled_back("s5")
+        assert scheduler.stats()["branch_rollbacks"] == 1
+        assert scheduler.current_state_id == "s5"
+
+    def test_rejects_negative_slack(self):
+        with pytest.raises(ValueError):
+            RollbackScheduler(slack=-1)
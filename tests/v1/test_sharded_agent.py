@@ -0,0 +1,89 @@
+"""Tests for ShardedAgent (multi-process, state-partitioned exploration)."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import BFS, Agent, Invariant, Severity, ShardedAgent, World
+from venomqa.v1.agent.sharded import shard_of
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="test worlds are defined locally and need the fork start method",
+)
+
+
+class TestShardedAgent:
+    def test_explores_same_state_space_as_sequential_agent(self):
+        sequential = Agent(world=counter_world(), actions=counter_actions(), strategy=BFS()).explore()
+
+        sharded = ShardedAgent(world_factory=counter_world, actions=counter_actions(), processes=3).explore()
+
+        assert sharded.states_visited == sequential.states_visited == 9
+        assert {(t.from_state_id, t.action_name, t.to_state_id) for t in sharded.graph.transitions} == {
+            (t.from_state_id, t.action_name, t.to_state_id) for t in sequential.graph.transitions
+        }
+        assert sharded.graph.initial_state_id == sequential.graph.initial_state_id
+        assert all(s.checkpoint_id is None for s in sharded.graph.iter_states())
+        assert not sharded.truncated_by_max_steps
+
+    def test_violations_are_merged_with_shortest_paths(self):
+        inv = Invariant(
+            name="a_below_two",
+            check=lambda world: world.systems["store"].data["a"] < 2,
+            severity=Severity.HIGH,
+        )
+        result = ShardedAgent(
+            world_factory=counter_world, actions=counter_actions(), invariants=[inv], processes=4
+        ).explore()
+
+        # a == 2 in states (2, 0), (2, 1), (2, 2)
+        assert len(result.violations) == 3
+        assert len({v.state.id for v in result.violations}) == 3
+        for v in result.violations:
+            names = [t.action_name for t in v.reproduction_path]
+            assert v.action is not None and v.action.name == names[-1]
+            assert names.count("inc_a") == 2
+            assert len(names) == 2 + v.state.observations["store"].data["b"]
+
+    def test_max_steps_is_respected(self):
+        result = ShardedAgent(
+            world_factory=counter_world, actions=counter_actions(), processes=2, max_steps=5
+        ).explore()
+        assert result.transitions_taken == 5
+        assert result.truncated_by_max_steps
+
+    def test_budget_spent_before_a_shard_starts(self):
+        # With more shards than steps, some shards find the budget gone as
+        # soon as they are released; they must still report back.
+        for _ in range(3):
+            result = ShardedAgent(
+                world_factory=counter_world, actions=counter_actions(), processes=4, max_steps=1
+            ).explore()
+            assert result.transitions_taken == 1
+
+    def test_shard_exiting_silently_is_an_error(self):
+        agent = ShardedAgent(world_factory=counter_world, actions=counter_actions(), processes=1)
+        proc = multiprocessing.get_context("fork").Process(target=lambda: None, name="silent")
+        proc.start()
+        proc.join()
+        with pytest.raises(RuntimeError, match="silent exited without sending its 'done'"):
+            agent._collect(multiprocessing.get_context("fork").Queue(), [proc], "done")
+
+    def test_worker_errors_are_surfaced(self):
+        def broken_world() -> World:
+            raise RuntimeError("no database")
+
+        with pytest.raises(RuntimeError, match="no database"):
+            ShardedAgent(world_factory=broken_world, actions=counter_actions(), processes=2).explore()
+
+    def test_shard_of_is_stable(self):
+        assert shard_of("s_0123456789abcdef", 4) == shard_of("s_0123456789abcdef", 4)
+        assert {shard_of(f"s_{i:016x}", 4) for i in range(64)} == {0, 1, 2, 3}
+
+    def test_rejects_invalid_process_count(self):
+        with pytest.raises(ValueError):
+            ShardedAgent(world_factory=counter_world, actions=counter_actions(), processes=-1)
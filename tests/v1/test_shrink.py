@@ -0,0 +1,202 @@
+"""Tests for checkpoint-anchored ddmin path shrinking."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from tests.v1.counters import counter_actions, counter_world
+from venomqa import (
+    DFS,
+    Action,
+    ActionResult,
+    Agent,
+    HTTPRequest,
+    HTTPResponse,
+    Invariant,
+    World,
+)
+from venomqa.exploration import Transition
+from venomqa.sandbox import CheckpointManager
+from venomqa.v1.agent.parallel import ParallelAgent
+from venomqa.v1.agent.shrink import PathShrinker, ShrinkTarget
+
+ACTIONS = counter_actions("abc")
+
+# Fires once a was incremented twice; b and c are noise on the way there.
+A_BELOW_2 = Invariant(name="a_below_2", check=lambda w: w.systems["store"].data["a"] < 2)
+
+
+def _world() -> World:
+    return counter_world(keys="abc", limit=3)
+
+
+def _path(*names: str) -> list[Transition]:
+    result = ActionResult.from_response(HTTPRequest("POST", "/"), HTTPResponse(200))
+    return [Transition.create(f"s{i}", name, f"s{i + 1}", result) for i, name in enumerate(names)]
+
+
+def _shrinker(path, worlds):
+    targets = []
+    for world in worlds:
+        initial = world.observe_and_checkpoint("initial")
+        targets.append(ShrinkTarget(world, {(): initial.checkpoint_id}))
+    actions = {a.name: a for a in ACTIONS}
+    return PathShrinker(path, lambda w: not A_BELOW_2.check(w), actions, targets)
+
+
+class TestPathShrinker:
+    NOISY = ("inc_b", "inc_a", "inc_c", "inc_b", "inc_c", "inc_a", "inc_b", "inc_c")
+
+    def test_finds_minimal_path(self):
+        shrinker = _shrinker(_path(*self.NOISY), [_world()])
+        shrunk = shrinker.run()
+        shrinker.release()
+        assert [t.action_name for t in shrunk] == ["inc_a", "inc_a"]
+        assert shrinker.stats.shrunk_steps == 2
+        assert shrinker.stats.original_steps == 8
+
+    def test_anchored_replay_saves_actions(self):
+        world = _world()
+        shrinker = _shrinker(_path(*self.NOISY), [world])
+        shrinker.run()
+        stats = shrinker.stats
+        assert stats.actions_replayed == world.api.calls
+        assert stats.actions_replayed < stats.actions_naive
+        assert stats.actions_saved == stats.actions_naive - stats.actions_replayed
+
+    def test_release_drops_prefix_checkpoints(self):
+        world = _world()
+        shrinker = _shrinker(_path(*self.NOISY), [world])
+        shrinker.run()
+        created = list(shrinker.targets[0].created)
+        assert created
+        shrinker.release()
+        assert not any(world.has_checkpoint(cp) for cp in created)
+
+    def test_concurrent_targets_give_same_result(self):
+        path = _path(*self.NOISY)
+        sequential = _shrinker(path, [_world()])
+        concurrent = _shrinker(path, [_world() for _ in range(3)])
+        assert [t.id for t in concurrent.run()] == [t.id for t in sequential.run()]
+        assert sum(t.world.api.calls for t in concurrent.targets) == concurrent.stats.actions_replayed
+
+    def test_failing_prefix_is_not_replayed_again(self):
+        boom_calls = []
+
+        def boom(api):
+            boom_calls.append(1)
+            raise RuntimeError("boom")
+
+        world = _world()
+        shrinker = _shrinker(_path("boom", "inc_a", "inc_b", "inc_a"), [world])
+        shrinker.actions = {**shrinker.actions, "boom": Action(name="boom", execute=boom)}
+        shrunk = shrinker.run()
+        assert [t.action_name for t in shrunk] == ["inc_a", "inc_a"]
+        assert len(boom_calls) == 1
+
+    def test_requires_a_target(self):
+        with pytest.raises(ValueError, match="ShrinkTarget"):
+            PathShrinker(_path("inc_a"), lambda w: True, {}, [])
+
+
+# DFS tries b and c first, so a is first incremented twice deep in the graph
+NOISE_FIRST = counter_actions("bca")
+
+
+class TestAgentShrink:
+    def _agent(self, **kwargs):
+        return Agent(
+            world=_world(),
+            actions=NOISE_FIRST,
+            invariants=[A_BELOW_2],
+            strategy=DFS(),
+            max_steps=30,
+            shrink=True,
+            **kwargs,
+        )
+
+    def test_violation_path_is_shrunk_and_costed(self):
+        result = self._agent().explore()
+        violation = result.violations[0]
+        assert [t.action_name for t in violation.reproduction_path] == ["inc_a", "inc_a"]
+        assert "Path shrunk" in violation.message
+        stats = result.shrink_stats[violation.id]
+        assert stats["shrunk_steps"] == 2
+        assert stats["actions_saved"] > 0
+        assert result.summary()["shrink_actions_saved"] == sum(
+            s["actions_saved"] for s in result.shrink_stats.values()
+        )
+
+    def test_shrink_replicas(self):
+        built = []
+        lock = threading.Lock()
+
+        def factory():
+            world = _world()
+            with lock:
+                built.append(world)
+            return world
+
+        agent = self._agent(shrink_workers=3, shrink_world_factory=factory)
+        result = agent.explore()
+        assert len(built) == 2
+        assert [t.action_name for t in result.violations[0].reproduction_path] == ["inc_a", "inc_a"]
+        assert agent._shrink_replicas is None  # closed with the run
+
+    def test_bounded_checkpoints_keep_shrink_anchors(self):
+        unbounded = self._agent().explore()
+        agent = self._agent()
+        manager = agent.world.checkpoint_manager = CheckpointManager(max_checkpoints=4)
+        result = agent.explore()
+        assert manager.evicted_count > 0
+        assert [t.action_name for t in result.violations[0].reproduction_path] == ["inc_a", "inc_a"]
+        assert result.states_visited == unbounded.states_visited
+        # Only the initial state stays pinned once the shrink is done
+        assert sum(manager.is_pinned(cp) for cp in list(manager._lru)) == 1
+
+    def test_failed_restore_falls_back_to_rollback(self):
+        unbounded = self._agent().explore()
+        agent = self._agent()
+        world = agent.world
+        saves = []
+        checkpoint, rollback = world.checkpoint, world.rollback
+
+        def record_save(name):
+            checkpoint_id = checkpoint(name)
+            if name == "_shrink_save":
+                saves.append(checkpoint_id)
+            return checkpoint_id
+
+        def refuse_save(checkpoint_id):
+            if checkpoint_id in saves:
+                raise RuntimeError("restore failed")
+            rollback(checkpoint_id)
+
+        world.checkpoint, world.rollback = record_save, refuse_save
+        result = agent.explore()
+        assert saves
+        assert result.states_visited == unbounded.states_visited
+        assert len(result.graph.transitions) == len(unbounded.graph.transitions)
+
+    def test_shrink_workers_validated(self):
+        with pytest.raises(ValueError, match="shrink_world_factory"):
+            self._agent(shrink_workers=2)
+        with pytest.raises(ValueError, match="shrink_workers"):
+            self._agent(shrink_workers=0)
+
+    def test_parallel_agent_shrinks_on_replicas(self):
+        agent = ParallelAgent(
+            world_factory=_world,
+            actions=NOISE_FIRST,
+            invariants=[A_BELOW_2],
+            strategy=DFS(),
+            workers=2,
+            max_steps=30,
+            shrink=True,
+            shrink_workers=2,
+        )
+        result = agent.explore()
+        for violation in result.violations:
+            assert [t.action_name for t in violation.reproduction_path] == ["inc_a", "inc_a"]
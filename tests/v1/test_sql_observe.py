@@ -0,0 +1,141 @@
+"""Unit tests for batched SQL observation helpers."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+
+from venomqa.v1.adapters.mysql import MySQLAdapter
+from venomqa.v1.adapters.postgres import PostgresAdapter
+from venomqa.v1.adapters.sql_observe import ObserveStats, batched_select, scalar_subquery
+
+
+class TestBatchedSelect:
+    def test_scalar_subquery_strips_semicolon(self):
+        assert scalar_subquery("SELECT 1;") == "SELECT * FROM (SELECT 1) AS venom_q LIMIT 1"
+
+    def test_batched_select_single_row(self):
+        assert batched_select(["SELECT 1", "SELECT 2"]) == "SELECT (SELECT 1), (SELECT 2)"
+
+
+class TestObserveStats:
+    def test_record(self):
+        stats = ObserveStats()
+        stats.record(2.0)
+        stats.record(4.0)
+        assert stats.calls == 2
+        assert stats.mean_ms == 3.0
+        assert stats.max_ms == 4.0
+        assert stats.last_ms == 4.0
+
+
+class TestMySQLObserveStatement:
+    def test_compiles_tables_and_queries(self):
+        adapter = MySQLAdapter(
+            observe_tables=["users"],
+            observe_queries={"pending": "SELECT COUNT(*) FROM orders WHERE status = 'pending'"},
+        )
+        fields, statement = adapter._observe_statement()
+        assert fields == ["users_count", "pending"]
+        assert statement.startswith("SELECT (SELECT COUNT(*) FROM `users`), ")
+        assert "status = 'pending'" in statement
+        assert adapter._observe_statement()[1] is statement
+
+    def test_recompiles_when_queries_change(self):
+        adapter = MySQLAdapter(observe_tables=["users"])
+        first = adapter._observe_statement()
+        adapter.observe_queries["one"] = "SELECT 1"
+        assert adapter._observe_statement() != first
+
+
+class _FakeConnection:
+    """DB-API-like connection. Batched SELECTs return 3 per column, plain
+    queries (3, 4); ``SELECT 1, 2`` fails as a subquery column. Postgres-like
+    when ``aborting``: after an error, every statement fails until the
+    enclosing savepoint is rolled back."""
+
+    def __init__(self, failing: str, aborting: bool = False) -> None:
+        self.failing = failing
+        self.aborting = aborting
+        self.aborted = False
+        self.savepoints = 0
+        self.executed: list[str] = []
+        self._last = ""
+
+    @contextmanager
+    def transaction(self):
+        self.savepoints += 1
+        try:
+            yield
+        except Exception:
+            self.aborted = False  # ROLLBACK TO SAVEPOINT
+            raise
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def execute(self, query) -> None:
+        text = query if isinstance(query, str) else repr(query)
+        self.executed.append(text)
+        self._last = text
+        if self.aborted:
+            raise RuntimeError("current transaction is aborted")
+        if "venom_q" in text and "SELECT 1, 2" in text:
+            self.aborted = self.aborting
+            raise RuntimeError("subquery has too many columns")
+        if self.failing in text:
+            self.aborted = self.aborting
+            raise RuntimeError("relation does not exist")
+
+    def fetchone(self) -> tuple:
+        columns = self._last.count("COUNT(*)") + self._last.count("venom_q")
+        return (3,) * columns if columns else (3, 4)
+
+
+def _adapters() -> list:
+    queries = {"pair": "SELECT 1, 2", "bad": "SELECT * FROM no_such_table", "good": "SELECT 3"}
+    postgres = PostgresAdapter("postgresql://unused", ["users"], dict(queries))
+    postgres._conn = _FakeConnection("no_such_table", aborting=True)
+    mysql = MySQLAdapter(observe_tables=["users"], observe_queries=dict(queries))
+    mysql._conn = _FakeConnection("no_such_table")
+    return [postgres, mysql]
+
+
+class TestObserveFallback:
+    @pytest.mark.parametrize("adapter", _adapters(), ids=["postgres", "mysql"])
+    def test_unbatchable_queries_run_on_their_own(self, adapter):
+        data = adapter.observe().data
+        assert data == {
+            "users_count": 3,
+            "pair": 3,  # first column, as fetchone()[0]
+            "bad": "ERROR: relation does not exist",
+            "good": 3,
+        }
+        assert not adapter._conn.aborted
+
+    @pytest.mark.parametrize("adapter", _adapters(), ids=["postgres", "mysql"])
+    def test_unbatchable_queries_are_found_once(self, adapter):
+        adapter.observe()
+        conn = adapter._conn
+        conn.executed.clear()
+        adapter.observe()
+        # One batch, then the two set-aside queries
+        assert len(conn.executed) == 3
+        assert list(adapter.observe().data) == ["users_count", "pair", "bad", "good"]
+
+    def test_postgres_table_counts_alone_skip_the_savepoint(self):
+        adapter = PostgresAdapter("postgresql://unused", observe_tables=["users", "orders"])
+        adapter._conn = _FakeConnection("never")
+        assert adapter.observe().data == {"users_count": 3, "orders_count": 3}
+        assert adapter._conn.savepoints == 0
+        assert len(adapter._conn.executed) == 1
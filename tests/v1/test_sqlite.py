@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 import pytest
 from venomqa.adapters.sqlite import SQLiteAdapter
 
@@ -57,6 +59,28 @@ class TestSQLiteAdapterObserve:
         obs = adapter.observe()
         assert obs.system == "db"
 
+    def test_observe_uses_one_statement(self, adapter):
+        adapter._conn.execute("CREATE TABLE tags (id INTEGER PRIMARY KEY)")
+        adapter._conn.execute("INSERT INTO tags DEFAULT VALUES")
+        adapter.observe_tables.append("tags")
+        statements: list[str] = []
+        adapter._conn.set_trace_callback(statements.append)
+        obs = adapter.observe()
+        assert obs.data == {"items_count": 0, "tags_count": 1}
+        assert len(statements) == 1
+
+    def test_observe_statement_cached(self, adapter):
+        first = adapter._observe_statement()
+        assert adapter._observe_statement() is first
+        adapter.observe_tables.append("other")
+        assert adapter._observe_statement() is not first
+
+    def test_observe_records_latency(self, adapter):
+        obs = adapter.observe()
+        adapter.observe()
+        assert adapter.observe_stats.calls == 2
+        assert obs.metadata["observe_ms"] >= 0
+
 
 class TestSQLiteAdapterCheckpointRollback:
     def test_checkpoint_returns_id(self, adapter):
@@ -98,6 +122,15 @@ class TestSQLiteAdapterCheckpointRollback:
         with pytest.raises(Exception):
             adapter.rollback("invalid_checkpoint_that_does_not_exist")
 
+    def test_release_deletes_checkpoint_file(self, adapter):
+        from pathlib import Path
+
+        cp = adapter.checkpoint("released")
+        assert adapter.checkpoint_size(cp) > 0
+        adapter.release(cp)
+        assert not Path(cp).exists()
+        assert adapter.checkpoint_size(cp) == 0
+
 
 class TestSQLiteAdapterExecute:
     def test_execute_query(self, adapter):
@@ -111,3 +144,94 @@ class TestSQLiteAdapterExecute:
         adapter._conn.commit()
         rows = adapter.execute("SELECT name FROM items WHERE name = ?", ("test",))
         assert len(rows) == 1
+
+
+class TestSQLiteAdapterPageSnapshots:
+    @pytest.fixture(params=["memory", "file"])
+    def paged(self, request, tmp_path):
+        path = ":memory:" if request.param == "memory" else str(tmp_path / "app.db")
+        a = SQLiteAdapter(path, observe_tables=["items"], snapshot_mode="pages")
+        a.connect()
+        a._conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        a._conn.commit()
+        yield a
+        a.close()
+        a.cleanup()
+
+    def _insert(self, adapter, count):
+        adapter._conn.executemany(
+            "INSERT INTO items (name) VALUES (?)", [("x" * 500,)] * count
+        )
+        adapter._conn.commit()
+
+    def test_invalid_mode_raises(self):
+        with pytest.raises(ValueError, match="snapshot_mode"):
+            SQLiteAdapter(":memory:", snapshot_mode="copy")
+
+    def test_non_lifo_rollback(self, paged):
+        cp0 = paged.checkpoint("empty")
+        self._insert(paged, 1)
+        cp1 = paged.checkpoint("one")
+        self._insert(paged, 50)
+        cp2 = paged.checkpoint("many")
+
+        paged.rollback(cp0)
+        assert paged.observe().data["items_count"] == 0
+        paged.rollback(cp2)
+        assert paged.observe().data["items_count"] == 51
+        paged.rollback(cp1)
+        assert paged.observe().data["items_count"] == 1
+
+    def test_unchanged_pages_are_shared(self, paged):
+        self._insert(paged, 200)
+        full = paged.checkpoint("base")
+        self._insert(paged, 1)
+        step = paged.checkpoint("step")
+        assert paged.checkpoint_size(step) < paged.checkpoint_size(full)
+
+    def test_sees_writes_from_other_connections(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        adapter = SQLiteAdapter(path, observe_tables=["items"], snapshot_mode="pages")
+        adapter.connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        adapter.connection.commit()
+        cp = adapter.checkpoint("empty")
+
+        other = sqlite3.connect(path)
+        other.execute("INSERT INTO items DEFAULT VALUES")
+        other.commit()
+        other.close()
+        after = adapter.checkpoint("one")
+
+        adapter.rollback(cp)
+        assert adapter.observe().data["items_count"] == 0
+        adapter.rollback(after)
+        assert adapter.observe().data["items_count"] == 1
+        adapter.close()
+        adapter.cleanup()
+
+    def test_budget_evicts_least_recently_used(self):
+        a = SQLiteAdapter(
+            ":memory:", observe_tables=["items"],
+            snapshot_mode="pages", snapshot_budget_bytes=64 * 1024,
+        )
+        a.connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        checkpoints = []
+        for _ in range(10):
+            self._insert(a, 40)
+            checkpoints.append(a.checkpoint("step"))
+
+        assert a.evicted_snapshots > 0
+        assert a.snapshot_bytes <= 64 * 1024 or len(a._page_snapshots) == 1
+        assert not a.has_checkpoint(checkpoints[0])
+        assert a.has_checkpoint(checkpoints[-1])
+        with pytest.raises(ValueError, match="evicted"):
+            a.rollback(checkpoints[0])
+        a.close()
+
+    def test_release_frees_pages(self, paged):
+        self._insert(paged, 100)
+        cp = paged.checkpoint("a")
+        held = paged.snapshot_bytes
+        paged.release(cp)
+        assert paged.snapshot_bytes < held
+        assert not paged.has_checkpoint(cp)
@@ -96,6 +96,34 @@ class TestWorldCheckpointRollback:
         world.rollback(state.checkpoint_id)
         assert world.context.get("key") == "original"
 
+    def test_rollback_undoes_in_place_mutation(self):
+        api = MagicMock()
+        world = World(api=api, state_from_context=[])
+
+        ids = [1, 2]
+        world.context.set("ids", ids)
+        state = world.observe_and_checkpoint("cp")
+        ids.append(3)  # mutating a held reference must not touch the checkpoint
+        world.context.get("ids").append(4)
+        assert world.context.get("ids") == [1, 2, 3, 4]
+
+        world.rollback(state.checkpoint_id)
+        world.context.get("ids").append(5)
+        world.rollback(state.checkpoint_id)
+        assert world.context.get("ids") == [1, 2]
+
+    def test_unchanged_context_checkpoint_is_shared(self):
+        api = MagicMock()
+        world = World(api=api, state_from_context=[])
+        world.context.set("payload", {"items": list(range(100))})
+
+        first = world.context.checkpoint()
+        world.context.restore(first)
+        assert world.context.checkpoint() is first
+        assert world.context.view()["payload"] is first["payload"]
+        world.context.get("payload")["items"].clear()
+        assert first["payload"]["items"] == list(range(100))
+
     def test_has_checkpoint(self):
         api = MagicMock()
         world = World(api=api, state_from_context=[])
@@ -104,6 +132,17 @@ class TestWorldCheckpointRollback:
         state = world.observe_and_checkpoint("cp")
         assert world.has_checkpoint(state.checkpoint_id)
 
+    def test_has_checkpoint_false_when_system_dropped_it(self):
+        api = MagicMock()
+        system = _make_mock_system()
+        world = World(api=api, systems={"db": system}, state_from_context=[])
+        state = world.observe_and_checkpoint("cp")
+
+        system.has_checkpoint.return_value = False
+        assert not world.has_checkpoint(state.checkpoint_id)
+        system.release.assert_called_once_with("cp_1")
+        assert world.get_checkpoint(state.checkpoint_id) is None
+
 
 class TestWorldAct:
     def test_act_simple_action(self):
@@ -69,6 +69,27 @@ class TestWorldResourceGraphIntegration:
         world = World(api=MockHttpClient())
         assert world.resources is None
 
+    def test_resources_lookup_follows_registered_systems(self, schema):
+        """World.resources notices systems registered after the first lookup."""
+        world = World(api=MockHttpClient())
+        assert world.resources is None
+        graph = ResourceGraph(schema=schema)
+        world.register_system("resources", graph)
+        assert world.resources is graph
+        replacement = ResourceGraph(schema=schema)
+        world.register_system("resources", replacement)
+        assert world.resources is replacement
+
+    def test_resources_lookup_follows_in_place_replacement(self, world, schema):
+        """Assigning into world.systems directly is noticed too."""
+        assert world.resources is world.systems["resources"]
+        replacement = ResourceGraph(schema=schema)
+        world.systems["resources"] = replacement
+        assert world.resources is replacement
+        del world.systems["resources"]
+        world.systems["graph"] = graph = ResourceGraph(schema=schema)
+        assert world.resources is graph
+
     def test_resource_exists(self, world):
         """World.resource_exists delegates to ResourceGraph."""
         assert world.resource_exists("workspace", "ws_123") is False